@@ -71,6 +71,14 @@ if __name__ == '__main__':
     members = org.members.filter(member_table.c.name.like('%member t%')).all()
     print members
 
+    # the full collection can be iterated in fixed-size windows,
+    # each loaded by a separate SELECT which picks up after the
+    # last row of the previous window.  expunge=True removes each
+    # window from the session once the next one is requested.
+    print "-------------------------\niterate members in windows\n"
+    for window in org.members.windows(2, expunge=True):
+        print [m.name for m in window]
+
     # new Members can be appended without any
     # SQL being emitted to load the full collection
     org.members.append(Member('member four'))
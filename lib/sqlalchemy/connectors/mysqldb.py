@@ -19,7 +19,7 @@ class MySQLDBExecutionContext(Connector):
 
     @property
     def rowcount(self):
-        if hasattr(self, '_rowcount'):
+        if self._rowcount is not None:
             return self._rowcount
         else:
             return self.cursor.rowcount
@@ -57,6 +57,11 @@ class MySQLDBConnector(Connector):
         return __import__('MySQLdb')
 
     def do_executemany(self, cursor, statement, parameters, context=None):
+        if context is not None and context.isinsert and \
+                context._multivalues_page_size:
+            self._do_multivalues_executemany(
+                            cursor, statement, parameters, context)
+            return
         rowcount = cursor.executemany(statement, parameters)
         if context is not None:
             context._rowcount = rowcount
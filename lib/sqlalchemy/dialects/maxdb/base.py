@@ -464,7 +464,7 @@ class MaxDBExecutionContext(default.DefaultExecutionContext):
 
     @property
     def rowcount(self):
-        if hasattr(self, '_rowcount'):
+        if self._rowcount is not None:
             return self._rowcount
         else:
             return self.cursor.rowcount
@@ -572,6 +572,10 @@ class SQLiteExecutionContext(default.DefaultExecutionContext):
     def _preserve_raw_colnames(self):
         return self.execution_options.get("sqlite_raw_colnames", False)
 
+    @property
+    def _metadata_cache_key(self):
+        return (self._preserve_raw_colnames, )
+
     def _translate_colname(self, colname):
         # adjust for dotted column names.  SQLite
         # in the case of UNION may store col names as
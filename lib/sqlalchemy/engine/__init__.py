@@ -74,7 +74,10 @@ from .result import (
     BufferedColumnResultProxy,
     BufferedColumnRow,
     BufferedRowResultProxy,
+    CachedResultProxy,
     FullyBufferedResultProxy,
+    LRUResultCache,
+    ResultCache,
     ResultProxy,
     RowProxy,
     )
@@ -240,6 +243,15 @@ def create_engine(*args, **kwargs):
         "_(counter)". If ``None``, the value of
         ``dialect.max_identifier_length`` is used instead.
 
+    :param multivalues_page_size=None: when set to an integer, an
+        "executemany" of a single-row INSERT construct is emitted as
+        multiple-row INSERT statements of at most this many rows
+        each, for dialects which support them.  See the
+        ``multivalues_page_size`` option of
+        :meth:`.Connection.execution_options`.
+
+        .. versionadded:: 0.8.1
+
     :param listeners: A list of one or more
         :class:`~sqlalchemy.interfaces.PoolListener` objects which will
         receive connection pool events.
@@ -15,6 +15,7 @@ from .. import exc, schema, util, log, interfaces
 from ..sql import expression, util as sql_util
 from .interfaces import Connectable, Compiled
 from .util import _distill_params
+from .result import CachedResultProxy
 import contextlib
 
 
@@ -144,6 +145,16 @@ class Connection(Connectable):
           calling stored procedures and such), and an explicit
           transaction is not in progress.
 
+        :param cache_key: Available on: statement.
+          The key under which the result of the statement is stored
+          when the ``result_cache`` option is in use.  When not
+          specified, the key is made up of the database URL (less the
+          password), the string SQL statement and its bound
+          parameters; statements with parameters that can't be hashed
+          aren't cached.
+
+          .. versionadded:: 0.8.1
+
         :param compiled_cache: Available on: Connection.
           A dictionary where :class:`.Compiled` objects
           will be cached when the :class:`.Connection` compiles a clause
@@ -177,6 +188,21 @@ class Connection(Connectable):
           is returned to the connection pool, i.e.
           the :meth:`.Connection.close` method is called.
 
+        :param multivalues_page_size: Available on: Connection, statement.
+          When set to an integer, an "executemany" of a single-row
+          :func:`.insert` construct is emitted as a series of
+          multiple-row ``INSERT .. VALUES (..), (..), ..`` statements,
+          each covering up to this many parameter sets, for those
+          dialects which support multiple-row inserts.  This is usually
+          much faster than ``cursor.executemany()`` with DBAPIs such as
+          psycopg2, which implement ``executemany()`` as a series of
+          individual statements.  Statements whose VALUES clause
+          contains SQL expressions, or which use RETURNING, continue to
+          use ``cursor.executemany()``.  Overrides the
+          ``multivalues_page_size`` argument to :func:`.create_engine`.
+
+          .. versionadded:: 0.8.1
+
         :param no_parameters: When ``True``, if the final parameter
           list or dictionary is totally empty, will invoke the
           statement on the cursor as ``cursor.execute(statement)``,
@@ -191,6 +217,23 @@ class Connection(Connectable):
 
           .. versionadded:: 0.7.6
 
+        :param result_cache: Available on: Connection, statement.
+          A :class:`.ResultCache` in which the rows returned by a
+          statement are stored, such as the in-memory
+          :class:`.LRUResultCache`.  When a result is present
+          for the statement's key, it is delivered without the
+          statement being invoked on the database; otherwise the
+          statement is invoked and its rows are fully fetched and
+          stored.  Rows are stored with result processing applied.
+          The cache is never invalidated by SQLAlchemy itself; it is
+          the user's responsibility to choose keys and expiration
+          times appropriately.  INSERT, UPDATE and DELETE statements,
+          including those with RETURNING, as well as other statements
+          which autocommit, are always invoked.  See also
+          ``cache_key``.
+
+          .. versionadded:: 0.8.1
+
         :param stream_results: Available on: Connection, statement.
           Indicate to the dialect that results should be
           "streamed" and not pre-buffered, if possible.  This is a limitation
@@ -198,6 +241,15 @@ class Connection(Connectable):
           psycopg2 dialect.
 
         """
+        if 'cache_key' in opt:
+            raise exc.ArgumentError(
+                "'cache_key' execution option may only be specified "
+                "on a statement.")
+        if opt.get('multivalues_page_size') is not None and \
+                opt['multivalues_page_size'] < 1:
+            raise exc.ArgumentError(
+                "'multivalues_page_size' execution option must be "
+                "a positive integer or None.")
         c = self._clone()
         c._execution_options = c._execution_options.union(opt)
         if 'isolation_level' in opt:
@@ -827,6 +879,34 @@ class Connection(Connectable):
                         str(statement), parameters,
                         None, None)
 
+        result_cache = context._result_cache
+        if result_cache is not None:
+            # the result may be delivered from the cache without a
+            # cursor being created; statements which modify data
+            # are always invoked.
+            if context.executemany or context.isinsert or \
+                    context.isupdate or context.isdelete or \
+                    context.should_autocommit:
+                cache_key = None
+            else:
+                cache_key = self._result_cache_key(context,
+                                    context.statement, context.parameters[0])
+            if cache_key is None:
+                result_cache = None
+            else:
+                cached = result_cache.get(cache_key)
+                if cached is not None:
+                    if self._echo:
+                        self.engine.logger.info("[cached] %s",
+                                                    context.statement)
+                    return CachedResultProxy(context, cached)
+            try:
+                context.cursor = context.create_cursor()
+            except Exception, e:
+                self._handle_dbapi_exception(e,
+                            str(statement), parameters,
+                            None, None)
+
         if context.compiled:
             context.pre_exec()
 
@@ -910,8 +990,35 @@ class Connection(Connectable):
         if result.closed and self.should_close_with_result:
             self.close()
 
+        if result_cache is not None and result._metadata is not None:
+            cached = result._frozen()
+            result_cache.set(cache_key, cached)
+            result = CachedResultProxy(context, cached)
+
         return result
 
+    def _result_cache_key(self, context, statement, parameters):
+        """Return the key under which the result of a statement is
+        stored when the ``result_cache`` execution option is used,
+        or ``None`` if the statement's parameters can't be hashed."""
+
+        key = context.execution_options.get('cache_key')
+        if key is not None:
+            return key
+        if isinstance(parameters, dict):
+            parameters = tuple(sorted(parameters.iteritems()))
+        else:
+            parameters = tuple(parameters)
+        url = self.engine.url
+        key = (url.drivername, url.username, url.host, url.port,
+                        url.database), statement, parameters
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        else:
+            return key
+
     def _cursor_execute(self, cursor, statement, parameters, context=None):
         """Execute a statement + params on the given cursor.
 
@@ -1347,6 +1454,15 @@ class Engine(Connectable, log.Identified):
                 "To set engine-wide isolation level, "
                 "use the isolation_level argument to create_engine()."
             )
+        if 'cache_key' in opt:
+            raise exc.ArgumentError(
+                "'cache_key' execution option may only be specified "
+                "on a statement.")
+        if opt.get('multivalues_page_size') is not None and \
+                opt['multivalues_page_size'] < 1:
+            raise exc.ArgumentError(
+                "'multivalues_page_size' execution option must be "
+                "a positive integer or None.")
         self._execution_options = \
                 self._execution_options.union(opt)
 
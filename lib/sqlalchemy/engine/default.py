@@ -91,6 +91,15 @@ class DefaultDialect(interfaces.Dialect):
     supports_empty_insert = True
     supports_multivalues_insert = False
 
+    # when set, an executemany() of a single-row INSERT
+    # is emitted as multiple-row INSERT statements of at most
+    # this many rows each, for dialects that support them.
+    multivalues_page_size = None
+
+    # number of compiled text() constructs to retain, keyed
+    # on their SQL string
+    text_template_cache_size = 100
+
     server_version_info = None
 
     # indicates symbol names are
@@ -106,7 +115,8 @@ class DefaultDialect(interfaces.Dialect):
                  encoding='utf-8', paramstyle=None, dbapi=None,
                  implicit_returning=None,
                  case_sensitive=True,
-                 label_length=None, **kwargs):
+                 label_length=None,
+                 multivalues_page_size=None, **kwargs):
 
         if not getattr(self, 'ported_sqla_06', True):
             util.warn(
@@ -139,6 +149,15 @@ class DefaultDialect(interfaces.Dialect):
                     (label_length, self.max_identifier_length))
         self.label_length = label_length
 
+        if multivalues_page_size is not None:
+            if multivalues_page_size < 1:
+                raise exc.ArgumentError(
+                        "multivalues_page_size must be a positive "
+                        "integer or None.")
+            self.multivalues_page_size = multivalues_page_size
+
+        self._text_templates = util.LRUCache(self.text_template_cache_size)
+
         if self.description_encoding == 'use_encoding':
             self._description_decoder = \
                             processors.to_unicode_processor_factory(
@@ -165,6 +184,10 @@ class DefaultDialect(interfaces.Dialect):
         return getattr(cls, 'poolclass', pool.QueuePool)
 
     def initialize(self, connection):
+        # text() constructs compiled before the dialect was
+        # initialized may no longer be valid
+        self._text_templates.clear()
+
         try:
             self.server_version_info = \
                             self._get_server_version_info(connection)
@@ -318,7 +341,69 @@ class DefaultDialect(interfaces.Dialect):
         connection.execute(expression.ReleaseSavepointClause(name))
 
     def do_executemany(self, cursor, statement, parameters, context=None):
-        cursor.executemany(statement, parameters)
+        if context is not None and context.isinsert and \
+                context._multivalues_page_size:
+            self._do_multivalues_executemany(
+                            cursor, statement, parameters, context)
+        else:
+            cursor.executemany(statement, parameters)
+
+    def _do_multivalues_executemany(self, cursor, statement,
+                                            parameters, context):
+        """Emit an executemany() of a single-row INSERT as a series
+        of multiple-row INSERT statements, each covering
+        up to ``multivalues_page_size`` parameter sets."""
+
+        compiled = context.compiled
+        page_size = context._multivalues_page_size
+        values_clause = compiled._insert_values_clause
+        encode = not self.supports_unicode_statements
+
+        # event handlers may have altered the statement; if so
+        # it is passed along unchanged.
+        if statement is not context.statement or \
+                not context.unicode_statement.endswith(values_clause):
+            cursor.executemany(statement, parameters)
+            return
+
+        prefix = context.unicode_statement[:-len(values_clause)]
+        bindtemplate = compiled.bindtemplate
+        names = compiled._insert_values_names
+        rowcount = 0
+
+        for start in xrange(0, len(parameters), page_size):
+            page = parameters[start:start + page_size]
+            if self.positional:
+                stmt = prefix + ", ".join([values_clause] * len(page))
+                params = []
+                for param in page:
+                    params.extend(param)
+                params = self.execute_sequence_format(params)
+            else:
+                clauses = []
+                params = {}
+                for index, param in enumerate(page):
+                    renamed = [(name, "%s_m%d" % (name, index))
+                                    for name in names]
+                    clauses.append("(%s)" % ", ".join(
+                                [bindtemplate % {'name': newname}
+                                    for name, newname in renamed]))
+                    if encode:
+                        for name, newname in renamed:
+                            params[self._encoder(newname)[0]] = \
+                                        param[self._encoder(name)[0]]
+                    else:
+                        for name, newname in renamed:
+                            params[newname] = param[name]
+                stmt = prefix + ", ".join(clauses)
+            if encode:
+                stmt = self._encoder(stmt)[0]
+            cursor.execute(stmt, params)
+            if rowcount is not None and cursor.rowcount >= 0:
+                rowcount += cursor.rowcount
+            else:
+                rowcount = None
+        context._rowcount = rowcount
 
     def do_execute(self, cursor, statement, parameters, context=None):
         cursor.execute(statement, parameters)
@@ -349,11 +434,22 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
     prefetch_cols = None
     _is_implicit_returning = False
     _is_explicit_returning = False
+    _rowcount = None
+
+    # the ResultCache given by the ``result_cache`` execution
+    # option; when set, the cursor is created by the Connection
+    # only if the result isn't delivered from the cache
+    _result_cache = None
 
     # a hook for SQLite's translation of
     # result column names
     _translate_colname = None
 
+    # additional state which affects how result columns
+    # are interpreted for this execution; part of the key
+    # used to cache ResultMetaData on the Compiled.
+    _metadata_cache_key = ()
+
     @classmethod
     def _init_ddl(cls, dialect, connection, dbapi_connection, compiled_ddl):
         """Initialize execution context for a DDLElement construct."""
@@ -439,50 +535,153 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
 
             self.executemany = len(parameters) > 1
 
-        self.cursor = self.create_cursor()
+        if 'result_cache' in self.execution_options:
+            self._result_cache = self.execution_options['result_cache']
+            self.cursor = None
+        else:
+            self.cursor = self.create_cursor()
         if self.isinsert or self.isupdate:
             self.postfetch_cols = self.compiled.postfetch
             self.prefetch_cols = self.compiled.prefetch
             self.__process_defaults()
 
-        processors = compiled._bind_processors
-
         # Convert the dictionary of bind parameter values
         # into a dict or list to be sent to the DBAPI's
-        # execute() or executemany() method.
-        parameters = []
+        # execute() or executemany() method.  Values are
+        # first copied for all parameter sets, then each bind
+        # processor is applied down its column, so that the work per
+        # row doesn't include looking up processors for each key.
+        compiled_parameters = self.compiled_parameters
+        if compiled._expanding_binds:
+            positiontup, bind_processors = self._expand_in_parameters(compiled)
+            if dialect.positional:
+                positional_processors = [
+                        (index, bind_processors[key])
+                        for index, key in enumerate(positiontup)
+                        if key in bind_processors
+                    ]
+        else:
+            bind_processors = compiled._bind_processors
+            if dialect.positional:
+                positiontup = compiled.positiontup
+                positional_processors = compiled._positional_bind_processors
+
         if dialect.positional:
-            for compiled_params in self.compiled_parameters:
-                param = []
-                for key in self.compiled.positiontup:
-                    if key in processors:
-                        param.append(processors[key](compiled_params[key]))
-                    else:
-                        param.append(compiled_params[key])
-                parameters.append(dialect.execute_sequence_format(param))
+            parameters = [
+                    [compiled_params[key] for key in positiontup]
+                    for compiled_params in compiled_parameters
+                ]
+            for index, processor in positional_processors:
+                for param in parameters:
+                    param[index] = processor(param[index])
+            execute_sequence_format = dialect.execute_sequence_format
+            parameters = [execute_sequence_format(param)
+                            for param in parameters]
         else:
-            encode = not dialect.supports_unicode_statements
-            for compiled_params in self.compiled_parameters:
-                param = {}
-                if encode:
-                    for key in compiled_params:
-                        if key in processors:
-                            param[dialect._encoder(key)[0]] = \
-                                        processors[key](compiled_params[key])
-                        else:
-                            param[dialect._encoder(key)[0]] = \
-                                    compiled_params[key]
-                else:
-                    for key in compiled_params:
-                        if key in processors:
-                            param[key] = processors[key](compiled_params[key])
-                        else:
-                            param[key] = compiled_params[key]
-                parameters.append(param)
+            parameters = [dict(compiled_params)
+                            for compiled_params in compiled_parameters]
+            for key, processor in bind_processors.iteritems():
+                for param in parameters:
+                    param[key] = processor(param[key])
+            if not dialect.supports_unicode_statements:
+                encoder = dialect._encoder
+                keys = [(key, encoder(key)[0])
+                            for key in compiled_parameters[0]]
+                parameters = [
+                        dict([(encoded, param[key])
+                                for key, encoded in keys])
+                        for param in parameters
+                    ]
         self.parameters = dialect.execute_sequence_format(parameters)
 
         return self
 
+    def _expand_in_parameters(self, compiled):
+        """Replace each "expanding" bound parameter in the statement
+        and in the compiled parameters with one bound parameter per
+        element of its sequence value.
+
+        Returns the positional names to be used for this execution
+        and a dictionary of bind processors keyed to the expanded names.
+
+        """
+        if self.executemany:
+            raise exc.InvalidRequestError(
+                        "'expanding' parameters can't be used with "
+                        "executemany()")
+
+        compiled_params = self.compiled_parameters[0]
+        bind_processors = dict(compiled._bind_processors)
+        bindtemplate = compiled.bindtemplate
+        statement = self.unicode_statement
+        expanded_names = {}
+
+        for name in compiled._expanding_binds:
+            values = compiled_params.pop(name)
+            processor = bind_processors.pop(name, None)
+            if not values:
+                # an empty sequence renders "IN (NULL)", which
+                # like the empty IN() contradiction matches no rows
+                new_names = []
+                replacement = "NULL"
+            else:
+                new_names = []
+                for index, value in enumerate(values):
+                    # the "__" separator keeps clear of the "_<n>"
+                    # suffix of anonymous bind names; any name still
+                    # present in the statement is skipped as well
+                    new_name = "%s__%d" % (name, index + 1)
+                    while new_name in compiled_params:
+                        new_name += "_"
+                    new_names.append(new_name)
+                    compiled_params[new_name] = value
+                    if processor is not None:
+                        bind_processors[new_name] = processor
+                replacement = ", ".join([bindtemplate % {'name': new_name}
+                                        for new_name in new_names])
+            expanded_names[name] = new_names
+            statement = statement.replace("[EXPANDING_%s]" % name,
+                                            replacement)
+
+        self.unicode_statement = statement
+        if not self.dialect.supports_unicode_statements:
+            self.statement = statement.encode(self.dialect.encoding)
+        else:
+            self.statement = statement
+
+        if compiled.positional:
+            positiontup = []
+            for name in compiled.positiontup:
+                if name in expanded_names:
+                    positiontup.extend(expanded_names[name])
+                else:
+                    positiontup.append(name)
+        else:
+            positiontup = None
+        return positiontup, bind_processors
+
+    @classmethod
+    def _init_cached(cls, dialect, engine, compiled, execution_options):
+        """Initialize execution context for a Compiled construct whose
+        rows are delivered by a CachedResultProxy, without a connection
+        or execution."""
+
+        self = cls.__new__(cls)
+        self.dialect = dialect
+        self.root_connection = None
+        self._dbapi_connection = None
+        self.engine = engine
+
+        self.compiled = compiled
+        self.execution_options = compiled.statement._execution_options
+        if execution_options:
+            self.execution_options = dict(self.execution_options)
+            self.execution_options.update(execution_options)
+
+        self.result_map = compiled.result_map
+        self.cursor = None
+        return self
+
     @classmethod
     def _init_statement(cls, dialect, connection, dbapi_connection,
                                                     statement, parameters):
@@ -525,7 +724,11 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
         else:
             self.statement = self.unicode_statement = statement
 
-        self.cursor = self.create_cursor()
+        if 'result_cache' in self.execution_options:
+            self._result_cache = self.execution_options['result_cache']
+            self.cursor = None
+        else:
+            self.cursor = self.create_cursor()
         return self
 
     @classmethod
@@ -541,6 +744,14 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
         self.cursor = self.create_cursor()
         return self
 
+    @util.memoized_property
+    def _multivalues_page_size(self):
+        page_size = self.execution_options.get('multivalues_page_size',
+                                    self.dialect.multivalues_page_size)
+        if not page_size or self.compiled._insert_values_clause is None:
+            return None
+        return page_size
+
     @util.memoized_property
     def no_parameters(self):
         return self.execution_options.get("no_parameters", False)
@@ -656,6 +867,8 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
 
     @property
     def rowcount(self):
+        if self._rowcount is not None:
+            return self._rowcount
         return self.cursor.rowcount
 
     def supports_sane_rowcount(self):
@@ -761,6 +761,11 @@ class Compiled(object):
     defaults.
     """
 
+    # the ResultMetaData most recently constructed for this
+    # Compiled, along with the cursor.description it was
+    # constructed against
+    _cached_metadata = None
+
     def __init__(self, dialect, statement, bind=None,
                 compile_kwargs=util.immutabledict()):
         """Construct a new ``Compiled`` object.
@@ -251,9 +251,10 @@ class ResultMetaData(object):
         # high precedence keymap.
         keymap.update(primary_keymap)
 
-        if parent._echo:
-            context.engine.logger.debug(
-                "Col %r", tuple(x[0] for x in metadata))
+    def _copy(self):
+        md = self.__class__.__new__(self.__class__)
+        md.__dict__.update(self.__dict__)
+        return md
 
     @util.pending_deprecation("0.8", "sqlite dialect uses "
                     "_translate_colname() now")
@@ -388,7 +389,27 @@ class ResultProxy(object):
     def _init_metadata(self):
         metadata = self._cursor_description()
         if metadata is not None:
-            self._metadata = ResultMetaData(self, metadata)
+            context = self.context
+            compiled = context.compiled
+            if compiled is not None:
+                # a ResultMetaData built by a previous execution of
+                # the same Compiled against the same cursor.description
+                # is reused, rather than building a new keymap.
+                cache_key = (
+                        tuple([(rec[0], rec[1]) for rec in metadata]),
+                        context._metadata_cache_key)
+                cached = compiled._cached_metadata
+                if cached is not None and cached[0] == cache_key:
+                    self._metadata = cached[1]
+                else:
+                    self._metadata = ResultMetaData(self, metadata)
+                    compiled._cached_metadata = (cache_key, self._metadata)
+            else:
+                self._metadata = ResultMetaData(self, metadata)
+
+            if self._echo:
+                context.engine.logger.debug(
+                    "Col %r", tuple(x[0] for x in metadata))
 
     def keys(self):
         """Return the current set of string keys for rows."""
@@ -498,6 +519,14 @@ class ResultProxy(object):
 
         return self._saved_cursor.description
 
+    def _frozen(self):
+        """Fetch all remaining rows, returning them along with the
+        cursor description in the form stored by a :class:`.ResultCache`.
+
+        """
+        description = [rec[0:2] for rec in self._cursor_description()]
+        return description, [tuple(row) for row in self.fetchall()]
+
     def close(self, _autoclose_connection=True):
         """Close this ResultProxy.
 
@@ -961,7 +990,9 @@ class BufferedColumnResultProxy(ResultProxy):
 
     def _init_metadata(self):
         super(BufferedColumnResultProxy, self)._init_metadata()
-        metadata = self._metadata
+        # the metadata may be shared with other results of
+        # the same Compiled, so work on a copy of it.
+        metadata = self._metadata = self._metadata._copy()
         # orig_processors will be used to preprocess each row when they are
         # constructed.
         metadata._orig_processors = metadata._processors
@@ -995,3 +1026,125 @@ class BufferedColumnResultProxy(ResultProxy):
                 break
             l.append(row)
         return l
+
+
+class CachedResultProxy(FullyBufferedResultProxy):
+    """A result proxy which delivers rows retrieved from a
+    :class:`.ResultCache`.
+
+    The rows are stored with result processing already applied,
+    so are delivered as is; the DBAPI cursor is not used.
+
+    """
+
+    def __init__(self, context, cached):
+        self._cached_description, self._cached_rows = cached
+        self.context = context
+        self.dialect = context.dialect
+        self.closed = False
+        self.cursor = self._saved_cursor = None
+        # there's no Connection for a result which isn't
+        # associated with an execution; see _from_statement()
+        self.connection = connection = context.root_connection
+        self._echo = connection is not None and connection._echo and \
+                        context.engine._should_log_debug()
+        self._init_metadata()
+
+    @classmethod
+    def _from_statement(cls, bind, statement, execution_options, cached):
+        """Return a CachedResultProxy delivering the given rows of
+        ``statement``, without executing it or using a connection."""
+
+        dialect = bind.dialect
+        context = dialect.execution_ctx_cls._init_cached(
+                                dialect, bind.engine,
+                                statement.compile(dialect=dialect),
+                                execution_options)
+        return cls(context, cached)
+
+    def _cursor_description(self):
+        return self._cached_description
+
+    def _init_metadata(self):
+        super(CachedResultProxy, self)._init_metadata()
+        # the metadata may be shared with other results of
+        # the same Compiled, so work on a copy of it.
+        metadata = self._metadata = self._metadata._copy()
+        metadata._processors = [None for _ in xrange(len(metadata.keys))]
+        keymap = {}
+        for k, (func, obj, index) in metadata._keymap.iteritems():
+            keymap[k] = (None, obj, index)
+        metadata._keymap = keymap
+
+    def _buffer_rows(self):
+        return collections.deque(self._cached_rows)
+
+    @property
+    def rowcount(self):
+        # no cursor is involved; as with most DBAPIs for
+        # a SELECT, the rowcount is undetermined
+        return -1
+
+    def close(self, _autoclose_connection=True):
+        if not self.closed:
+            self.closed = True
+            if _autoclose_connection and \
+                self.connection is not None and \
+                self.connection.should_close_with_result:
+                self.connection.close()
+
+
+class ResultCache(object):
+    """Interface for a backend used by the ``result_cache``
+    execution option.
+
+    The value stored for a key is a tuple of the column
+    description and the list of rows of a result; the rows are
+    tuples of the values returned by the result processors of each
+    column.  Backends which serialize these values, such as those
+    storing to memcached, therefore require that those values
+    can be pickled.
+
+    .. versionadded:: 0.8.1
+
+    """
+
+    def get(self, key):
+        """Return the value stored for the given key, or ``None``."""
+
+        raise NotImplementedError()
+
+    def set(self, key, value):
+        """Store a value for the given key."""
+
+        raise NotImplementedError()
+
+    def delete(self, key):
+        """Remove the value stored for the given key, if any."""
+
+        raise NotImplementedError()
+
+
+class LRUResultCache(ResultCache):
+    """A :class:`.ResultCache` which stores results in local memory,
+    discarding those least recently used once more than ``capacity``
+    results are stored.
+
+    .. versionadded:: 0.8.1
+
+    """
+
+    def __init__(self, capacity=100, threshold=.5):
+        self._cache = util.LRUCache(capacity, threshold)
+
+    def get(self, key):
+        try:
+            return self._cache[key]
+        except KeyError:
+            return None
+
+    def set(self, key, value):
+        self._cache[key] = value
+
+    def delete(self, key):
+        self._cache.pop(key, None)
@@ -16,10 +16,12 @@ New strategies can be added via new ``EngineStrategy`` classes.
 
 from operator import attrgetter
 
-from sqlalchemy.engine import base, threadlocal, url
+from sqlalchemy.engine import base, url
 from sqlalchemy import util, exc, event
 from sqlalchemy import pool as poollib
 
+threadlocal = util.importlater("sqlalchemy.engine", "threadlocal", lazy=True)
+
 strategies = {}
 
 
@@ -49,6 +51,10 @@ class DefaultEngineStrategy(EngineStrategy):
 
         dialect_cls = u.get_dialect()
 
+        # modules deferred from "import sqlalchemy" are imported
+        # here along with the dialect, rather than upon first use
+        util.importlater.resolve_lazy("sqlalchemy.engine")
+
         dialect_args = {}
         # consume dialect arguments from kwargs
         for k in util.get_cls_kwargs(dialect_cls):
@@ -183,7 +189,10 @@ class ThreadLocalEngineStrategy(DefaultEngineStrategy):
     """Strategy for configuring an Engine with threadlocal behavior."""
 
     name = 'threadlocal'
-    engine_cls = threadlocal.TLEngine
+
+    @property
+    def engine_cls(self):
+        return threadlocal.TLEngine
 
 ThreadLocalEngineStrategy()
 
@@ -245,6 +245,7 @@ class _DispatchDescriptor(object):
         self.__doc__ = fn.__doc__
         self._clslevel = weakref.WeakKeyDictionary()
         self._empty_listeners = weakref.WeakKeyDictionary()
+        self._collections = weakref.WeakKeyDictionary()
 
     def _contains(self, cls, evt):
         return cls in self._clslevel and \
@@ -263,6 +264,7 @@ class _DispatchDescriptor(object):
                 if cls not in self._clslevel:
                     self._clslevel[cls] = []
                 self._clslevel[cls].insert(0, obj)
+        self._recompile()
 
     def append(self, obj, target, propagate):
         assert isinstance(target, type), \
@@ -278,6 +280,7 @@ class _DispatchDescriptor(object):
                 if cls not in self._clslevel:
                     self._clslevel[cls] = []
                 self._clslevel[cls].append(obj)
+        self._recompile()
 
     def update_subclass(self, target):
         if target not in self._clslevel:
@@ -298,12 +301,25 @@ class _DispatchDescriptor(object):
             stack.extend(cls.__subclasses__())
             if cls in self._clslevel:
                 self._clslevel[cls].remove(obj)
+        self._recompile()
 
     def clear(self):
         """Clear all class level listeners"""
 
         for dispatcher in self._clslevel.values():
             dispatcher[:] = []
+        self._recompile()
+
+    def _register(self, collection):
+        """Register a listener collection which draws upon the
+        class level listeners here, so that it is recompiled
+        when they change."""
+
+        self._collections[collection] = True
+
+    def _recompile(self):
+        for collection in self._collections.keys():
+            collection._compile()
 
     def for_modify(self, obj):
         """Return an event collection which can be modified.
@@ -345,6 +361,8 @@ class _EmptyListener(object):
         self.name = parent.__name__
         self.propagate = frozenset()
         self.listeners = ()
+        self._compile()
+        parent._register(self)
 
     def for_modify(self, obj):
         """Return an event collection which can be modified.
@@ -365,20 +383,26 @@ class _EmptyListener(object):
 
     exec_once = insert = append = remove = clear = _needs_modify
 
+    def _all_listeners(self):
+        return tuple(self.parent_listeners)
+
+    def _compile(self):
+        self._compiled = self._all_listeners()
+
     def __call__(self, *args, **kw):
         """Execute this event."""
 
-        for fn in self.parent_listeners:
+        for fn in self._compiled:
             fn(*args, **kw)
 
     def __len__(self):
-        return len(self.parent_listeners)
+        return len(self._compiled)
 
     def __iter__(self):
-        return iter(self.parent_listeners)
+        return iter(self._compiled)
 
     def __nonzero__(self):
-        return bool(self.parent_listeners)
+        return bool(self._compiled)
 
 
 class _CompoundListener(object):
@@ -392,9 +416,10 @@ class _CompoundListener(object):
             self(*args, **kw)
             self._exec_once = True
 
-    # I'm not entirely thrilled about the overhead here,
-    # but this allows class-level listeners to be added
-    # at any point.
+    # the full list of listeners is compiled into a tuple up front,
+    # and recompiled whenever listeners are added or removed, either
+    # here or at the class level; the _DispatchDescriptor tracks
+    # which collections need to be recompiled.
     #
     # In the absense of instance-level listeners,
     # we stay with the _EmptyListener object when called
@@ -403,19 +428,17 @@ class _CompoundListener(object):
     def __call__(self, *args, **kw):
         """Execute this event."""
 
-        for fn in self.parent_listeners:
-            fn(*args, **kw)
-        for fn in self.listeners:
+        for fn in self._compiled:
             fn(*args, **kw)
 
     def __len__(self):
-        return len(self.parent_listeners) + len(self.listeners)
+        return len(self._compiled)
 
     def __iter__(self):
-        return chain(self.parent_listeners, self.listeners)
+        return iter(self._compiled)
 
     def __nonzero__(self):
-        return bool(self.listeners or self.parent_listeners)
+        return bool(self._compiled)
 
 
 class _ListenerCollection(_CompoundListener):
@@ -431,10 +454,19 @@ class _ListenerCollection(_CompoundListener):
     def __init__(self, parent, target_cls):
         if target_cls not in parent._clslevel:
             parent.update_subclass(target_cls)
+        self.parent = parent
         self.parent_listeners = parent._clslevel[target_cls]
         self.name = parent.__name__
         self.listeners = []
         self.propagate = set()
+        self._compile()
+        parent._register(self)
+
+    def _all_listeners(self):
+        return tuple(self.parent_listeners) + tuple(self.listeners)
+
+    def _compile(self):
+        self._compiled = self._all_listeners()
 
     def for_modify(self, obj):
         """Return an event collection which can be modified.
@@ -457,27 +489,32 @@ class _ListenerCollection(_CompoundListener):
                                 if l not in existing_listener_set
                                 and not only_propagate or l in self.propagate
                                 ])
+        self._compile()
 
     def insert(self, obj, target, propagate):
         if obj not in self.listeners:
             self.listeners.insert(0, obj)
             if propagate:
                 self.propagate.add(obj)
+            self._compile()
 
     def append(self, obj, target, propagate):
         if obj not in self.listeners:
             self.listeners.append(obj)
             if propagate:
                 self.propagate.add(obj)
+            self._compile()
 
     def remove(self, obj, target):
         if obj in self.listeners:
             self.listeners.remove(obj)
             self.propagate.discard(obj)
+            self._compile()
 
     def clear(self):
         self.listeners[:] = []
         self.propagate.clear()
+        self._compile()
 
 
 class _JoinedDispatcher(object):
@@ -520,6 +557,26 @@ class _JoinedListener(_CompoundListener):
         # each time. less performant.
         self.listeners = list(getattr(self.parent, self.name))
 
+    # a joined listener is typically short lived, i.e. per-Connection,
+    # so it isn't compiled; its local collection is compiled already.
+
+    def __call__(self, *args, **kw):
+        """Execute this event."""
+
+        for fn in self.local:
+            fn(*args, **kw)
+        for fn in self.listeners:
+            fn(*args, **kw)
+
+    def __len__(self):
+        return len(self.local) + len(self.listeners)
+
+    def __iter__(self):
+        return chain(self.local, self.listeners)
+
+    def __nonzero__(self):
+        return bool(self.listeners or self.local)
+
     def for_modify(self, obj):
         self.local = self.parent_listeners = self.local.for_modify(obj)
         return self
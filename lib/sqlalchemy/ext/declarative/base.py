@@ -6,7 +6,7 @@
 """Internal implementation for declarative."""
 
 from ...schema import Table, Column
-from ...orm import mapper, class_mapper
+from ...orm import mapper, class_mapper, instrumentation
 from ...orm.interfaces import MapperProperty
 from ...orm.properties import ColumnProperty, CompositeProperty
 from ...orm.util import _is_mapped_class
@@ -422,6 +422,14 @@ def _declarative_constructor(self, **kwargs):
             raise TypeError(
                 "%r is an invalid keyword argument for %s" %
                 (k, cls_.__name__))
+
+    # plain column attributes on a new object are populated
+    # directly, where no events are present to be fired
+    manager = instrumentation.manager_of_class(cls_)
+    if kwargs and manager is not None and manager.is_mapped:
+        kwargs = manager.mapper._populate_new(manager.state_getter()(self),
+                                            kwargs)
+    for k in kwargs:
         setattr(self, k, kwargs[k])
 _declarative_constructor.__name__ = '__init__'
 
@@ -109,7 +109,8 @@ def Serializer(*args, **kw):
     pickler.persistent_id = persistent_id
     return pickler
 
-our_ids = re.compile(r'(mapper|table|column|session|attribute|engine):(.*)')
+our_ids = re.compile(
+            r'(mapperprop|mapper|table|column|session|attribute|engine):(.*)')
 
 
 def Deserializer(file, metadata=None, scoped_session=None, engine=None):
@@ -141,7 +142,7 @@ def Deserializer(file, metadata=None, scoped_session=None, engine=None):
                 return class_mapper(cls)
             elif type_ == "mapperprop":
                 mapper, keyname = args.split(':')
-                cls = pickle.loads(b64decode(args))
+                cls = pickle.loads(b64decode(mapper))
                 return class_mapper(cls).attrs[keyname]
             elif type_ == "table":
                 return metadata.tables[args]
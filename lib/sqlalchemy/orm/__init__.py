@@ -60,6 +60,7 @@ from .session import (
 from .scoping import (
     scoped_session
 )
+from .identity import IdentityCache
 from . import mapper as mapperlib
 from . import strategies
 from .query import AliasOption, Query
@@ -79,6 +80,7 @@ from . import interfaces
 __all__ = (
     'EXT_CONTINUE',
     'EXT_STOP',
+    'IdentityCache',
     'MapperExtension',
     'AttributeExtension',
     'PropComparator',
@@ -564,6 +566,20 @@ def relationship(argument, secondary=None, **kwargs):
       which is evaluated at mapper initialization time, and may be passed as a
       Python-evaluable string when using Declarative.
 
+    :param readonly_collection=False:
+      when True, list-based collections loaded for this relationship
+      are stored as read-only :class:`.ReadOnlyList` tuples, without
+      the collection instrumentation normally associated with each
+      loaded collection.  This saves memory and load time for
+      collections that are read but not modified.  The first
+      modification of the collection, or a write to the attribute by
+      the ORM such as a backref append, replaces it with an
+      instrumented collection of the same members.  Not compatible
+      with ``lazy='dynamic'`` or with non-list ``collection_class``
+      arguments.  See also :meth:`.Query.readonly_collections`.
+
+      .. versionadded:: 0.8.1
+
     :param remote_side:
       used for self-referential relationships, indicates the column or
       list of columns that form the "remote side" of the relationship.
@@ -565,6 +565,17 @@ class AttributeImpl(object):
     def get_history(self, state, dict_, passive=PASSIVE_OFF):
         raise NotImplementedError()
 
+    def has_changes(self, state, dict_, passive=PASSIVE_OFF):
+        """Return True if this attribute has net changes on the given
+        state, i.e. a :class:`.History` with ``added`` or ``deleted``
+        items.
+
+        Subclasses override this to answer from ``committed_state``
+        without constructing a :class:`.History`.
+
+        """
+        return self.get_history(state, dict_, passive).has_changes()
+
     def get_all_pending(self, state, dict_):
         """Return a list of tuples of (state, obj)
         for all objects in this attribute's current state
@@ -694,6 +705,17 @@ class ScalarAttributeImpl(AttributeImpl):
         return History.from_scalar_attribute(
             self, state, dict_.get(self.key, NO_VALUE))
 
+    def has_changes(self, state, dict_, passive=PASSIVE_OFF):
+        original = state.committed_state.get(self.key, _NO_HISTORY)
+        if original is _NO_HISTORY:
+            return False
+
+        current = dict_.get(self.key, NO_VALUE)
+        if self.is_equal(current, original) is True:
+            return False
+        return current is not NO_VALUE or \
+                id(original) not in _NO_STATE_SYMBOLS
+
     def set(self, state, dict_, value, initiator,
                 passive=PASSIVE_OFF, check_old=None, pop=False):
         if initiator and initiator.parent_token is self.parent_token:
@@ -742,6 +764,19 @@ class ScalarObjectAttributeImpl(ScalarAttributeImpl):
         self.fire_remove_event(state, dict_, old, self)
         del dict_[self.key]
 
+    def has_changes(self, state, dict_, passive=PASSIVE_OFF):
+        original = state.committed_state.get(self.key, _NO_HISTORY)
+        if original is _NO_HISTORY:
+            return False
+        elif self.key not in dict_:
+            return AttributeImpl.has_changes(self, state, dict_, passive)
+
+        current = dict_[self.key]
+        if current is original:
+            return False
+        return (current is not NO_VALUE and current is not NEVER_SET) or \
+                not (id(original) in _NO_STATE_SYMBOLS or original is None)
+
     def get_history(self, state, dict_, passive=PASSIVE_OFF):
         if self.key in dict_:
             return History.from_object_attribute(self, state, dict_[self.key])
@@ -842,6 +877,11 @@ class CollectionAttributeImpl(AttributeImpl):
     CollectionAdapter, a "view" onto that object that presents consistent bag
     semantics to the orm layer independent of the user data implementation.
 
+    List-based collections may also be loaded "read only", in which case
+    the committed members are stored as a ReadOnlyList, a tuple with no
+    adapter.  It is replaced with an instrumented collection the first
+    time the collection or the attribute system needs to write to it.
+
     """
     accepts_scalar_loader = False
     uses_objects = True
@@ -850,7 +890,8 @@ class CollectionAttributeImpl(AttributeImpl):
 
     def __init__(self, class_, key, callable_, dispatch,
                     typecallable=None, trackparent=False, extension=None,
-                    copy_function=None, compare_function=None, **kwargs):
+                    copy_function=None, compare_function=None,
+                    readonly=False, **kwargs):
         super(CollectionAttributeImpl, self).__init__(
                                             class_,
                                             key,
@@ -864,8 +905,13 @@ class CollectionAttributeImpl(AttributeImpl):
             copy_function = self.__copy
         self.copy = copy_function
         self.collection_factory = typecallable
+        self.readonly = readonly
+        self.supports_readonly = isinstance(typecallable, type) and \
+                    util.duck_type_collection(typecallable) is list
 
     def __copy(self, item):
+        if isinstance(item, tuple):
+            return list(item)
         return [y for y in list(collections.collection_adapter(item))]
 
     def get_history(self, state, dict_, passive=PASSIVE_OFF):
@@ -875,12 +921,23 @@ class CollectionAttributeImpl(AttributeImpl):
         else:
             return History.from_collection(self, state, current)
 
+    def has_changes(self, state, dict_, passive=PASSIVE_OFF):
+        original = state.committed_state.get(self.key, _NO_HISTORY)
+        if original is _NO_HISTORY:
+            return False
+        elif id(original) in _NO_STATE_SYMBOLS or self.key not in dict_:
+            return AttributeImpl.has_changes(self, state, dict_, passive)
+
+        # compare membership by state, as History.from_collection()
+        # does, without building the added / unchanged / deleted lists
+        current = _collection_members(dict_[self.key])
+        return util.IdentitySet(current) != util.IdentitySet(original)
+
     def get_all_pending(self, state, dict_):
         if self.key not in dict_:
             return []
 
-        current = dict_[self.key]
-        current = getattr(current, '_sa_adapter')
+        current = _collection_members(dict_[self.key])
 
         if self.key in state.committed_state:
             original = state.committed_state[self.key]
@@ -1025,6 +1082,8 @@ class CollectionAttributeImpl(AttributeImpl):
             # ignore re-assignment of the current collection, as happens
             # implicitly with in-place operators (foo.collection |= other)
             return
+        elif isinstance(old, tuple):
+            old = self._upgrade(state, dict_, old)
 
         # place a copy of "old" in state.committed_state
         state._modified_event(dict_, self, old, True)
@@ -1037,11 +1096,35 @@ class CollectionAttributeImpl(AttributeImpl):
         old_collection.unlink(old)
 
     def _invalidate_collection(self, collection):
+        if isinstance(collection, tuple):
+            return
         adapter = getattr(collection, '_sa_adapter')
         adapter.invalidated = True
 
-    def set_committed_value(self, state, dict_, value):
-        """Set an attribute value on the given instance and 'commit' it."""
+    def _upgrade(self, state, dict_, value):
+        """Replace a read-only tuple with an instrumented collection
+        holding the same members."""
+
+        collection, user_data = self._initialize_collection(state)
+        collection.append_multiple_without_event(value)
+        if dict_.get(self.key) is value:
+            dict_[self.key] = user_data
+        return user_data
+
+    def set_committed_value(self, state, dict_, value, readonly=False):
+        """Set an attribute value on the given instance and 'commit' it.
+
+        If ``readonly`` is True or the attribute was configured as
+        read only, a list-based collection is stored as a ReadOnlyList.
+
+        """
+
+        if (readonly or self.readonly) and self.supports_readonly and \
+                self.key not in state._pending_mutations:
+            user_data = dict_[self.key] = collections.ReadOnlyList(
+                                        value or (), state, self.key)
+            state._commit(dict_, [self.key])
+            return user_data
 
         collection, user_data = self._initialize_collection(state)
 
@@ -1079,9 +1162,21 @@ class CollectionAttributeImpl(AttributeImpl):
             if user_data is PASSIVE_NO_RESULT:
                 return user_data
 
+        if isinstance(user_data, tuple):
+            user_data = self._upgrade(state, dict_, user_data)
+
         return getattr(user_data, '_sa_adapter')
 
 
+def _collection_members(user_data):
+    """Return the members of a collection value, which is either
+    an instrumented collection or a read-only tuple."""
+
+    if isinstance(user_data, tuple):
+        return user_data
+    return getattr(user_data, '_sa_adapter')
+
+
 def backref_listeners(attribute, key, uselist):
     """Apply listeners to synchronize a two-way relationship."""
 
@@ -1325,7 +1420,7 @@ class History(History):
         if current is NO_VALUE or current is NEVER_SET:
             return cls((), (), ())
 
-        current = getattr(current, '_sa_adapter')
+        current = _collection_members(current)
         if original is NO_VALUE:
             return cls(list(current), (), ())
         elif original is _NO_HISTORY:
@@ -1441,6 +1441,62 @@ class InstrumentedList(list):
     """An instrumented version of the built-in list."""
 
 
+class ReadOnlyList(tuple):
+    """A list-based collection loaded in read-only mode.
+
+    Members are held as a tuple, without instrumentation or a
+    :class:`.CollectionAdapter`.  Calling a method which would modify
+    the list first replaces it on the parent object with an
+    instrumented collection of the same members, upon which the
+    method is then invoked.
+
+    A ReadOnlyList compares equal to a list or tuple of the same
+    members, as does the instrumented collection which replaces it.
+
+    .. versionadded:: 0.8.1
+
+    """
+
+    def __new__(cls, members, owner_state=None, key=None):
+        self = tuple.__new__(cls, members)
+        self._sa_owner = owner_state, key
+        return self
+
+    def __eq__(self, other):
+        if isinstance(other, list):
+            other = tuple(other)
+        return tuple.__eq__(self, other)
+
+    def __ne__(self, other):
+        if isinstance(other, list):
+            other = tuple(other)
+        return tuple.__ne__(self, other)
+
+    def _sa_upgrade(self):
+        owner_state, key = self._sa_owner
+        if owner_state is None or owner_state.dict.get(key) is not self:
+            raise sa_exc.InvalidRequestError(
+                "This read-only collection, loaded using the "
+                "readonly_collection relationship() option or "
+                "Query.readonly_collections(), is no longer the current "
+                "value of its attribute and can't be modified.")
+        return owner_state.manager[key].impl._upgrade(
+                                    owner_state, owner_state.dict, self)
+
+
+def _readonly_mutator(name):
+    def mutator(self, *args, **kw):
+        return getattr(self._sa_upgrade(), name)(*args, **kw)
+    mutator.__name__ = name
+    return mutator
+
+for _name in ('append', 'extend', 'insert', 'remove', 'pop', 'reverse',
+              'sort', '__setitem__', '__delitem__', '__setslice__',
+              '__delslice__', '__iadd__', '__imul__'):
+    setattr(ReadOnlyList, _name, _readonly_mutator(_name))
+del _name
+
+
 class InstrumentedSet(set):
     """An instrumented version of the built-in set."""
 
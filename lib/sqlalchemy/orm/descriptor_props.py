@@ -40,6 +40,11 @@ class DescriptorProperty(MapperProperty):
                         passive=attributes.PASSIVE_OFF):
                     return prop.get_history(state, dict_, passive)
 
+                def has_changes(self, state, dict_,
+                        passive=attributes.PASSIVE_OFF):
+                    return prop.get_history(
+                                    state, dict_, passive).has_changes()
+
         if self.descriptor is None:
             desc = getattr(mapper.class_, self.key, None)
             if mapper._is_userland_descriptor(desc):
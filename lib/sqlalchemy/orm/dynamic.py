@@ -12,7 +12,7 @@ basic add/delete mutation.
 """
 
 from .. import log, util, exc
-from ..sql import operators
+from ..sql import operators, expression
 from . import (
     attributes, object_session, util as orm_util, strategies,
     object_mapper, exc as orm_exc
@@ -257,6 +257,115 @@ class AppenderMixin(object):
         else:
             return self._clone(sess).count()
 
+    def windows(self, size, expunge=False):
+        """Iterate the collection as a series of lists of at most
+        ``size`` objects, using keyset pagination.
+
+        Each window is loaded by a separate SELECT which is limited to
+        ``size`` rows and filtered to those rows which sort after the
+        last row of the previous window, rather than using OFFSET,
+        so that deep windows are as cheap to load as the first one.
+        The ordering is that of the query, typically the ``order_by``
+        configured on the :func:`.relationship`, followed by the
+        primary key of the target mapper so that each row has a
+        distinct position; columns used for ordering shouldn't
+        contain NULL values.
+
+        :param size: maximum number of objects in each window.
+
+        :param expunge: if True, the objects in each window are
+         expunged from the :class:`.Session` before the next window is
+         loaded, so that memory use remains constant when iterating
+         very large collections.  Pending changes on those objects
+         are discarded.
+
+        .. versionadded:: 0.8.1
+
+        """
+        sess = self.session
+        if sess is None:
+            items = list(self.attr._get_collection_history(
+                attributes.instance_state(self.instance),
+                attributes.PASSIVE_NO_INITIALIZE).added_items)
+            for start in xrange(0, len(items), size):
+                yield items[start:start + size]
+            return
+
+        query = self._clone(sess)
+        order_by = list(query._order_by or ())
+        keys = self._keyset_keys(order_by)
+        query = query.order_by(None).\
+                        order_by(*(order_by + [key for key, descending
+                                        in keys[len(order_by):]]))
+
+        criterion = None
+        while True:
+            if criterion is not None:
+                window = query.filter(criterion).limit(size).all()
+            else:
+                window = query.limit(size).all()
+            if not window:
+                return
+
+            # take the key values from the last object before
+            # the window is handed out and possibly modified
+            last = attributes.instance_state(window[-1])
+            values = [
+                last.manager.mapper._get_state_attr_by_column(
+                                        last, last.dict, key)
+                for key, descending in keys
+            ]
+
+            yield window
+
+            if expunge:
+                for obj in window:
+                    if obj in sess:
+                        sess.expunge(obj)
+            if len(window) < size:
+                return
+            criterion = self._keyset_criterion(keys, values)
+
+    def _keyset_keys(self, order_by):
+        """Return (expression, descending) tuples for the given
+        ORDER BY elements, extended with the target primary key."""
+
+        mapper = self.attr.target_mapper
+        keys = []
+        seen = util.column_set()
+        for elem in order_by:
+            descending = False
+            if isinstance(elem, expression.UnaryExpression) and \
+                    elem.modifier in (operators.desc_op, operators.asc_op):
+                descending = elem.modifier is operators.desc_op
+                elem = elem.element
+            if elem not in mapper._columntoproperty:
+                raise exc.InvalidRequestError(
+                    "Can't use windows() with ORDER BY expression %s; "
+                    "only columns mapped by %s are supported." %
+                    (elem, mapper))
+            keys.append((elem, descending))
+            seen.add(elem)
+
+        for col in mapper.primary_key:
+            if col not in seen:
+                keys.append((col, False))
+        return keys
+
+    def _keyset_criterion(self, keys, values):
+        """Return criterion matching rows which sort after the row
+        having the given key values."""
+
+        clauses = []
+        for idx, (key, descending) in enumerate(keys):
+            crit = [keys[i][0] == values[i] for i in xrange(idx)]
+            if descending:
+                crit.append(key < values[idx])
+            else:
+                crit.append(key > values[idx])
+            clauses.append(expression.and_(*crit))
+        return expression.or_(*clauses)
+
     def _clone(self, sess=None):
         # note we're returning an entirely new Query class instance
         # here without any assignment capabilities; the class of this
@@ -1291,7 +1291,11 @@ class SessionEvents(event.Events):
 
         :param session: The target :class:`.Session`.
         :param flush_context: Internal :class:`.UOWTransaction` object
-         which handles the details of the flush.
+         which handles the details of the flush.  If
+         :meth:`.UOWTransaction.enable_profile` was called within
+         :meth:`~.SessionEvents.before_flush`, its ``profile``
+         attribute is a :class:`.FlushProfile` describing where the
+         time and SQL of the flush were spent.
 
         .. seealso::
 
@@ -4,8 +4,11 @@
 # This module is part of SQLAlchemy and is released under
 # the MIT License: http://www.opensource.org/licenses/mit-license.php
 
+import time
 import weakref
 from . import attributes
+from .. import inspection
+from ..engine.result import LRUResultCache
 
 
 class IdentityMap(dict):
@@ -241,3 +244,132 @@ class StrongInstanceDict(IdentityMap):
         dict.update(self, keepers)
         self.modified = bool(dirty)
         return ref_count - len(self)
+
+
+class IdentityCache(object):
+    """A cache of database rows shared among :class:`.Session` objects,
+    keyed on identity.
+
+    When a :class:`.Session` is given an :class:`.IdentityCache`
+    using the ``identity_cache`` argument, :meth:`.Query.get` and
+    lazy loads of many-to-one relationships which locate the
+    target by primary key consult the cache for an object which
+    is not present in the :class:`.Session`, before emitting SQL.
+    Only the mappers given to :meth:`.IdentityCache.add` are
+    cached, and only where the :class:`.Query` has no loader
+    options, locking or ``populate_existing()``.
+
+    The rows for each object are stored in the form produced by
+    :meth:`.Query.frozen_rows`, together with the time at which they
+    were stored, using ``backend``, a :class:`.ResultCache`; the
+    default is an in-memory :class:`.LRUResultCache` of 1000 entries.
+    Keys are tuples of the mapped class and the primary key
+    identity.
+
+    Entries for objects which are modified or deleted are removed
+    after each flush of a :class:`.Session` using the cache.
+    Changes made by other means, such as :meth:`.Query.update` or
+    other processes, are not detected; the ``ttl`` given for each
+    mapper limits how long such changes may go unnoticed.  Rows
+    loaded within a transaction which has flushed changes are not
+    stored, and the entries for the objects flushed are removed
+    once more when that transaction commits.
+
+    E.g.::
+
+        cache = IdentityCache()
+        cache.add(Country, ttl=3600)
+        cache.add(Currency)
+
+        Session = sessionmaker(identity_cache=cache)
+
+    .. versionadded:: 0.8.1
+
+    """
+
+    def __init__(self, backend=None):
+        if backend is None:
+            backend = LRUResultCache(1000)
+        self.backend = backend
+        self._ttls = {}
+        # outermost transactions of Sessions which have flushed
+        # changes, within which rows are not stored, mapped to the
+        # identities flushed
+        self._flushed = weakref.WeakKeyDictionary()
+
+    def add(self, class_or_mapper, ttl=None):
+        """Cache objects loaded by primary key for the given class or
+        mapper, for at most ``ttl`` seconds if given."""
+
+        self._ttls[inspection.inspect(class_or_mapper)] = ttl
+
+    def caches(self, mapper):
+        """Return True if objects are cached for the given mapper."""
+
+        return mapper in self._ttls
+
+    def get(self, mapper, ident):
+        """Return the rows stored for the given identity, or ``None``."""
+
+        key = (mapper.class_, tuple(ident))
+        value = self.backend.get(key)
+        if value is None:
+            return None
+        timestamp, frozen = value
+        ttl = self._ttls[mapper]
+        if ttl is not None and time.time() - timestamp > ttl:
+            self.backend.delete(key)
+            return None
+        return frozen
+
+    def set(self, mapper, ident, frozen):
+        """Store the rows for the given identity."""
+
+        self.backend.set((mapper.class_, tuple(ident)), (time.time(), frozen))
+
+    def _root_transaction(self, session):
+        transaction = session.transaction
+        if transaction is not None:
+            while transaction._parent is not None:
+                transaction = transaction._parent
+        return transaction
+
+    def _can_store(self, session):
+        transaction = self._root_transaction(session)
+        return transaction is None or transaction not in self._flushed
+
+    def invalidate(self, mapper, ident):
+        """Remove the rows stored for the given identity, as loaded
+        against the given mapper or any mapper it inherits from."""
+
+        ident = tuple(ident)
+        for m in mapper.iterate_to_root():
+            if m in self._ttls:
+                self.backend.delete((m.class_, ident))
+
+    def after_flush(self, session, flush_context):
+        """Remove the rows stored for objects persisted or deleted
+        by a flush; called by a :class:`.Session` at the point of the
+        :meth:`.SessionEvents.after_flush` event."""
+
+        flushed = [(state.manager.mapper, state.key[1])
+                   for state in flush_context.states
+                   if state.key is not None]
+        for mapper, ident in flushed:
+            self.invalidate(mapper, ident)
+        transaction = self._root_transaction(session)
+        if transaction is not None:
+            self._flushed.setdefault(transaction, []).extend(flushed)
+
+    def after_commit(self, session, transaction):
+        """Remove the rows stored for objects flushed within the given
+        outermost transaction, now committed; called by a
+        :class:`.Session` at the point of the
+        :meth:`.SessionEvents.after_commit` event.
+
+        Other :class:`.Session` objects may have stored the previous
+        rows for these objects between the flush and the commit.
+
+        """
+        for mapper, ident in self._flushed.pop(transaction, ()):
+            self.invalidate(mapper, ident)
@@ -19,6 +19,7 @@ from .interfaces import EXT_CONTINUE
 from ..sql import util as sql_util
 from .util import _none_set, state_str
 from .. import exc as sa_exc
+from ..engine.result import CachedResultProxy
 sessionlib = util.importlater("sqlalchemy.orm", "session")
 
 _new_runid = util.counter()
@@ -56,6 +57,7 @@ def instances(query, cursor, context):
     while True:
         context.progress = {}
         context.partials = {}
+        context.readonly_loads = {}
 
         if query._yield_per:
             fetch = cursor.fetchmany(query._yield_per)
@@ -83,6 +85,11 @@ def instances(query, cursor, context):
                     context.refresh_state.dict, query._only_load_props)
             context.progress.pop(context.refresh_state)
 
+        for (state, key), result_list in \
+                context.readonly_loads.iteritems():
+            state.manager[key].impl.set_committed_value(
+                    state, state.dict, result_list.data, readonly=True)
+
         statelib.InstanceState._commit_all_states(
             context.progress.items(),
             session.identity_map
@@ -222,12 +229,44 @@ def load_on_ident(query, key,
         refresh_state=refresh_state)
     q._order_by = None
 
+    if key is not None and refresh_state is None and lockmode is None:
+        cache = q.session.identity_cache
+        if cache is not None and cache.caches(mapper) and \
+                not q._with_options and not q._populate_existing:
+            return _load_on_ident_cached(q, cache, mapper, ident)
+
     try:
         return q.one()
     except orm_exc.NoResultFound:
         return None
 
 
+def _load_on_ident_cached(q, cache, mapper, ident):
+    """Load the given identity using the rows stored in an
+    :class:`.IdentityCache`, loading and storing them if not present."""
+
+    frozen = cache.get(mapper, ident)
+    if frozen is not None:
+        ret = list(q.thaw_rows(frozen))
+    else:
+        context = q._iter_context()
+        result = q._execute_statement(context)
+        frozen = result._frozen()
+        if not frozen[1]:
+            return None
+        if cache._can_store(q.session):
+            cache.set(mapper, ident, frozen)
+        # load from the rows just fetched, rather than
+        # processing them a second time through thaw_rows()
+        ret = list(instances(q, CachedResultProxy(result.context, frozen),
+                             context))
+
+    if len(ret) > 1:
+        raise orm_exc.MultipleResultsFound(
+            "Multiple rows were found for one()")
+    return ret[0]
+
+
 def instance_processor(mapper, context, path, adapter,
                             polymorphic_from=None,
                             only_load_props=None,
@@ -1304,6 +1304,13 @@ class Mapper(_InspectionAttr):
             self.non_primary and "|non-primary" or ""
         )
 
+    @property
+    def _orphan_possible(self):
+        for mapper in self.iterate_to_root():
+            if mapper._delete_orphans:
+                return True
+        return False
+
     def _is_orphan(self, state):
         orphan_possible = False
         for mapper in self.iterate_to_root():
@@ -1409,6 +1416,35 @@ class Mapper(_InspectionAttr):
 
         return from_obj
 
+    @_memoized_configured_property
+    def _propkey_to_col(self):
+        """Per table, a dictionary of column property keys to the
+        columns of that table which they map."""
+
+        result = {}
+        for table, columns in self._cols_by_table.items():
+            by_key = result[table] = {}
+            for col in columns:
+                key = self._columntoproperty[col].key
+                by_key.setdefault(key, []).append(col)
+        return result
+
+    @_memoized_configured_property
+    def _update_base_cols(self):
+        """Per table, the columns which are always examined when
+        composing an UPDATE, regardless of which attributes were
+        modified; these are the primary key columns as well as the
+        version id column."""
+
+        result = {}
+        for table, columns in self._cols_by_table.items():
+            cols = result[table] = \
+                util.column_set(self._pks_by_table.get(table, ()))
+            if self.version_id_col is not None and \
+                    self.version_id_col in columns:
+                cols.add(self.version_id_col)
+        return result
+
     @_memoized_configured_property
     def _single_table_criterion(self):
         if self.single and \
@@ -1459,6 +1495,20 @@ class Mapper(_InspectionAttr):
         """
         return self._with_polymorphic_selectable
 
+    @_memoized_configured_property
+    def _polymorphic_adapter(self):
+        """A :class:`.ColumnAdapter` against the default "polymorphic"
+        selectable, shared among all :class:`.Query` objects which
+        load this mapper polymorphically, so that column adaptation
+        is performed once per column."""
+
+        if self.with_polymorphic:
+            return sql_util.ColumnAdapter(
+                        self.selectable,
+                        self._equivalent_columns)
+        else:
+            return None
+
     def _with_polymorphic_args(self, spec=None, selectable=False,
                                 innerjoin=False):
         if self.with_polymorphic:
@@ -1865,6 +1915,65 @@ class Mapper(_InspectionAttr):
         prop = self._columntoproperty[column]
         state.manager[prop.key].impl.set(state, dict_, value, None)
 
+    @_memoized_configured_property
+    def _plain_column_impls(self):
+        """A dictionary of attribute keys to the :class:`.AttributeImpl`
+        of each column-based attribute which is instrumented directly,
+        i.e. not shadowed by a user-defined descriptor.
+
+        Empty if the class defines ``__setattr__``, which has to see
+        every attribute set."""
+
+        manager = self.class_manager
+        result = {}
+        if self.class_.__setattr__ is not object.__setattr__:
+            return result
+        for prop in self._props.values():
+            if not isinstance(prop, properties.ColumnProperty) or \
+                    prop.key not in manager:
+                continue
+            attr = manager[prop.key]
+            if type(attr.impl) is attributes.ScalarAttributeImpl and \
+                    getattr(self.class_, prop.key, None) is attr:
+                result[prop.key] = attr.impl
+        return result
+
+    def _populate_new(self, state, values):
+        """Populate column-based attributes on a new, transient
+        instance directly from the given dictionary of values.
+
+        Attributes which have no ``set`` listeners or validators are
+        written straight into the instance's dictionary, with the same
+        change tracking as a regular attribute set; the remaining keys
+        and values are returned, to be set normally.
+
+        """
+        if state.key is not None or state.session_id or state.callables:
+            return values
+
+        impls = self._plain_column_impls
+        dict_ = state.dict
+        committed_state = state.committed_state
+        remaining = {}
+        for key, value in values.iteritems():
+            impl = impls.get(key)
+            if impl is None or impl.dispatch.set:
+                remaining[key] = value
+                continue
+            if key not in committed_state:
+                if key in dict_:
+                    committed_state[key] = dict_[key]
+                elif impl.dispatch._active_history:
+                    # as returned by impl.get() for a new object
+                    committed_state[key] = attributes.NEVER_SET
+                else:
+                    committed_state[key] = attributes.NO_VALUE
+            dict_[key] = value
+
+        if len(remaining) < len(values):
+            state.modified = True
+        return remaining
+
     def _get_committed_attr_by_column(self, obj, column):
         state = attributes.instance_state(obj)
         dict_ = attributes.instance_dict(obj)
@@ -2103,6 +2212,9 @@ def configure_mappers():
             if not _new_mappers:
                 return
 
+            # modules deferred from "import sqlalchemy.orm"
+            util.importlater.resolve_lazy("sqlalchemy.orm")
+
             # initialize properties on all mappers
             # note that _mapper_registry is unordered, which
             # may randomly conceal/reveal issues related to
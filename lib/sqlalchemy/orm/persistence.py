@@ -13,13 +13,17 @@ in unitofwork.py.
 
 """
 
+from __future__ import with_statement
+
 import operator
 from itertools import groupby
 from .. import sql, util, exc as sa_exc, schema
-from . import attributes, sync, exc as orm_exc, evaluator
+from . import attributes, sync, exc as orm_exc
 from .util import _state_mapper, state_str, _attr_as_key
 from ..sql import expression
 
+evaluator = util.importlater("sqlalchemy.orm", "evaluator", lazy=True)
+
 
 def save_obj(base_mapper, states, uowtransaction, single=False):
     """Issue ``INSERT`` and/or ``UPDATE`` statements for a list
@@ -293,7 +297,7 @@ def _collect_update_commands(base_mapper, uowtransaction,
         value_params = {}
 
         hasdata = hasnull = False
-        for col in mapper._cols_by_table[table]:
+        for col in _modified_cols(mapper, table, state):
             if col is mapper.version_id_col:
                 params[col._label] = \
                     mapper._get_committed_state_attr_by_column(
@@ -318,9 +322,11 @@ def _collect_update_commands(base_mapper, uowtransaction,
                     # history is only
                     # in a different table than the one
                     # where the version_id_col is.
-                    for prop in mapper._columntoproperty.itervalues():
+                    for key in state.committed_state:
+                        if key not in mapper.column_attrs:
+                            continue
                         history = attributes.get_state_history(
-                                state, prop.key,
+                                state, key,
                                 attributes.PASSIVE_NO_INITIALIZE)
                         if history.added:
                             hasdata = True
@@ -384,6 +390,27 @@ def _collect_update_commands(base_mapper, uowtransaction,
     return update
 
 
+def _modified_cols(mapper, table, state):
+    """Return the columns of the given table to be examined when
+    composing an UPDATE for the given state.
+
+    Only attributes present in ``state.committed_state`` can
+    have net changes, so rather than checking the history of every
+    column in the table, the primary key and version id columns are
+    combined with those columns mapped by modified attributes.
+
+    """
+    propkey_to_col = mapper._propkey_to_col[table]
+    cols = mapper._update_base_cols[table]
+    modified = [propkey_to_col[key] for key in state.committed_state
+                    if key in propkey_to_col]
+    if modified:
+        cols = util.column_set(cols)
+        for c in modified:
+            cols.update(c)
+    return cols
+
+
 def _collect_post_update_commands(base_mapper, uowtransaction, table,
                         states_to_update, post_update_cols):
     """Identify sets of values to use in UPDATE statements for a
@@ -489,6 +516,8 @@ def _emit_update_statements(base_mapper, uowtransaction,
         else:
             c = cached_connections[connection].\
                                 execute(statement, params)
+        if uowtransaction.profile is not None:
+            uowtransaction.profile._statement(table, False)
 
         _postfetch(
                 mapper,
@@ -535,6 +564,9 @@ def _emit_insert_statements(base_mapper, uowtransaction,
             multiparams = [rec[2] for rec in records]
             c = cached_connections[connection].\
                                 execute(statement, multiparams)
+            if uowtransaction.profile is not None:
+                uowtransaction.profile._statement(
+                                        table, len(multiparams) > 1)
 
             for (state, state_dict, params, mapper,
                     conn, value_params, has_all_pks), \
@@ -563,6 +595,8 @@ def _emit_insert_statements(base_mapper, uowtransaction,
                 else:
                     result = cached_connections[connection].\
                                         execute(statement, params)
+                if uowtransaction.profile is not None:
+                    uowtransaction.profile._statement(table, False)
 
                 primary_key = result.context.inserted_primary_key
 
@@ -619,6 +653,9 @@ def _emit_post_update_statements(base_mapper, uowtransaction,
                                 params, mapper, conn in grouper]
         cached_connections[connection].\
                             execute(statement, multiparams)
+        if uowtransaction.profile is not None:
+            uowtransaction.profile._statement(
+                                    table, len(multiparams) > 1)
 
 
 def _emit_delete_statements(base_mapper, uowtransaction, cached_connections,
@@ -660,6 +697,8 @@ def _emit_delete_statements(base_mapper, uowtransaction, cached_connections,
                 for params in del_objects:
                     c = connection.execute(statement, params)
                     rows += c.rowcount
+                    if uowtransaction.profile is not None:
+                        uowtransaction.profile._statement(table, False)
                 if rows != len(del_objects):
                     raise orm_exc.StaleDataError(
                         "DELETE statement on table '%s' expected to "
@@ -673,8 +712,14 @@ def _emit_delete_statements(base_mapper, uowtransaction, cached_connections,
                     connection.dialect.dialect_description,
                     stacklevel=12)
                 connection.execute(statement, del_objects)
+                if uowtransaction.profile is not None:
+                    uowtransaction.profile._statement(
+                                        table, len(del_objects) > 1)
         else:
             connection.execute(statement, del_objects)
+            if uowtransaction.profile is not None:
+                uowtransaction.profile._statement(
+                                    table, len(del_objects) > 1)
 
 
 def _finalize_insert_update_commands(base_mapper, uowtransaction,
@@ -719,28 +764,30 @@ def _postfetch(mapper, uowtransaction, table,
     after an INSERT or UPDATE statement has proceeded for that
     state."""
 
-    if mapper.version_id_col is not None:
-        prefetch_cols = list(prefetch_cols) + [mapper.version_id_col]
-
-    for c in prefetch_cols:
-        if c.key in params and c in mapper._columntoproperty:
-            mapper._set_state_attr_by_column(state, dict_, c, params[c.key])
-
-    if postfetch_cols:
-        state._expire_attributes(state.dict,
-                            [mapper._columntoproperty[c].key
-                            for c in postfetch_cols if c in
-                            mapper._columntoproperty]
-                        )
-
-    # synchronize newly inserted ids from one table to the next
-    # TODO: this still goes a little too often.  would be nice to
-    # have definitive list of "columns that changed" here
-    for m, equated_pairs in mapper._table_to_equated[table]:
-        sync.populate(state, m, state, m,
-                                        equated_pairs,
-                                        uowtransaction,
-                                        mapper.passive_updates)
+    with uowtransaction._timed('postfetch'):
+        if mapper.version_id_col is not None:
+            prefetch_cols = list(prefetch_cols) + [mapper.version_id_col]
+
+        for c in prefetch_cols:
+            if c.key in params and c in mapper._columntoproperty:
+                mapper._set_state_attr_by_column(
+                                    state, dict_, c, params[c.key])
+
+        if postfetch_cols:
+            state._expire_attributes(state.dict,
+                                [mapper._columntoproperty[c].key
+                                for c in postfetch_cols if c in
+                                mapper._columntoproperty]
+                            )
+
+        # synchronize newly inserted ids from one table to the next
+        # TODO: this still goes a little too often.  would be nice to
+        # have definitive list of "columns that changed" here
+        for m, equated_pairs in mapper._table_to_equated[table]:
+            sync.populate(state, m, state, m,
+                                            equated_pairs,
+                                            uowtransaction,
+                                            mapper.passive_updates)
 
 
 def _connections_for_states(base_mapper, uowtransaction, states):
@@ -15,8 +15,7 @@ from .. import sql, util, log, exc as sa_exc, inspect
 from ..sql import operators, expression
 from . import (
     attributes, mapper,
-    strategies, configure_mappers, relationships,
-    dependency
+    strategies, configure_mappers, relationships
     )
 from .util import CascadeOptions, \
         _orm_annotate, _orm_deannotate, _orm_full_deannotate
@@ -25,6 +24,7 @@ from .interfaces import MANYTOMANY, MANYTOONE, ONETOMANY,\
         PropComparator, StrategizedProperty
 
 mapperlib = util.importlater("sqlalchemy.orm", "mapperlib")
+dependency = util.importlater("sqlalchemy.orm", "dependency", lazy=True)
 NoneType = type(None)
 
 from descriptor_props import CompositeProperty, SynonymProperty, \
@@ -262,6 +262,7 @@ class RelationshipProperty(StrategizedProperty):
         load_on_pending=False,
         strategy_class=None, _local_remote_pairs=None,
         query_class=None,
+        readonly_collection=False,
             info=None):
 
         self.uselist = uselist
@@ -282,6 +283,7 @@ class RelationshipProperty(StrategizedProperty):
         self.remote_side = remote_side
         self.enable_typechecks = enable_typechecks
         self.query_class = query_class
+        self.readonly_collection = readonly_collection
         self.innerjoin = innerjoin
         self.doc = doc
         self.active_history = active_history
@@ -908,10 +910,10 @@ class RelationshipProperty(StrategizedProperty):
         if x is attributes.PASSIVE_NO_RESULT or x is None:
             return []
         elif hasattr(impl, 'get_collection'):
-            return [
-                (attributes.instance_state(o), o) for o in
-                impl.get_collection(state, dict_, x, passive=passive)
-            ]
+            if not isinstance(x, tuple):
+                # read-only collections are iterated directly
+                x = impl.get_collection(state, dict_, x, passive=passive)
+            return [(attributes.instance_state(o), o) for o in x]
         else:
             return [(attributes.instance_state(x), x)]
 
@@ -1262,6 +1264,14 @@ class RelationshipProperty(StrategizedProperty):
     def _post_init(self):
         if self.uselist is None:
             self.uselist = self.direction is not MANYTOONE
+        if self.readonly_collection and (
+                not self.uselist or self.lazy == 'dynamic' or
+                util.duck_type_collection(self.collection_class or list)
+                is not list):
+            raise sa_exc.ArgumentError(
+                    "readonly_collection=True on relationship %s "
+                    "requires a list-based collection and can't be "
+                    "used with lazy='dynamic'" % self)
         if not self.viewonly:
             self._dependency_processor = \
                 dependency.DependencyProcessor.from_relationship(self)
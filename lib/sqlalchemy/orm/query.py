@@ -32,6 +32,7 @@ from .util import (
 from .. import sql, util, log, exc as sa_exc, inspect, inspection, \
         types as sqltypes
 from ..sql.expression import _interpret_as_from
+from ..engine.result import CachedResultProxy
 from ..sql import (
         util as sql_util,
         expression, visitors
@@ -88,6 +89,7 @@ class Query(object):
     _statement = None
     _correlate = frozenset()
     _populate_existing = False
+    _readonly_collections = False
     _invoke_all_eagers = True
     _version_check = False
     _autoflush = True
@@ -136,17 +138,11 @@ class Query(object):
                                             self._polymorphic_adapters:
                             self._mapper_loads_polymorphically_with(
                                 ext_info.mapper,
-                                sql_util.ColumnAdapter(
-                                        ext_info.selectable,
-                                        ext_info.mapper._equivalent_columns
-                                )
+                                ext_info.mapper._polymorphic_adapter
                             )
                         aliased_adapter = None
                     elif ext_info.is_aliased_class:
-                        aliased_adapter = sql_util.ColumnAdapter(
-                                    ext_info.selectable,
-                                    ext_info.mapper._equivalent_columns
-                                    )
+                        aliased_adapter = ext_info._column_adapter
                     else:
                         aliased_adapter = None
 
@@ -856,6 +852,29 @@ class Query(object):
         """
         self._populate_existing = True
 
+    @_generative()
+    def readonly_collections(self):
+        """Return a :class:`.Query` that will populate list-based
+        collections loaded by joined and subquery eager loaders as
+        read-only :class:`.ReadOnlyList` tuples.
+
+        Read-only collections skip the collection instrumentation
+        and :class:`.CollectionAdapter` normally associated with each
+        loaded collection, reducing memory use and load time for
+        large eagerly loaded graphs that won't be modified.  The
+        first modification of the collection, or a write to the
+        attribute by the ORM such as a backref append, replaces it
+        with an instrumented collection of the same members.
+
+        Read-only loading may also be configured per-relationship
+        using the ``readonly_collection`` argument to
+        :func:`.relationship`.
+
+        .. versionadded:: 0.8.1
+
+        """
+        self._readonly_collections = True
+
     @_generative()
     def _with_invoke_all_eagers(self, value):
         """Set the 'invoke all eagers' flag which causes joined- and
@@ -2245,27 +2264,43 @@ class Query(object):
             return None
 
     def __iter__(self):
+        return self._execute_and_instances(self._iter_context())
+
+    def _iter_context(self):
         context = self._compile_context()
         context.statement.use_labels = True
         if self._autoflush and not self._populate_existing:
             self.session._autoflush()
-        return self._execute_and_instances(context)
+        return context
 
     def _connection_from_session(self, **kw):
         conn = self.session.connection(
                         **kw)
         if self._execution_options:
-            conn = conn.execution_options(**self._execution_options)
+            options = self._execution_options
+            if 'cache_key' in options:
+                # cache_key is applied to the statement; see
+                # _execute_statement()
+                options = dict(options)
+                del options['cache_key']
+            conn = conn.execution_options(**options)
         return conn
 
     def _execute_and_instances(self, querycontext):
+        result = self._execute_statement(querycontext)
+        return loading.instances(self, result, querycontext)
+
+    def _execute_statement(self, querycontext):
         conn = self._connection_from_session(
                         mapper=self._mapper_zero_or_none(),
                         clause=querycontext.statement,
                         close_with_result=True)
 
-        result = conn.execute(querycontext.statement, self._params)
-        return loading.instances(self, result, querycontext)
+        statement = querycontext.statement
+        if 'cache_key' in self._execution_options:
+            statement = statement.execution_options(
+                        cache_key=self._execution_options['cache_key'])
+        return conn.execute(statement, self._params)
 
     @property
     def column_descriptions(self):
@@ -2355,6 +2390,59 @@ class Query(object):
 
         return loading.merge_result(self, iterator, load)
 
+    def frozen_rows(self):
+        """Execute this :class:`.Query`, returning its rows in a
+        compact form suitable for storage in a cache.
+
+        The return value is a tuple of the column names and types of
+        the result, and a list of row tuples; it contains only the
+        column values returned by the database, and no mapped instances
+        or :class:`.InstanceState` objects.  Provided the column values
+        themselves allow it, it can be serialized by ``marshal`` or
+        ``json`` as well as ``pickle``, in much less space and time than
+        the mapped instances.
+
+        The rows are turned back into an ORM result, loaded into the
+        :class:`.Session`, by :meth:`.Query.thaw_rows`.
+
+        .. versionadded:: 0.8.1
+
+        """
+        return self._execute_statement(self._iter_context())._frozen()
+
+    def thaw_rows(self, frozen):
+        """Return an ORM result, as an iterator, from rows returned by
+        :meth:`.Query.frozen_rows`.
+
+        The rows are processed as though they were returned by the
+        database for this :class:`.Query`, which must be of the same
+        structure as the one which produced them; objects already
+        present in the :class:`.Session` are returned as is, and others
+        are loaded into it.  No SQL is emitted and no connection is
+        used for the rows themselves.
+
+        e.g.::
+
+            q = session.query(User).filter(User.name.like('ed%'))
+
+            payload = marshal.dumps(q.frozen_rows())
+
+            # ... later
+            for user in q.thaw_rows(marshal.loads(payload)):
+                print user
+
+        .. versionadded:: 0.8.1
+
+        """
+        context = self._compile_context()
+        context.statement.use_labels = True
+        bind = self.session.get_bind(self._mapper_zero_or_none(),
+                                        clause=context.statement)
+        result = CachedResultProxy._from_statement(bind,
+                                        context.statement,
+                                        self._execution_options, frozen)
+        return loading.instances(self, result, context)
+
     @property
     def _select_args(self):
         return {
@@ -3077,6 +3165,7 @@ class QueryContext(object):
         self.query = query
         self.session = query.session
         self.populate_existing = query._populate_existing
+        self.readonly_collections = query._readonly_collections
         self.invoke_all_eagers = query._invoke_all_eagers
         self.version_check = query._version_check
         self.refresh_state = query._refresh_state
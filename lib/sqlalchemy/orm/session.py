@@ -359,6 +359,10 @@ class SessionTransaction(object):
             self._state = COMMITTED
             self.session.dispatch.after_commit(self.session)
 
+            if self._parent is None and \
+                    self.session.identity_cache is not None:
+                self.session.identity_cache.after_commit(self.session, self)
+
             if self.session._enable_transaction_accounting:
                 self._remove_snapshot()
 
@@ -468,7 +472,7 @@ class Session(_SessionClassMethods):
                 _enable_transaction_accounting=True,
                  autocommit=False, twophase=False,
                  weak_identity_map=True, binds=None, extension=None,
-                 query_cls=query.Query):
+                 query_cls=query.Query, identity_cache=None):
         """Construct a new Session.
 
         See also the :class:`.sessionmaker` function which is used to
@@ -556,6 +560,13 @@ class Session(_SessionClassMethods):
            flush events, as well as a post-rollback event. **Deprecated.**
            Please see :class:`.SessionEvents`.
 
+        :param identity_cache: An optional :class:`.IdentityCache`, usually
+           shared among many :class:`.Session` objects, which is consulted
+           by :meth:`.Query.get` and by many-to-one lazy loads for objects
+           not present in this :class:`.Session`, before SQL is emitted.
+
+           .. versionadded:: 0.8.1
+
         :param query_cls:  Class which should be used to create new Query
            objects, as returned by the ``query()`` method. Defaults to
            :class:`~sqlalchemy.orm.query.Query`.
@@ -598,6 +609,7 @@ class Session(_SessionClassMethods):
         self._enable_transaction_accounting = _enable_transaction_accounting
         self.twophase = twophase
         self._query_cls = query_cls
+        self.identity_cache = identity_cache
 
         if extension:
             for ext in util.to_list(extension):
@@ -1846,47 +1858,62 @@ class Session(_SessionClassMethods):
             # added
             dirty = self._dirty_states
 
-        deleted = set(self._deleted)
-        new = set(self._new)
-
-        dirty = set(dirty).difference(deleted)
-
-        # create the set of all objects we want to operate upon
-        if objects:
-            # specific list passed in
-            objset = set()
-            for o in objects:
-                try:
-                    state = attributes.instance_state(o)
-                except exc.NO_STATE:
-                    raise exc.UnmappedInstanceError(o)
-                objset.add(state)
-        else:
-            objset = None
-
-        # store objects whose fate has been decided
-        processed = set()
+        with flush_context._timed('register'):
+            deleted = set(self._deleted)
+            new = set(self._new)
+
+            dirty = set(dirty).difference(deleted)
+
+            # create the set of all objects we want to operate upon
+            if objects:
+                # specific list passed in
+                objset = set()
+                for o in objects:
+                    try:
+                        state = attributes.instance_state(o)
+                    except exc.NO_STATE:
+                        raise exc.UnmappedInstanceError(o)
+                    objset.add(state)
+            else:
+                objset = None
 
-        # put all saves/updates into the flush context.  detect top-level
-        # orphans and throw them into deleted.
-        if objset:
-            proc = new.union(dirty).intersection(objset).difference(deleted)
-        else:
-            proc = new.union(dirty).difference(deleted)
+            # store objects whose fate has been decided
+            processed = set()
 
-        for state in proc:
-            is_orphan = (
-                _state_mapper(state)._is_orphan(state) and state.has_identity)
-            flush_context.register_object(state, isdelete=is_orphan)
-            processed.add(state)
+            # put all saves/updates into the flush context.  detect top-level
+            # orphans and throw them into deleted.
+            if objset:
+                proc = new.union(dirty).intersection(objset).\
+                                    difference(deleted)
+            else:
+                proc = new.union(dirty).difference(deleted)
+
+            # partition by mapper, so that orphan detection is only
+            # performed for those mappers which have a delete-orphan
+            # relationship somewhere in their hierarchy.
+            by_mapper = util.defaultdict(list)
+            for state in proc:
+                by_mapper[state.manager.mapper].append(state)
+
+            for mapper, states in by_mapper.items():
+                if mapper._orphan_possible:
+                    for state in states:
+                        is_orphan = (
+                            mapper._is_orphan(state) and state.has_identity)
+                        flush_context.register_object(
+                                            state, isdelete=is_orphan)
+                else:
+                    for state in states:
+                        flush_context.register_object(state)
+                processed.update(states)
 
-        # put all remaining deletes into the flush context.
-        if objset:
-            proc = deleted.intersection(objset).difference(processed)
-        else:
-            proc = deleted.difference(processed)
-        for state in proc:
-            flush_context.register_object(state, isdelete=True)
+            # put all remaining deletes into the flush context.
+            if objset:
+                proc = deleted.intersection(objset).difference(processed)
+            else:
+                proc = deleted.difference(processed)
+            for state in proc:
+                flush_context.register_object(state, isdelete=True)
 
         if not flush_context.has_work:
             return
@@ -1902,7 +1929,11 @@ class Session(_SessionClassMethods):
 
             self.dispatch.after_flush(self, flush_context)
 
-            flush_context.finalize_flush_changes()
+            if self.identity_cache is not None:
+                self.identity_cache.after_flush(self, flush_context)
+
+            with flush_context._timed('finalize'):
+                flush_context.finalize_flush_changes()
 
             if not objects and self.identity_map._modified:
                 len_ = len(self.identity_map._modified)
@@ -2015,11 +2046,8 @@ class Session(_SessionClassMethods):
                 ) or not hasattr(attr.impl, 'get_history'):
                 continue
 
-            (added, unchanged, deleted) = \
-                    attr.impl.get_history(state, dict_,
-                            passive=attributes.NO_CHANGE)
-
-            if added or deleted:
+            if attr.impl.has_changes(state, dict_,
+                            passive=attributes.NO_CHANGE):
                 return True
         else:
             return False
@@ -566,6 +566,18 @@ class AttributeState(object):
         return self.state.get_history(self.key,
                     PASSIVE_NO_INITIALIZE)
 
+    def has_changes(self):
+        """Return True if this attribute has pre-flush changes.
+
+        This is equivalent to ``attr_state.history.has_changes()``,
+        but is determined without producing a :class:`.History`.
+
+        .. versionadded:: 0.8.1
+
+        """
+        return self.state.manager[self.key].impl.has_changes(
+                    self.state, self.state.dict, PASSIVE_NO_INITIALIZE)
+
 
 class PendingCollection(object):
     """A writable placeholder for an unloaded collection.
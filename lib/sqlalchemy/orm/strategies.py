@@ -317,6 +317,7 @@ class NoLoader(AbstractRelationshipLoader):
             useobject=True,
             uselist=self.parent_property.uselist,
             typecallable=self.parent_property.collection_class,
+            readonly=self.parent_property.readonly_collection,
         )
 
     def create_row_processor(self, context, path, mapper, row, adapter):
@@ -389,6 +390,7 @@ class LazyLoader(AbstractRelationshipLoader):
             uselist=self.parent_property.uselist,
             backref=self.parent_property.back_populates,
             typecallable=self.parent_property.collection_class,
+            readonly=self.parent_property.readonly_collection,
             active_history=active_history
         )
 
@@ -948,18 +950,22 @@ class SubqueryLoader(AbstractRelationshipLoader):
             local_cols = [adapter.columns[c] for c in local_cols]
 
         if self.uselist:
-            return self._create_collection_loader(collections, local_cols)
+            return self._create_collection_loader(context,
+                                        collections, local_cols)
         else:
             return self._create_scalar_loader(collections, local_cols)
 
-    def _create_collection_loader(self, collections, local_cols):
+    def _create_collection_loader(self, context, collections, local_cols):
+        readonly = context.readonly_collections
+
         def load_collection_from_subq(state, dict_, row):
             collection = collections.get(
                 tuple([row[col] for col in local_cols]),
                 ()
             )
             state.get_impl(self.key).\
-                    set_committed_value(state, dict_, collection)
+                    set_committed_value(state, dict_, collection,
+                                        readonly=readonly)
 
         return load_collection_from_subq, None, None
 
@@ -1085,14 +1091,14 @@ class JoinedLoader(AbstractRelationshipLoader):
             None
         )
         if with_poly_info:
-            to_adapt = with_poly_info.entity
+            clauses = with_poly_info._eager_adapter(self.mapper)
         else:
             to_adapt = orm_util.AliasedClass(self.mapper,
                                 use_mapper_path=True)
-        clauses = orm_util.ORMAdapter(
-                    to_adapt,
-                    equivalents=self.mapper._equivalent_columns,
-                    adapt_required=True)
+            clauses = orm_util.ORMAdapter(
+                        to_adapt,
+                        equivalents=self.mapper._equivalent_columns,
+                        adapt_required=True)
         assert clauses.aliased_class is not None
 
         if self.parent_property.direction != interfaces.MANYTOONE:
@@ -1275,6 +1281,12 @@ class JoinedLoader(AbstractRelationshipLoader):
                                             mapper, row, adapter)
 
     def _create_collection_loader(self, context, key, _instance):
+        if (context.readonly_collections or
+                self.parent_property.readonly_collection) and \
+                self.parent.class_manager[key].impl.supports_readonly:
+            return self._create_readonly_collection_loader(
+                                            context, key, _instance)
+
         def load_collection_from_joined_new_row(state, dict_, row):
             collection = attributes.init_state_collection(
                                             state, dict_, key)
@@ -1306,6 +1318,36 @@ class JoinedLoader(AbstractRelationshipLoader):
                 load_collection_from_joined_existing_row, \
                 None, load_collection_from_joined_exec
 
+    def _create_readonly_collection_loader(self, context, key, _instance):
+        # members are accumulated into plain lists, which
+        # loading.instances() stores as tuples once the rows
+        # have been processed.  The list is present in the
+        # instance's dict in the meantime, so that load events
+        # don't trigger a lazy load of the attribute.
+        def _appender(state, dict_):
+            result_list = util.UniqueAppender([])
+            context.attributes[(state, key)] = \
+                    context.readonly_loads[(state, key)] = result_list
+            dict_[key] = result_list.data
+            return result_list
+
+        def load_collection_from_joined_new_row(state, dict_, row):
+            _instance(row, _appender(state, dict_))
+
+        def load_collection_from_joined_existing_row(state, dict_, row):
+            if (state, key) in context.attributes:
+                result_list = context.attributes[(state, key)]
+            else:
+                result_list = _appender(state, dict_)
+            _instance(row, result_list)
+
+        def load_collection_from_joined_exec(state, dict_, row):
+            _instance(row, None)
+
+        return load_collection_from_joined_new_row, \
+                load_collection_from_joined_existing_row, \
+                None, load_collection_from_joined_exec
+
     def _create_scalar_loader(self, context, key, _instance):
         def load_scalar_from_joined_new_row(state, dict_, row):
             # set a scalar object instance directly on the parent
@@ -1417,10 +1459,7 @@ class LoadEagerFromAliasOption(PropertyOption):
         else:
             if paths[-1].contains(query, "path_with_polymorphic"):
                 with_poly_info = paths[-1].get(query, "path_with_polymorphic")
-                adapter = orm_util.ORMAdapter(
-                            with_poly_info.entity,
-                            equivalents=prop.mapper._equivalent_columns,
-                            adapt_required=True)
+                adapter = with_poly_info._eager_adapter(prop.mapper)
             else:
                 adapter = query._polymorphic_adapters.get(prop.mapper, None)
             paths[-1].set(query, "user_defined_eager_row_processor",
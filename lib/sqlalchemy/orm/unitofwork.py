@@ -12,6 +12,9 @@ organizes them in order of dependency, and executes.
 
 """
 
+from __future__ import with_statement
+
+import time
 from .. import util, event
 from ..util import topological
 from . import attributes, persistence, util as orm_util
@@ -104,7 +107,97 @@ def track_cascade_events(descriptor, prop):
     event.listen(descriptor, 'set', set_, raw=True, retval=True)
 
 
+class FlushProfile(object):
+    """Timings and statement counts collected during a flush.
+
+    A :class:`.FlushProfile` is collected when
+    :meth:`.UOWTransaction.enable_profile` is called on the
+    ``flush_context`` passed to the :meth:`.SessionEvents.before_flush`
+    event, and is available as the ``profile`` attribute of the
+    ``flush_context`` passed to :meth:`.SessionEvents.after_flush` and
+    :meth:`.SessionEvents.after_flush_postexec`::
+
+        @event.listens_for(Session, "before_flush")
+        def profile_flush(session, flush_context, instances):
+            flush_context.enable_profile()
+
+        @event.listens_for(Session, "after_flush_postexec")
+        def report_flush(session, flush_context):
+            profile = flush_context.profile
+            if sum(profile.timings.values()) > 1:
+                log.warn("slow flush: %s %s %s", profile.timings,
+                            profile.states, profile.statements)
+
+    ``timings`` is a dictionary of phase name to seconds:
+
+    * ``register`` - registration of the new, dirty and deleted
+      objects with the flush.
+    * ``generate_actions`` - cascades and other processing of each
+      relationship, and the assembly of the actions to perform.
+    * ``sort`` - ordering of the actions by dependency.
+    * ``execute`` - execution of the actions, including the
+      emitting of SQL.
+    * ``postfetch`` - the portion of ``execute`` spent applying
+      newly generated defaults and primary keys to objects.
+    * ``finalize`` - marking objects as clean or deleted; present
+      only for :meth:`.SessionEvents.after_flush_postexec`.
+
+    ``states`` is a dictionary of :class:`.Mapper` to the number of
+    objects of that mapper involved in the flush, and ``statements``
+    is a dictionary of ``(tablename, executemany)`` to the number of
+    statements executed against that table, where ``tablename``
+    includes the schema name if any, and ``executemany`` indicates
+    statements executed with multiple parameter sets.
+
+    .. versionadded:: 0.8.1
+
+    """
+
+    def __init__(self):
+        self.timings = {}
+        self.states = {}
+        self.statements = {}
+
+    def _add_time(self, phase, elapsed):
+        self.timings[phase] = self.timings.get(phase, 0) + elapsed
+
+    def _statement(self, table, executemany):
+        key = (table.fullname, executemany)
+        self.statements[key] = self.statements.get(key, 0) + 1
+
+    def __repr__(self):
+        return "FlushProfile(timings=%r, states=%r, statements=%r)" % (
+                    self.timings, self.states, self.statements)
+
+
+class _PhaseTimer(object):
+    """Add the time spent within a ``with`` block to a phase of
+    a :class:`.FlushProfile`."""
+
+    def __init__(self, profile, phase):
+        self.profile = profile
+        self.phase = phase
+
+    def __enter__(self):
+        self.start = time.time()
+
+    def __exit__(self, type_, value, traceback):
+        self.profile._add_time(self.phase, time.time() - self.start)
+
+
+class _NoTimer(object):
+    def __enter__(self):
+        pass
+
+    def __exit__(self, type_, value, traceback):
+        pass
+
+_no_timer = _NoTimer()
+
+
 class UOWTransaction(object):
+    profile = None
+
     def __init__(self, session):
         self.session = session
 
@@ -154,6 +247,28 @@ class UOWTransaction(object):
     def has_work(self):
         return bool(self.states)
 
+    def enable_profile(self):
+        """Collect a :class:`.FlushProfile` for this flush, as the
+        ``profile`` attribute.
+
+        Called within the :meth:`.SessionEvents.before_flush` event.
+
+        .. versionadded:: 0.8.1
+
+        """
+        self.profile = FlushProfile()
+        return self.profile
+
+    def _timed(self, phase):
+        """Return a context manager which adds the time spent within
+        it to the given phase of the profile, if this flush is
+        being profiled."""
+
+        if self.profile is None:
+            return _no_timer
+        else:
+            return _PhaseTimer(self.profile, phase)
+
     def is_deleted(self, state):
         """return true if the given state is marked as deleted
         within this uowtransaction."""
@@ -348,7 +463,12 @@ class UOWTransaction(object):
                 ).difference(cycles)
 
     def execute(self):
-        postsort_actions = self._generate_actions()
+        with self._timed('generate_actions'):
+            postsort_actions = self._generate_actions()
+
+        if self.profile is not None:
+            for mapper, states in self.mappers.iteritems():
+                self.profile.states[mapper] = len(states)
 
         #sort = topological.sort(self.dependencies, postsort_actions)
         #print "--------------"
@@ -359,17 +479,23 @@ class UOWTransaction(object):
 
         # execute
         if self.cycles:
-            for set_ in topological.sort_as_subsets(
+            with self._timed('sort'):
+                sort = list(topological.sort_as_subsets(
                                             self.dependencies,
-                                            postsort_actions):
-                while set_:
-                    n = set_.pop()
-                    n.execute_aggregate(self, set_)
+                                            postsort_actions))
+            with self._timed('execute'):
+                for set_ in sort:
+                    while set_:
+                        n = set_.pop()
+                        n.execute_aggregate(self, set_)
         else:
-            for rec in topological.sort(
-                                    self.dependencies,
-                                    postsort_actions):
-                rec.execute(self)
+            with self._timed('sort'):
+                sort = list(topological.sort(
+                                        self.dependencies,
+                                        postsort_actions))
+            with self._timed('execute'):
+                for rec in sort:
+                    rec.execute(self)
 
     def finalize_flush_changes(self):
         """mark processed objects as clean / deleted after a successful
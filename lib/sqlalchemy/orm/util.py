@@ -674,6 +674,38 @@ class AliasedInsp(_InspectionAttr):
         else:
             return PathRegistry.per_mapper(self)
 
+    @util.memoized_property
+    def _column_adapter(self):
+        """A :class:`.ColumnAdapter` against this alias, shared among
+        all :class:`.Query` objects which select from it."""
+
+        return sql_util.ColumnAdapter(
+                    self.selectable,
+                    self.mapper._equivalent_columns)
+
+    @util.memoized_property
+    def _eager_adapters(self):
+        return {}
+
+    def _eager_adapter(self, mapper):
+        """Return an :class:`.ORMAdapter` used to adapt the columns of
+        the given mapper to this alias when it's the target of an
+        eager load.
+
+        The adapter is cached per mapper, so that eager loads against
+        the same :func:`.with_polymorphic` construct don't redo the
+        adaptation of each column for every :class:`.Query`.
+
+        """
+        try:
+            return self._eager_adapters[mapper]
+        except KeyError:
+            adapter = self._eager_adapters[mapper] = ORMAdapter(
+                            self.entity,
+                            equivalents=mapper._equivalent_columns,
+                            adapt_required=True)
+            return adapter
+
     def _entity_for_mapper(self, mapper):
         self_poly = self.with_polymorphic_mappers
         if mapper in self_poly:
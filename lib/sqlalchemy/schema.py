@@ -33,7 +33,7 @@ import inspect
 from . import exc, util, dialects, event, events, inspection
 from .sql import expression, visitors
 
-ddl = util.importlater("sqlalchemy.engine", "ddl")
+ddl = util.importlater("sqlalchemy.engine", "ddl", lazy=True)
 sqlutil = util.importlater("sqlalchemy.sql", "util")
 url = util.importlater("sqlalchemy.engine", "url")
 sqltypes = util.importlater("sqlalchemy", "types")
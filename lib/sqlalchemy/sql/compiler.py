@@ -161,6 +161,24 @@ COMPOUND_KEYWORDS = {
 }
 
 
+class _AnonMap(dict):
+    """Generates names for anonymous labels within a single compilation.
+
+    Keys are the ``"<ident> <derived>"`` tokens embedded in
+    :class:`._anonymous_label` strings; a missing key is assigned
+    the next available ``<derived>_<counter>`` name, with the counter
+    for each derived name stored in the same dictionary.
+
+    """
+
+    def __missing__(self, key):
+        derived = key.split(' ', 1)[1]
+        anonymous_counter = self.get(derived, 1)
+        self[derived] = anonymous_counter + 1
+        self[key] = value = derived + "_" + str(anonymous_counter)
+        return value
+
+
 class _CompileLabel(visitors.Visitable):
     """lightweight label object which acts as an expression.Label."""
 
@@ -172,18 +190,15 @@ class _CompileLabel(visitors.Visitable):
         self.name = name
         self._alt_names = (col,) + alt_names
 
+        # type and quote are copied up front as these
+        # are consulted for every label rendered
+        self.type = col.type
+        self.quote = col.quote
+
     @property
     def proxy_set(self):
         return self.element.proxy_set
 
-    @property
-    def type(self):
-        return self.element.type
-
-    @property
-    def quote(self):
-        return self.element.quote
-
 
 class SQLCompiler(engine.Compiled):
     """Default implementation of Compiled.
@@ -220,6 +235,17 @@ class SQLCompiler(engine.Compiled):
     columns with the table name (i.e. MySQL only)
     """
 
+    # for a single-row INSERT, the column parameters and rendered
+    # "(<binds>)" VALUES clause, from which _insert_values is
+    # established when an executemany() is rendered as multiple-row
+    # INSERT statements.
+    _insert_values_params = None
+
+    # names of "expanding" bound parameters present in the statement;
+    # each is rendered as a token which the execution context replaces
+    # with one parameter per element of the sequence passed.
+    _expanding_binds = ()
+
     ansi_bind_rules = False
     """SQL 92 doesn't allow bind parameters to be used
     in the columns clause of a SELECT, nor does it allow
@@ -281,7 +307,7 @@ class SQLCompiler(engine.Compiled):
 
         # a map which tracks "anonymous" identifiers that are created on
         # the fly here
-        self.anon_map = util.PopulateDict(self._process_anon)
+        self.anon_map = _AnonMap()
 
         # a map which tracks "truncated" names based on
         # dialect.label_length or dialect.max_identifier_length
@@ -322,6 +348,18 @@ class SQLCompiler(engine.Compiled):
                  if value is not None
             )
 
+    @util.memoized_property
+    def _positional_bind_processors(self):
+        """A list of (index, processor) tuples for those positions
+        in ``positiontup`` which have a bind processor."""
+
+        processors = self._bind_processors
+        return [
+                (index, processors[key])
+                for index, key in enumerate(self.positiontup)
+                if key in processors
+            ]
+
     def is_subquery(self):
         return len(self.stack) > 1
 
@@ -412,7 +450,7 @@ class SQLCompiler(engine.Compiled):
                                     within_label_clause=True,
                                     **kw) + \
                         OPERATORS[operators.as_] + \
-                        self.preparer.format_label(label, labelname)
+                        self.preparer.quote(labelname, label.quote)
         else:
             return label.element._compiler_dispatch(self,
                                     within_columns_clause=False,
@@ -437,28 +475,41 @@ class SQLCompiler(engine.Compiled):
                 column.type
             )
 
-        if is_literal:
-            name = self.escape_literal_column(name)
-        else:
-            name = self.preparer.quote(name, column.quote)
-
         table = column.table
         if table is None or not include_table or not table.named_with_column:
-            return name
-        else:
-            if table.schema:
-                schema_prefix = self.preparer.quote_schema(
-                                    table.schema,
-                                    table.quote_schema) + '.'
+            if is_literal:
+                return self.escape_literal_column(name)
             else:
-                schema_prefix = ''
-            tablename = table.name
-            if isinstance(tablename, sql._truncated_label):
-                tablename = self._truncated_identifier("alias", tablename)
+                return self.preparer.quote(name, column.quote)
 
-            return schema_prefix + \
-                    self.preparer.quote(tablename, table.quote) + \
-                    "." + name
+        schema = table.schema
+        if schema:
+            quote_schema = table.quote_schema
+        else:
+            quote_schema = None
+        tablename = table.name
+        if isinstance(tablename, sql._truncated_label):
+            tablename = self._truncated_identifier("alias", tablename)
+
+        if is_literal:
+            return self.preparer._format_table_name(
+                                schema, quote_schema,
+                                tablename, table.quote) + \
+                    "." + self.escape_literal_column(name)
+
+        # the fully qualified, quoted name is memoized by the preparer
+        key = (schema, quote_schema, tablename, table.quote,
+                                    name, column.quote)
+        qualified_names = self.preparer._qualified_names
+        try:
+            return qualified_names[key]
+        except KeyError:
+            qualified_names[key] = qualified = \
+                    self.preparer._format_table_name(
+                                    schema, quote_schema,
+                                    tablename, table.quote) + \
+                    "." + self.preparer.quote(name, column.quote)
+            return qualified
 
     def escape_literal_column(self, text):
         """provide escaping for the literal_column() construct."""
@@ -514,12 +565,110 @@ class SQLCompiler(engine.Compiled):
             sep = " "
         else:
             sep = OPERATORS[clauselist.operator]
+        if visitors._is_chained(clauselist):
+            return self._render_nested(clauselist, kwargs)
         return sep.join(
                     s for s in
                     (c._compiler_dispatch(self, **kwargs)
                     for c in clauselist.clauses)
                     if s)
 
+    @util.memoized_property
+    def _generic_nested_visits(self):
+        """The visit names among clauselist, grouping, unary and binary
+        whose visit methods aren't overridden by this compiler's class."""
+
+        cls = self.__class__
+        return frozenset(
+                    name for name in ('clauselist', 'grouping',
+                                        'unary', 'binary')
+                    if util.methods_equivalent(
+                            getattr(cls, 'visit_%s' % name),
+                            getattr(SQLCompiler, 'visit_%s' % name)))
+
+    def _nested_rendering(self, elem, kw, root=False):
+        """Return a ``(children, child_kw, render)`` tuple for an element
+        which :meth:`_render_nested` can render without recursion, or
+        None if the element is to be dispatched as usual.
+
+        ``render`` receives the compiled children, and produces the
+        same string as the element's visit method would.  ``root``
+        indicates the element is already being rendered by the
+        visit method of this class.
+
+        """
+        visit_name = elem.__visit_name__
+        if not root and (
+                visit_name not in self._generic_nested_visits or
+                hasattr(elem, '_compiler_dispatcher')):
+            return None
+        elif visit_name == 'clauselist':
+            if elem.operator is None:
+                sep = " "
+            else:
+                sep = OPERATORS[elem.operator]
+            return elem.clauses, kw, \
+                    lambda parts: sep.join(s for s in parts if s)
+        elif visit_name == 'grouping':
+            kw = kw.copy()
+            kw.pop('asfrom', None)
+            return (elem.element, ), kw, \
+                    lambda parts: "(" + parts[0] + ")"
+        elif visit_name == 'unary':
+            if elem.operator and not elem.modifier and \
+                    not hasattr(self, "visit_%s_unary_operator" %
+                                        elem.operator.__name__):
+                opstring = OPERATORS[elem.operator]
+                return (elem.element, ), kw, \
+                        lambda parts: opstring + parts[0]
+            elif elem.modifier and not elem.operator and \
+                    not hasattr(self, "visit_%s_unary_modifier" %
+                                        elem.modifier.__name__):
+                opstring = OPERATORS[elem.modifier]
+                return (elem.element, ), kw, \
+                        lambda parts: parts[0] + opstring
+        elif not hasattr(self, "visit_%s_binary" % elem.operator.__name__):
+            if self.ansi_bind_rules and \
+                    isinstance(elem.left, sql.BindParameter) and \
+                    isinstance(elem.right, sql.BindParameter):
+                kw = dict(kw, literal_binds=True)
+            opstring = OPERATORS[elem.operator]
+            return (elem.left, elem.right), kw, \
+                    lambda parts: parts[0] + opstring + parts[1]
+        return None
+
+    def _render_nested(self, element, kw):
+        """Render a structure of nested lists, groupings, unary and
+        binary expressions, such as a long chain of ``and_()`` /
+        ``or_()`` or ``a + b - c``, using an explicit stack rather
+        than recursion.
+
+        Each element renders the same as it would via its visit method;
+        elements which aren't rendered generically, including those
+        with a custom compilation established by
+        :mod:`sqlalchemy.ext.compiler`, are dispatched as usual.
+
+        """
+        children, kw, render = self._nested_rendering(element, kw,
+                                                        root=True)
+        stack = [(iter(children), kw, render, [])]
+        while True:
+            children, kw, render, parts = stack[-1]
+            for child in children:
+                nested = self._nested_rendering(child, kw)
+                if nested is not None:
+                    children, child_kw, child_render = nested
+                    stack.append((iter(children), child_kw,
+                                    child_render, []))
+                    break
+                parts.append(child._compiler_dispatch(self, **kw))
+            else:
+                stack.pop()
+                text = render(parts)
+                if not stack:
+                    return text
+                stack[-1][3].append(text)
+
     def visit_case(self, clause, **kwargs):
         x = "CASE "
         if clause.value is not None:
@@ -655,6 +804,8 @@ class SQLCompiler(engine.Compiled):
         disp = getattr(self, "visit_%s_binary" % operator.__name__, None)
         if disp:
             return disp(binary, operator, **kw)
+        elif visitors._is_chained(binary):
+            return self._render_nested(binary, kw)
         else:
             return self._generate_generic_binary(binary,
                                 OPERATORS[operator], **kw)
@@ -778,6 +929,8 @@ class SQLCompiler(engine.Compiled):
             if bindparam.value is None:
                 raise exc.CompileError("Bind parameter without a "
                                         "renderable value not allowed here.")
+            if bindparam.expanding:
+                return self._expanding_literal_bindparam(bindparam, **kwargs)
             return self.render_literal_bindparam(bindparam,
                             within_columns_clause=True, **kwargs)
 
@@ -807,8 +960,37 @@ class SQLCompiler(engine.Compiled):
 
         self.binds[bindparam.key] = self.binds[name] = bindparam
 
+        if bindparam.expanding:
+            return self._render_expanding_bindparam(name, bindparam, **kwargs)
+
         return self.bindparam_string(name, quote=bindparam.quote, **kwargs)
 
+    def _render_expanding_bindparam(self, name, bindparam,
+                                positional_names=None, **kw):
+        if self.dialect.paramstyle == 'numeric':
+            raise exc.CompileError(
+                    "Expanding bind parameters are not supported "
+                    "with the 'numeric' paramstyle.")
+        if name not in self._expanding_binds:
+            self._expanding_binds += (name, )
+        if self.positional:
+            if positional_names is not None:
+                positional_names.append(name)
+            else:
+                self.positiontup.append(name)
+        return "([EXPANDING_%s])" % name
+
+    def _expanding_literal_bindparam(self, bindparam, **kw):
+        processor = bindparam.type._cached_bind_processor(self.dialect)
+        values = bindparam.value
+        if processor:
+            values = [processor(value) for value in values]
+        if not values:
+            return "(NULL)"
+        return "(%s)" % ", ".join(
+                        self.render_literal_value(value, bindparam.type)
+                        for value in values)
+
     def render_literal_bindparam(self, bindparam, **kw):
         value = bindparam.value
         processor = bindparam.type._cached_bind_processor(self.dialect)
@@ -856,7 +1038,10 @@ class SQLCompiler(engine.Compiled):
         if (ident_class, name) in self.truncated_names:
             return self.truncated_names[(ident_class, name)]
 
-        anonname = name.apply_map(self.anon_map)
+        if isinstance(name, sql._anonymous_label):
+            anonname = name.apply_map(self.anon_map)
+        else:
+            anonname = name
 
         if len(anonname) > self.label_length:
             counter = self.truncated_names.get(ident_class, 1)
@@ -871,12 +1056,6 @@ class SQLCompiler(engine.Compiled):
     def _anonymize(self, name):
         return name % self.anon_map
 
-    def _process_anon(self, key):
-        (ident, derived) = key.split(' ', 1)
-        anonymous_counter = self.anon_map.get(derived, 1)
-        self.anon_map[derived] = anonymous_counter + 1
-        return derived + "_" + str(anonymous_counter)
-
     def bindparam_string(self, name, quote=None,
                         positional_names=None, **kw):
         if self.positional:
@@ -1055,10 +1234,8 @@ class SQLCompiler(engine.Compiled):
         else:
             result_expr = col_expr
 
-        column_clause_args.update(
-                    within_columns_clause=within_columns_clause,
-                    add_to_result_map=add_to_result_map
-                )
+        column_clause_args['within_columns_clause'] = within_columns_clause
+        column_clause_args['add_to_result_map'] = add_to_result_map
         return result_expr._compiler_dispatch(
                        self,
                         **column_clause_args
@@ -1264,10 +1441,9 @@ class SQLCompiler(engine.Compiled):
                         fromhints=None, **kwargs):
         if asfrom or ashint:
             if getattr(table, "schema", None):
-                ret = self.preparer.quote_schema(table.schema,
-                                table.quote_schema) + \
-                                "." + self.preparer.quote(table.name,
-                                                table.quote)
+                ret = self.preparer._format_table_name(
+                                table.schema, table.quote_schema,
+                                table.name, table.quote)
             else:
                 ret = self.preparer.quote(table.name, table.quote)
             if fromhints and table in fromhints:
@@ -1362,14 +1538,55 @@ class SQLCompiler(engine.Compiled):
                             )
                         )
         else:
-            text += " VALUES (%s)" % \
-                     ', '.join([c[1] for c in colparams])
+            values_clause = "(%s)" % ', '.join([c[1] for c in colparams])
+            text += " VALUES " + values_clause
+            if not self.returning and \
+                    self.dialect.supports_multivalues_insert:
+                self._insert_values_params = colparams, values_clause
 
         if self.returning and not self.returning_precedes_values:
             text += " " + returning_clause
 
         return text
 
+    @util.memoized_property
+    def _insert_values(self):
+        """Return the rendered "(<binds>)" VALUES clause of a single-row
+        INSERT and the names of its bound parameters in order, if each
+        element of the clause is a plain bound parameter and there are
+        no other bound parameters in the statement; else
+        ``(None, None)``."""
+
+        if self._insert_values_params is None:
+            return None, None
+        colparams, values_clause = self._insert_values_params
+
+        if len(self.bind_names) != len(colparams) or \
+                self.dialect.paramstyle == 'numeric':
+            return None, None
+        if self.positional:
+            placeholder = self.bindtemplate % {'name': None}
+            if len(self.positiontup) != len(colparams) or \
+                    [c[1] for c in colparams if c[1] != placeholder]:
+                return None, None
+            names = tuple(self.positiontup)
+        else:
+            placeholders = dict(
+                        (self.bindtemplate % {'name': name}, name)
+                        for name in self.bind_names.itervalues())
+            names = tuple([placeholders.get(c[1]) for c in colparams])
+            if None in names:
+                return None, None
+        return values_clause, names
+
+    @property
+    def _insert_values_clause(self):
+        return self._insert_values[0]
+
+    @property
+    def _insert_values_names(self):
+        return self._insert_values[1]
+
     def update_limit_clause(self, update_stmt):
         """Provide a hook for MySQL to add LIMIT to the UPDATE"""
         return None
@@ -2297,6 +2514,11 @@ class IdentifierPreparer(object):
 
     illegal_initial_characters = ILLEGAL_INITIAL_CHARACTERS
 
+    # number of entries retained in each of the memos of
+    # force-quoted identifiers, qualified table names and
+    # qualified column names
+    identifier_cache_size = 1000
+
     def __init__(self, dialect, initial_quote='"',
                     final_quote=None, escape_quote='"', omit_schema=False):
         """Construct a new ``IdentifierPreparer`` object.
@@ -2319,7 +2541,15 @@ class IdentifierPreparer(object):
         self.escape_quote = escape_quote
         self.escape_to_quote = self.escape_quote * 2
         self.omit_schema = omit_schema
+
+        # memoized renderings of identifiers; these live as long
+        # as the preparer, which is replaced whenever the dialect
+        # changes its quoting rules.  The memos keyed on
+        # combinations of names are bounded.
         self._strings = {}
+        self._forced_strings = util.LRUCache(self.identifier_cache_size)
+        self._table_names = util.LRUCache(self.identifier_cache_size)
+        self._qualified_names = util.LRUCache(self.identifier_cache_size)
 
     def _escape_identifier(self, value):
         """Escape an identifier.
@@ -2377,10 +2607,37 @@ class IdentifierPreparer(object):
                     self._strings[ident] = ident
                 return self._strings[ident]
         elif force:
-            return self.quote_identifier(ident)
+            try:
+                return self._forced_strings[ident]
+            except KeyError:
+                self._forced_strings[ident] = quoted = \
+                                    self.quote_identifier(ident)
+                return quoted
         else:
             return ident
 
+    def _format_table_name(self, schema, quote_schema, name, quote):
+        """Return the quoted name of a table, qualified by the quoted
+        schema name if one is given.
+
+        The result is memoized per preparer, retaining the most
+        recently used ``identifier_cache_size`` names.
+
+        """
+        key = (schema, quote_schema, name, quote)
+        try:
+            return self._table_names[key]
+        except KeyError:
+            pass
+
+        if schema:
+            result = self.quote_schema(schema, quote_schema) + \
+                                "." + self.quote(name, quote)
+        else:
+            result = self.quote(name, quote)
+        self._table_names[key] = result
+        return result
+
     def format_sequence(self, sequence, use_schema=True):
         name = self.quote(sequence.name, sequence.quote)
         if not self.omit_schema and use_schema and \
@@ -2406,12 +2663,12 @@ class IdentifierPreparer(object):
 
         if name is None:
             name = table.name
-        result = self.quote(name, table.quote)
         if not self.omit_schema and use_schema \
             and getattr(table, "schema", None):
-            result = self.quote_schema(table.schema, table.quote_schema) + \
-                                "." + result
-        return result
+            return self._format_table_name(table.schema,
+                                table.quote_schema, name, table.quote)
+        else:
+            return self.quote(name, table.quote)
 
     def format_schema(self, name, quote):
         """Prepare a quoted schema name."""
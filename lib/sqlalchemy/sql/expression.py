@@ -34,7 +34,8 @@ from operator import attrgetter
 from .. import util, exc, inspection
 from . import operators
 from .operators import ColumnOperators
-from .visitors import Visitable, cloned_traverse
+from .visitors import Visitable, cloned_traverse, iterate_postorder, \
+    _is_chained
 import operator
 
 functions = util.importlater("sqlalchemy.sql", "functions")
@@ -1026,7 +1027,7 @@ def table(name, *columns):
 
 
 def bindparam(key, value=NO_ARG, type_=None, unique=False, required=NO_ARG,
-                        quote=None, callable_=None):
+                        quote=None, callable_=None, expanding=False):
     """Create a bind parameter clause with the given key.
 
         :param key:
@@ -1083,6 +1084,25 @@ def bindparam(key, value=NO_ARG, type_=None, unique=False, required=NO_ARG,
           currently known as a SQLAlchemy reserved word; this currently
           only applies to the Oracle backend.
 
+        :param expanding:
+          if True, this parameter will be treated as an "expanding" parameter
+          at execution time; the parameter value is expected to be a sequence,
+          rather than a scalar value, and the string SQL statement will
+          be transformed on a per-execution basis to accommodate the sequence
+          with a variable number of parameter slots passed to the DBAPI.
+          This allows a statement that uses an IN clause to be compiled
+          once, regardless of how many values are passed::
+
+            stmt = select([table]).\\
+                where(table.c.id.in_(bindparam('ids', expanding=True)))
+
+            conn.execute(stmt, ids=[1, 2, 3])
+
+          An expanding parameter may not be used with an
+          "executemany"-style execution.
+
+          .. versionadded:: 0.8.1
+
     """
     if isinstance(key, ColumnClause):
         type_ = key.type
@@ -1094,7 +1114,7 @@ def bindparam(key, value=NO_ARG, type_=None, unique=False, required=NO_ARG,
     return BindParameter(key, value, type_=type_,
                             callable_=callable_,
                             unique=unique, required=required,
-                            quote=quote)
+                            quote=quote, expanding=expanding)
 
 
 def outparam(key, type_=None):
@@ -1204,6 +1224,13 @@ def text(text, bind=None, *args, **kwargs):
       the result set.   This argument applies to any expression
       that returns result sets.
 
+    The names of the bind parameters located within a given string are
+    cached, as is the compiled form of a :func:`text` construct which
+    specifies neither ``bindparams`` nor ``typemap`` nor any execution
+    options; a loop which creates and executes the same :func:`text`
+    statement repeatedly parses and compiles the string only once per
+    dialect.
+
     """
     return TextClause(text, bind=bind, *args, **kwargs)
 
@@ -1467,6 +1494,27 @@ def _from_objects(*elements):
     return itertools.chain(*[element._from_objects for element in elements])
 
 
+def _has_nested_from_objects(element):
+    # elements whose _from_objects are those of their children
+    return isinstance(element, (ClauseList, BinaryExpression,
+                                Grouping, UnaryExpression)) and \
+            not isinstance(element, (Exists, ScalarSelect))
+
+
+def _nested_from_objects(element):
+    """Return the _from_objects of a structure of nested
+    :class:`.ClauseList`, :class:`.BinaryExpression`,
+    :class:`.Grouping` or :class:`.UnaryExpression` objects
+    without recursion."""
+
+    froms = []
+    for elem, descended in iterate_postorder(element,
+                                        _has_nested_from_objects):
+        if not descended:
+            froms.extend(elem._from_objects)
+    return froms
+
+
 def _labeled(element):
     if not hasattr(element, 'name'):
         return element.label(None)
@@ -1659,6 +1707,12 @@ class ClauseElement(Visitable):
     is_selectable = False
     is_clause_element = True
 
+    # if True, _copy_internals() clones exactly the elements returned
+    # by get_children(), so that cloned_traverse() and
+    # replacement_traverse() may clone nested elements of this kind
+    # using an explicit stack instead of recursion.
+    _iterate_children = False
+
     def _clone(self):
         """Create a shallow copy of this ClauseElement.
 
@@ -2092,6 +2146,13 @@ class _DefaultColumnComparator(operators.ColumnOperators):
         elif isinstance(seq_or_selectable, (Selectable, TextClause)):
             return self._boolean_compare(expr, op, seq_or_selectable,
                                   negate=negate_op, **kw)
+        elif isinstance(seq_or_selectable, BindParameter) and \
+                seq_or_selectable.expanding:
+            if isinstance(seq_or_selectable.type, sqltypes.NullType):
+                seq_or_selectable = seq_or_selectable._clone()
+                seq_or_selectable.type = expr.type
+            return self._boolean_compare(expr, op, seq_or_selectable,
+                                  negate=negate_op)
 
         # Handle non selectable arguments as sequences
         args = []
@@ -2895,7 +2956,7 @@ class BindParameter(ColumnElement):
     def __init__(self, key, value, type_=None, unique=False,
                             callable_=None,
                             isoutparam=False, required=False,
-                            quote=None,
+                            quote=None, expanding=False,
                             _compared_to_operator=None,
                             _compared_to_type=None):
         """Construct a BindParameter.
@@ -2943,6 +3004,11 @@ class BindParameter(ColumnElement):
           if True, the parameter should be treated like a stored procedure
           "OUT" parameter.
 
+        :param expanding:
+          if True, the parameter value is a sequence which is expanded
+          into individual parameters at execution time; see
+          :func:`.bindparam`.
+
         """
         if unique:
             self.key = _anonymous_label('%%(%d %s)s' % (id(self), key
@@ -2966,6 +3032,7 @@ class BindParameter(ColumnElement):
         self.isoutparam = isoutparam
         self.required = required
         self.quote = quote
+        self.expanding = expanding
         if type_ is None:
             if _compared_to_type is not None:
                 self.type = \
@@ -3111,6 +3178,11 @@ class Executable(Generative):
                 "'compiled_cache' execution option may only be specified "
                 "on Connection.execution_options(), not per statement."
             )
+        if kw.get('multivalues_page_size') is not None and \
+                kw['multivalues_page_size'] < 1:
+            raise exc.ArgumentError(
+                "'multivalues_page_size' execution option must be "
+                "a positive integer or None.")
         self._execution_options = self._execution_options.union(kw)
 
     def execute(self, *multiparams, **params):
@@ -3183,6 +3255,14 @@ class TextClause(Executable, ClauseElement):
 
     _hide_froms = []
 
+    # names of the bind parameters located within each string
+    # passed to text(), keyed on the string
+    _bind_names_cache = util.LRUCache(500)
+
+    # True if the compiled form of this construct depends only on
+    # its string, allowing it to be shared via the dialect
+    _is_template = False
+
     def __init__(
         self,
         text='',
@@ -3194,6 +3274,7 @@ class TextClause(Executable, ClauseElement):
         self._bind = bind
         self.bindparams = {}
         self.typemap = typemap
+        self._is_template = bindparams is None and typemap is None
         if autocommit is not None:
             util.warn_deprecated('autocommit on text() is deprecated.  '
                                  'Use .execution_options(autocommit=Tru'
@@ -3205,14 +3286,17 @@ class TextClause(Executable, ClauseElement):
             for key in typemap.keys():
                 typemap[key] = sqltypes.to_instance(typemap[key])
 
-        def repl(m):
-            self.bindparams[m.group(1)] = bindparam(m.group(1))
-            return ':%s' % m.group(1)
-
         # scan the string and search for bind parameter names, add them
         # to the list of bindparams
-
-        self.text = self._bind_params_regex.sub(repl, text)
+        try:
+            bind_names = self._bind_names_cache[text]
+        except KeyError:
+            bind_names = self._bind_names_cache[text] = \
+                    tuple(self._bind_params_regex.findall(text))
+        for name in bind_names:
+            self.bindparams[name] = bindparam(name)
+
+        self.text = text
         if bindparams is not None:
             for b in bindparams:
                 self.bindparams[b.key] = b
@@ -3234,7 +3318,31 @@ class TextClause(Executable, ClauseElement):
         else:
             return self
 
+    def _compiler(self, dialect, **kw):
+        templates = getattr(dialect, '_text_templates', None)
+        if templates is None or not self._is_template or \
+                kw.get('bind') is not None or \
+                kw.get('compile_kwargs') or \
+                self._execution_options is not \
+                    TextClause._execution_options:
+            return dialect.statement_compiler(dialect, self, **kw)
+
+        try:
+            template = templates[self.text]
+        except KeyError:
+            compiled = templates[self.text] = \
+                        dialect.statement_compiler(dialect, self, **kw)
+            return compiled
+
+        # the compiled form is shared among TextClause objects of
+        # the same text; each gets a copy referring to itself.
+        compiled = template.__class__.__new__(template.__class__)
+        compiled.__dict__.update(template.__dict__)
+        compiled.statement = self
+        return compiled
+
     def _copy_internals(self, clone=_clone, **kw):
+        self._is_template = False
         self.bindparams = dict((b.key, clone(b, **kw))
                                for b in self.bindparams.values())
 
@@ -3296,6 +3404,7 @@ class ClauseList(ClauseElement):
 
     """
     __visit_name__ = 'clauselist'
+    _iterate_children = True
 
     def __init__(self, *clauses, **kwargs):
         self.operator = kwargs.pop('operator', operators.comma_op)
@@ -3330,15 +3439,25 @@ class ClauseList(ClauseElement):
                                 self_group(against=self.operator))
         else:
             self.clauses.append(_literal_as_text(clause))
+        ClauseList._chained._reset(self)
 
     def _copy_internals(self, clone=_clone, **kw):
         self.clauses = [clone(clause, **kw) for clause in self.clauses]
+        ClauseList._chained._reset(self)
 
     def get_children(self, **kwargs):
         return self.clauses
 
+    @util.memoized_property
+    def _chained(self):
+        # if stale, _from_objects is the same either way; only
+        # the use of recursion differs
+        return _is_chained(self)
+
     @property
     def _from_objects(self):
+        if self._chained:
+            return _nested_from_objects(self)
         return list(itertools.chain(*[c._from_objects for c in self.clauses]))
 
     def self_group(self, against=None):
@@ -3679,6 +3798,7 @@ class UnaryExpression(ColumnElement):
 
     """
     __visit_name__ = 'unary'
+    _iterate_children = True
 
     def __init__(self, element, operator=None, modifier=None,
                             type_=None, negate=None):
@@ -3745,6 +3865,7 @@ class BinaryExpression(ColumnElement):
     """
 
     __visit_name__ = 'binary'
+    _iterate_children = True
 
     def __init__(self, left, right, operator, type_=None,
                     negate=None, modifiers=None):
@@ -3774,13 +3895,22 @@ class BinaryExpression(ColumnElement):
     def is_comparison(self):
         return operators.is_comparison(self.operator)
 
+    @util.memoized_property
+    def _chained(self):
+        # if stale, _from_objects is the same either way; only
+        # the use of recursion differs
+        return _is_chained(self)
+
     @property
     def _from_objects(self):
+        if self._chained:
+            return _nested_from_objects(self)
         return self.left._from_objects + self.right._from_objects
 
     def _copy_internals(self, clone=_clone, **kw):
         self.left = clone(self.left, **kw)
         self.right = clone(self.right, **kw)
+        BinaryExpression._chained._reset(self)
 
     def get_children(self, **kwargs):
         return self.left, self.right
@@ -4168,6 +4298,7 @@ class Grouping(ColumnElement):
     """Represent a grouping within a column expression"""
 
     __visit_name__ = 'grouping'
+    _iterate_children = True
 
     def __init__(self, element):
         self.element = element
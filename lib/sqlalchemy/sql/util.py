@@ -536,7 +536,15 @@ def _deep_annotate(element, annotations, exclude=None):
     Elements within the exclude collection will be cloned but not annotated.
 
     """
-    def clone(elem):
+    # annotated copies of nested lists and binaries, created from
+    # the bottom up and consumed by the parent's _copy_internals()
+    pending = {}
+
+    def descend(elem):
+        return getattr(elem, '_iterate_children', False) and \
+                id(elem) not in pending
+
+    def annotate(elem):
         if exclude and \
                     hasattr(elem, 'proxy_set') and \
                     elem.proxy_set.intersection(exclude):
@@ -548,6 +556,17 @@ def _deep_annotate(element, annotations, exclude=None):
         newelem._copy_internals(clone=clone)
         return newelem
 
+    def clone(elem):
+        if id(elem) in pending:
+            return pending.pop(id(elem))
+        elif elem._iterate_children and visitors._is_chained(elem):
+            for e, descended in visitors.iterate_postorder(elem, descend):
+                if descended:
+                    pending[id(e)] = annotate(e)
+            return pending.pop(id(elem))
+        else:
+            return annotate(elem)
+
     if element is not None:
         element = clone(element)
     return element
@@ -558,6 +577,22 @@ def _deep_deannotate(element, values=None):
 
     cloned = util.column_dict()
 
+    # deannotated copies of nested lists and binaries, created from
+    # the bottom up and consumed by the parent's _copy_internals()
+    pending = {}
+
+    def descend(elem):
+        return getattr(elem, '_iterate_children', False) and \
+                id(elem) not in pending and \
+                (values or elem not in cloned)
+
+    def deannotate(elem):
+        newelem = elem._deannotate(values=values, clone=True)
+        newelem._copy_internals(clone=clone)
+        if not values:
+            cloned[elem] = newelem
+        return newelem
+
     def clone(elem):
         # if a values dict is given,
         # the elem must be cloned each time it appears,
@@ -565,12 +600,17 @@ def _deep_deannotate(element, values=None):
         # elements that are remaining.  if totally
         # removing all annotations, can assume the same
         # slate...
-        if values or elem not in cloned:
-            newelem = elem._deannotate(values=values, clone=True)
-            newelem._copy_internals(clone=clone)
-            if not values:
-                cloned[elem] = newelem
-            return newelem
+        if id(elem) in pending:
+            return pending.pop(id(elem))
+        elif values or elem not in cloned:
+            if elem._iterate_children and visitors._is_chained(elem):
+                for e, descended in visitors.iterate_postorder(
+                                                elem, descend):
+                    if descended:
+                        pending[id(e)] = deannotate(e)
+                return pending.pop(id(elem))
+            else:
+                return deannotate(elem)
         else:
             return cloned[elem]
 
@@ -29,8 +29,8 @@ import operator
 
 __all__ = ['VisitableType', 'Visitable', 'ClauseVisitor',
     'CloningVisitor', 'ReplacingCloningVisitor', 'iterate',
-    'iterate_depthfirst', 'traverse_using', 'traverse',
-    'cloned_traverse', 'replacement_traverse']
+    'iterate_depthfirst', 'iterate_postorder', 'traverse_using',
+    'traverse', 'cloned_traverse', 'replacement_traverse']
 
 
 class VisitableType(type):
@@ -227,6 +227,51 @@ def iterate_depthfirst(obj, opts):
     return iter(traversal)
 
 
+def iterate_postorder(obj, descend):
+    """traverse the given expression structure, returning an iterator
+    of ``(element, descended)`` tuples.
+
+    traversal is depth-first, yielding each element after its children,
+    and uses an explicit stack rather than recursion, so that deeply
+    nested structures such as long chains of ``and_()`` / ``or_()``
+    can be traversed.  The children of ``obj`` are always traversed;
+    the children of any other element are traversed only if
+    ``descend(element)`` returns True, in which case ``descended`` is
+    True for that element.
+
+    """
+    stack = [(obj, iter(obj.get_children()))]
+    while stack:
+        elem, children = stack[-1]
+        for child in children:
+            if descend(child):
+                stack.append((child, iter(child.get_children())))
+                break
+            yield child, False
+        else:
+            stack.pop()
+            yield elem, True
+
+
+def _is_chained(elem):
+    """Return True if the given element, which has the
+    ``_iterate_children`` flag set, directly contains an element of the
+    same kind, or a grouping of one, as in ``or_(or_(a, b), c)``,
+    ``and_(or_(a, and_(b, c)), d)`` or ``a - (b - c)``.
+
+    Traversals use an explicit stack for such structures, which may be
+    arbitrarily deep, and plain recursion otherwise.
+
+    """
+    visit_name = elem.__visit_name__
+    for child in elem.get_children():
+        if child.__visit_name__ == visit_name or (
+                child.__visit_name__ == 'grouping' and
+                child.element.__visit_name__ == visit_name):
+            return True
+    return False
+
+
 def traverse_using(iterator, obj, visitors):
     """visit the given expression structure using the given iterator of
     objects.
@@ -262,16 +307,34 @@ def cloned_traverse(obj, opts, visitors):
     cloned = util.column_dict()
     stop_on = util.column_set(opts.get('stop_on', []))
 
+    def descend(elem):
+        return getattr(elem, '_iterate_children', False) and \
+                id(elem) not in cloned and \
+                elem not in stop_on
+
+    def copy(elem):
+        cloned[id(elem)] = newelem = elem._clone()
+        newelem._copy_internals(clone=clone)
+        meth = visitors.get(newelem.__visit_name__, None)
+        if meth:
+            meth(newelem)
+
     def clone(elem):
         if elem in stop_on:
             return elem
         else:
             if id(elem) not in cloned:
-                cloned[id(elem)] = newelem = elem._clone()
-                newelem._copy_internals(clone=clone)
-                meth = visitors.get(newelem.__visit_name__, None)
-                if meth:
-                    meth(newelem)
+                if elem._iterate_children and _is_chained(elem):
+                    # copy nested lists and binaries from the
+                    # bottom up, so that _copy_internals() receives
+                    # already-cloned children
+                    for e, descended in iterate_postorder(elem, descend):
+                        if descended:
+                            copy(e)
+                        else:
+                            clone(e)
+                else:
+                    copy(elem)
             return cloned[id(elem)]
 
     if obj is not None:
@@ -286,19 +349,64 @@ def replacement_traverse(obj, opts, replace):
     cloned = util.column_dict()
     stop_on = util.column_set([id(x) for x in opts.get('stop_on', [])])
 
+    # results of replace() for elements which were checked
+    # ahead of time by descend(), consumed by clone()
+    replaced = {}
+
+    # copies of the other children of nested lists and binaries,
+    # made in the order they're encountered so that replace() sees
+    # elements in the same order as with recursion, and consumed
+    # in that same order by the parent's _copy_internals()
+    pending = {}
+
+    def descend(elem):
+        if not getattr(elem, '_iterate_children', False) or \
+            id(elem) in stop_on or \
+            'no_replacement_traverse' in elem._annotations or \
+            elem in cloned:
+            return False
+        replaced[id(elem)] = newelem = replace(elem)
+        return newelem is None
+
+    def clone_pending(elem, **kw):
+        if id(elem) in pending:
+            copies = pending[id(elem)]
+            newelem = copies.pop(0)
+            if not copies:
+                del pending[id(elem)]
+            return newelem
+        else:
+            return clone(elem, **kw)
+
     def clone(elem, **kw):
         if id(elem) in stop_on or \
             'no_replacement_traverse' in elem._annotations:
             return elem
         else:
-            newelem = replace(elem)
+            if id(elem) in replaced:
+                newelem = replaced.pop(id(elem))
+            else:
+                newelem = replace(elem)
             if newelem is not None:
                 stop_on.add(id(newelem))
                 return newelem
             else:
                 if elem not in cloned:
-                    cloned[elem] = newelem = elem._clone()
-                    newelem._copy_internals(clone=clone, **kw)
+                    if elem._iterate_children and _is_chained(elem):
+                        # copy nested lists and binaries from the
+                        # bottom up, so that _copy_internals() receives
+                        # already-cloned children
+                        for e, descended in iterate_postorder(elem, descend):
+                            if descended:
+                                cloned[e] = newelem = e._clone()
+                                newelem._copy_internals(
+                                            clone=clone_pending, **kw)
+                            else:
+                                pending.setdefault(id(e), []).append(
+                                                        clone(e, **kw))
+                    else:
+                        cloned[elem] = newelem = elem._clone()
+                        newelem._copy_internals(clone=clone, **kw)
                 return cloned[elem]
 
     if obj is not None:
@@ -7,6 +7,9 @@ in a more fine-grained way than nose's profiling plugin.
 
 import os
 import sys
+import shutil
+import subprocess
+import tempfile
 from .util import gc_collect, decorator
 from . import config
 from nose import SkipTest
@@ -245,39 +248,82 @@ def function_call_count(variance=0.05):
                 fn, *args, **kw
             )
             stats = load_stats()
-            callcount = stats.total_calls
-
-            expected = _profile_stats.result(callcount)
-            if expected is None:
-                expected_count = None
-            else:
-                line_no, expected_count = expected
-
-            print("Pstats calls: %d Expected %s" % (
-                    callcount,
-                    expected_count
-                )
-            )
             stats.print_stats()
             #stats.print_callers()
 
-            if expected_count:
-                deviance = int(callcount * variance)
-                if abs(callcount - expected_count) > deviance:
-                    raise AssertionError(
-                        "Adjusted function call count %s not within %s%% "
-                        "of expected %s. (Delete line %d of file %s to "
-                        "regenerate this callcount, when tests are run "
-                        "with --write-profiles.)"
-                        % (
-                        callcount, (variance * 100),
-                        expected_count, line_no,
-                        _profile_stats.fname))
+            _assert_call_count(stats.total_calls, variance)
             return fn_result
         return update_wrapper(wrap, fn)
     return decorate
 
 
+def subprocess_call_count(code, variance=0.05):
+    """Assert a target for the function call count of a code
+    string run within a new Python interpreter.
+
+    This is used to track the cost of operations that can only be
+    measured from a clean ``sys.modules``, such as ``import sqlalchemy``.
+    Callcounts are stored in the same file as those of
+    :func:`.function_call_count`, keyed to the current test.
+
+    """
+    if cProfile is None:
+        raise SkipTest("cProfile is not installed")
+
+    if not _profile_stats.has_stats() and not _profile_stats.write:
+        raise SkipTest("No profiling stats available on this "
+                    "platform for this function.  Run tests with "
+                    "--write-profiles to add statistics to %s for "
+                    "this platform." % _profile_stats.short_fname)
+
+    script = (
+        "import cProfile, pstats, sys\n"
+        "cProfile.run(%r, %r)\n"
+        "sys.stdout.write(str(pstats.Stats(%r).total_calls))\n"
+    )
+    tempdir = tempfile.mkdtemp()
+    filename = os.path.join(tempdir, "subprocess_call_count.prof")
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(sys.path)
+    try:
+        proc = subprocess.Popen(
+                [sys.executable, "-c", script % (code, filename, filename)],
+                stdout=subprocess.PIPE, env=env)
+        out = proc.communicate()[0]
+    finally:
+        shutil.rmtree(tempdir)
+    if proc.returncode != 0:
+        raise AssertionError("Subprocess for %r failed" % code)
+    _assert_call_count(int(out), variance)
+
+
+def _assert_call_count(callcount, variance):
+    expected = _profile_stats.result(callcount)
+    if expected is None:
+        expected_count = None
+    else:
+        line_no, expected_count = expected
+
+    print("Pstats calls: %d Expected %s" % (
+            callcount,
+            expected_count
+        )
+    )
+
+    if expected_count:
+        deviance = int(callcount * variance)
+        if abs(callcount - expected_count) > deviance:
+            raise AssertionError(
+                "Adjusted function call count %s not within %s%% "
+                "of expected %s. (Delete line %d of file %s to "
+                "regenerate this callcount, when tests are run "
+                "with --write-profiles.)"
+                % (
+                callcount, (variance * 100),
+                expected_count, line_no,
+                _profile_stats.fname))
+
+
 def _profile(fn, *args, **kw):
     filename = "%s.prof" % fn.__name__
 
@@ -359,7 +359,9 @@ class OrderedSet(set):
     __ior__ = update
 
     def union(self, other):
-        result = self.__class__(self)
+        result = self.__class__()
+        set.update(result, self)
+        result._list = list(self._list)
         result.update(other)
         return result
 
@@ -777,7 +779,10 @@ class LRUCache(dict):
 
     def __getitem__(self, key):
         item = dict.__getitem__(self, key)
-        item[2] = self._inc_counter()
+        # the counter is incremented inline, as this
+        # is called for every cache hit
+        self._counter += 1
+        item[2] = self._counter
         return item[1]
 
     def values(self):
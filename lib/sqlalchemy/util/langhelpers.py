@@ -660,7 +660,8 @@ class group_expirable_memoized_property(object):
         """Expire all memoized properties for *instance*."""
         stash = instance.__dict__
         for attribute in self.attributes:
-            stash.pop(attribute, None)
+            if attribute in stash:
+                del stash[attribute]
 
     def __call__(self, fn):
         self.attributes.append(fn.__name__)
@@ -690,20 +691,44 @@ class importlater(object):
     module import time, and not potentially within
     a non-main thread later on.
 
+    When ``lazy=True`` is passed, the object is not part of
+    resolve_all(); it is instead resolved by resolve_lazy(),
+    called for its package at a point where modules are already
+    imported on demand, such as create_engine() or
+    configure_mappers().  This is used for modules that
+    are only needed by less commonly used features, so that
+    ``import sqlalchemy`` and ``import sqlalchemy.orm`` don't
+    pay the cost of loading them up front.  A lazy object
+    accessed before then imports upon first attribute access.
+
     """
 
     _unresolved = set()
+    _lazy = set()
 
-    def __init__(self, path, addtl=None):
+    def __init__(self, path, addtl=None, lazy=False):
         self._il_path = path
         self._il_addtl = addtl
-        importlater._unresolved.add(self)
+        if lazy:
+            importlater._lazy.add(self)
+        else:
+            importlater._unresolved.add(self)
 
     @classmethod
     def resolve_all(cls):
         for m in list(importlater._unresolved):
             m._resolve()
 
+    @classmethod
+    def resolve_lazy(cls, package):
+        """Resolve the lazy importlater objects for modules
+        within the given package."""
+
+        for m in list(importlater._lazy):
+            if m._il_path == package or \
+                    m._il_path.startswith(package + "."):
+                m._resolve()
+
     @property
     def _full_path(self):
         if self._il_addtl:
@@ -719,6 +744,8 @@ class importlater(object):
                     "been called (this is %s %s)"
                     % (self._il_path, self._il_addtl))
 
+        if '_initial_import' not in self.__dict__:
+            self._resolve()
         m = self._initial_import
         if self._il_addtl:
             m = getattr(m, self._il_addtl)
@@ -729,6 +756,7 @@ class importlater(object):
 
     def _resolve(self):
         importlater._unresolved.discard(self)
+        importlater._lazy.discard(self)
         if self._il_addtl:
             self._initial_import = __import__(
                                 self._il_path, globals(), locals(),
@@ -20,21 +20,43 @@ def sort_as_subsets(tuples, allitems):
 
     todo = set(allitems)
 
-    while todo:
-        output = set()
-        for node in list(todo):
-            if not todo.intersection(edges[node]):
-                output.add(node)
-
-        if not output:
-            raise CircularDependencyError(
-                    "Circular dependency detected.",
-                    find_cycles(tuples, allitems),
-                    _gen_edges(edges)
-                )
-
+    # count the parents of each node which are themselves to be
+    # sorted; a node is output once all of those have been.
+    children = util.defaultdict(list)
+    count = {}
+    output = set()
+    for node in todo:
+        count[node] = 0
+        if node in edges:
+            for parent in edges[node]:
+                if parent in todo:
+                    children[parent].append(node)
+                    count[node] += 1
+        if not count[node]:
+            output.add(node)
+
+    while output:
         todo.difference_update(output)
+        next_ = set()
+        for node in output:
+            if node in children:
+                for child in children[node]:
+                    count[child] -= 1
+                    if not count[child]:
+                        next_.add(child)
         yield output
+        output = next_
+
+    if todo:
+        # only the remaining nodes can be part of a cycle
+        raise CircularDependencyError(
+                "Circular dependency detected.",
+                find_cycles(
+                    [(parent, node) for node in todo
+                        for parent in edges[node] if parent in todo],
+                    todo),
+                _gen_edges(edges)
+            )
 
 
 def sort(tuples, allitems):
@@ -8,7 +8,7 @@ class CompileTest(fixtures.TestBase, AssertsExecutionResults):
     @classmethod
     def setup_class(cls):
 
-        global t1, t2, metadata
+        global t1, t2, wide, metadata
         metadata = MetaData()
         t1 = Table('t1', metadata,
             Column('c1', Integer, primary_key=True),
@@ -18,6 +18,10 @@ class CompileTest(fixtures.TestBase, AssertsExecutionResults):
             Column('c1', Integer, primary_key=True),
             Column('c2', String(30)))
 
+        wide = Table('wide', metadata,
+            Column('id', Integer, primary_key=True),
+            *[Column('c%d' % i, String(30)) for i in range(50)])
+
         # do a "compile" ahead of time to load
         # deferred imports
         t1.insert().compile()
@@ -25,7 +29,7 @@ class CompileTest(fixtures.TestBase, AssertsExecutionResults):
         # go through all the TypeEngine
         # objects in use and pre-load their _type_affinity
         # entries.
-        for t in (t1, t2):
+        for t in (t1, t2, wide):
             for c in t.c:
                 c.type._type_affinity
         from sqlalchemy import types
@@ -72,4 +76,33 @@ class CompileTest(fixtures.TestBase, AssertsExecutionResults):
         def go():
             s = select([t1], t1.c.c2 == t2.c.c1).apply_labels()
             s.compile(dialect=self.dialect)
-        go()
\ No newline at end of file
+        go()
+
+    def test_select_wide_labels(self):
+        s = select([wide, t1.c.c1.label(None), func.count(t1.c.c2)],
+                    and_(*[wide.c['c%d' % i] == i for i in range(10)])
+                ).apply_labels()
+        s.compile(dialect=self.dialect)
+
+        @profiling.function_call_count()
+        def go():
+            s = select([wide, t1.c.c1.label(None), func.count(t1.c.c2)],
+                        and_(*[wide.c['c%d' % i] == i for i in range(10)])
+                    ).apply_labels()
+            s.compile(dialect=self.dialect)
+        go()
+
+    def test_select_generative(self):
+        def go():
+            s = select([t1])
+            for i in range(10):
+                s = s.where(t1.c.c1 == i)
+            s = s.order_by(t1.c.c2).column(t2.c.c1).\
+                    select_from(t1.join(t2, t1.c.c1 == t2.c.c1)).\
+                    limit(5).offset(3).distinct().apply_labels()
+        go()
+
+        @profiling.function_call_count()
+        def go2():
+            go()
+        go2()
@@ -0,0 +1,82 @@
+import os
+import subprocess
+import sys
+
+from sqlalchemy.testing import fixtures, profiling, eq_
+
+
+class ImportTest(fixtures.TestBase):
+    __requires__ = 'cpython',
+
+    def _loaded_modules(self, code):
+        script = (
+            "import sys\n"
+            "%s\n"
+            "sys.stdout.write(' '.join(sorted(\n"
+            "    k for k, v in sys.modules.items()\n"
+            "    if k.startswith('sqlalchemy') and v is not None)))\n"
+        ) % code
+        env = dict(os.environ)
+        env['PYTHONPATH'] = os.pathsep.join(sys.path)
+        proc = subprocess.Popen([sys.executable, "-c", script],
+                                stdout=subprocess.PIPE, env=env)
+        out = proc.communicate()[0]
+        eq_(proc.returncode, 0)
+        return set(out.split())
+
+    def test_core_defers_modules(self):
+        loaded = self._loaded_modules("import sqlalchemy")
+        assert 'sqlalchemy.engine.base' in loaded
+        for name in (
+                'sqlalchemy.engine.ddl',
+                'sqlalchemy.engine.threadlocal',
+                'sqlalchemy.orm',
+                'sqlalchemy.ext'):
+            assert name not in loaded, name
+
+    def test_orm_defers_modules(self):
+        loaded = self._loaded_modules("import sqlalchemy.orm")
+        assert 'sqlalchemy.orm.session' in loaded
+        for name in (
+                'sqlalchemy.orm.dependency',
+                'sqlalchemy.orm.dynamic',
+                'sqlalchemy.orm.evaluator'):
+            assert name not in loaded, name
+
+    def test_deferred_modules_load_on_use(self):
+        loaded = self._loaded_modules(
+            "from sqlalchemy import create_engine\n"
+            "create_engine('sqlite://', strategy='threadlocal')")
+        assert 'sqlalchemy.engine.threadlocal' in loaded
+
+    def test_create_engine_loads_deferred_modules(self):
+        loaded = self._loaded_modules(
+            "from sqlalchemy import create_engine\n"
+            "create_engine('sqlite://')")
+        for name in (
+                'sqlalchemy.engine.ddl',
+                'sqlalchemy.engine.threadlocal'):
+            assert name in loaded, name
+        assert 'sqlalchemy.orm' not in loaded
+
+    def test_configure_mappers_loads_deferred_modules(self):
+        loaded = self._loaded_modules(
+            "from sqlalchemy import MetaData, Table, Column, Integer\n"
+            "from sqlalchemy.orm import mapper, configure_mappers\n"
+            "t = Table('t', MetaData(), Column('id', Integer, "
+            "primary_key=True))\n"
+            "class T(object):\n"
+            "    pass\n"
+            "mapper(T, t)\n"
+            "configure_mappers()")
+        for name in (
+                'sqlalchemy.orm.dependency',
+                'sqlalchemy.orm.evaluator'):
+            assert name in loaded, name
+
+    def test_import_sqlalchemy(self):
+        profiling.subprocess_call_count("import sqlalchemy", variance=0.10)
+
+    def test_import_sqlalchemy_orm(self):
+        profiling.subprocess_call_count("import sqlalchemy.orm",
+                                        variance=0.10)
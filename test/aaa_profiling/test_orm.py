@@ -1,7 +1,9 @@
 from sqlalchemy.testing import eq_, assert_raises, \
     assert_raises_message
-from sqlalchemy import exc as sa_exc, util, Integer, String, ForeignKey
+from sqlalchemy import exc as sa_exc, util, Integer, String, ForeignKey, \
+    event
 from sqlalchemy.orm import exc as orm_exc, mapper, relationship, \
+    aliased, with_polymorphic, joinedload, \
     sessionmaker, Session
 from sqlalchemy import testing
 from sqlalchemy.testing import profiling
@@ -258,3 +260,158 @@ class MergeBackrefsTest(fixtures.MappedTest):
             s.merge(a)
 
 
+class QueryAdaptationTest(fixtures.MappedTest):
+    """test overhead of adapting columns to polymorphic and
+    aliased selectables when constructing queries."""
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table('companies', metadata,
+            Column('id', Integer, primary_key=True),
+            Column('name', String(50))
+        )
+        Table('people', metadata,
+            Column('id', Integer, primary_key=True),
+            Column('company_id', Integer, ForeignKey('companies.id')),
+            Column('name', String(50)),
+            Column('type', String(30))
+        )
+        Table('engineers', metadata,
+            Column('id', Integer, ForeignKey('people.id'),
+                                primary_key=True),
+            Column('language', String(50))
+        )
+        Table('managers', metadata,
+            Column('id', Integer, ForeignKey('people.id'),
+                                primary_key=True),
+            Column('budget', Integer)
+        )
+
+    @classmethod
+    def setup_classes(cls):
+        class Company(cls.Basic):
+            pass
+        class Person(cls.Basic):
+            pass
+        class Engineer(Person):
+            pass
+        class Manager(Person):
+            pass
+
+    @classmethod
+    def setup_mappers(cls):
+        Company, Person, Engineer, Manager = cls.classes.Company, \
+                    cls.classes.Person, cls.classes.Engineer, \
+                    cls.classes.Manager
+        companies, people, engineers, managers = cls.tables.companies, \
+                    cls.tables.people, cls.tables.engineers, \
+                    cls.tables.managers
+        mapper(Company, companies, properties={
+            'people': relationship(Person)
+        })
+        mapper(Person, people, polymorphic_on=people.c.type,
+                            polymorphic_identity='person',
+                            with_polymorphic='*')
+        mapper(Engineer, engineers, inherits=Person,
+                            polymorphic_identity='engineer')
+        mapper(Manager, managers, inherits=Person,
+                            polymorphic_identity='manager')
+
+    def test_polymorphic_and_aliased_query(self):
+        Company, Person = self.classes.Company, self.classes.Person
+        pa = aliased(Person)
+        wp = with_polymorphic(Person, '*', aliased=True)
+        sess = Session()
+
+        def go():
+            sess.query(Person).filter(Person.name == 'x').\
+                    with_labels().statement
+            sess.query(pa).filter(pa.name == 'x').with_labels().statement
+            sess.query(Company).options(
+                    joinedload(Company.people.of_type(wp))).\
+                    with_labels().statement
+        go()
+
+        @profiling.function_call_count()
+        def go2():
+            go()
+        go2()
+
+
+class EventOverheadTest(fixtures.MappedTest):
+    """test overhead of attribute sets and object loads, with and
+    without event listeners established."""
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table('parent', metadata,
+            Column('id', Integer, primary_key=True),
+            Column('data', String(20))
+        )
+
+    @classmethod
+    def setup_classes(cls):
+        class Parent(cls.Basic):
+            pass
+
+    @classmethod
+    def setup_mappers(cls):
+        Parent, parent = cls.classes.Parent, cls.tables.parent
+
+        mapper(Parent, parent)
+
+    @classmethod
+    def insert_data(cls):
+        parent = cls.tables.parent
+
+        parent.insert().execute([
+            {'id': i, 'data': 'p%d' % i}
+            for i in xrange(1, 101)
+        ])
+
+    def _listeners(self):
+        Parent = self.classes.Parent
+
+        @event.listens_for(Parent.data, "set")
+        def set_(target, value, oldvalue, initiator):
+            pass
+
+        @event.listens_for(Parent, "load")
+        def load(target, context):
+            pass
+
+    def _test_attribute_set(self):
+        Parent = self.classes.Parent
+
+        sess = Session()
+        parents = sess.query(Parent).all()
+
+        @profiling.function_call_count()
+        def go():
+            for p in parents:
+                p.data = 'x'
+        go()
+
+    def _test_load(self):
+        Parent = self.classes.Parent
+
+        sess = Session()
+
+        @profiling.function_call_count()
+        def go():
+            sess.query(Parent).all()
+        go()
+
+    def test_attribute_set(self):
+        self._test_attribute_set()
+
+    def test_attribute_set_with_listeners(self):
+        self._listeners()
+        self._test_attribute_set()
+
+    def test_load(self):
+        self._test_load()
+
+    def test_load_with_listeners(self):
+        self._listeners()
+        self._test_load()
@@ -41,6 +41,15 @@ class ResultSetTest(fixtures.TestBase, AssertsExecutionResults):
     def test_unicode(self):
         [tuple(row) for row in t2.select().execute().fetchall()]
 
+    def test_repeated_compiled_execute(self):
+        compiled = t.select().limit(1).compile(bind=testing.db)
+        testing.db.execute(compiled).first()
+
+        @profiling.function_call_count()
+        def go():
+            testing.db.execute(compiled).first()
+        go()
+
     def test_contains_doesnt_compile(self):
         row = t.select().execute().first()
         c1 = Column('some column', Integer) + Column("some other column", Integer)
@@ -74,6 +83,31 @@ class ExecutionTest(fixtures.TestBase):
             e.execute("select 1")
         go()
 
+    def test_executemany_parameters(self):
+        import datetime
+        e = create_engine('sqlite://')
+        m = MetaData()
+        t = Table('t', m,
+                Column('id', Integer, primary_key=True),
+                Column('data', String(50)),
+                Column('ts', DateTime),
+                *[Column('field%d' % fnum, Unicode(50))
+                    for fnum in range(NUM_FIELDS)])
+        m.create_all(e)
+        c = e.connect()
+        rows = [dict([('data', 'd%d' % r_num),
+                    ('ts', datetime.datetime(2013, 5, 1, 12, 0, 0))] +
+                    [('field%d' % fnum, u'value%d' % fnum)
+                        for fnum in range(NUM_FIELDS)])
+                for r_num in range(NUM_RECORDS)]
+        ins = t.insert()
+        c.execute(ins, rows[0:2])
+
+        @profiling.function_call_count()
+        def go():
+            c.execute(ins, rows)
+        go()
+
 
 class RowProxyTest(fixtures.TestBase):
     __requires__ = 'cpython',
@@ -134,6 +134,36 @@ class DependencySortTest(fixtures.TestBase):
         tuples = [(i, i + 1) for i in range(0, 1500, 2)]
         self.assert_sort(tuples)
 
+    def test_large_chain_sort(self):
+        tuples = [(i, i + 1) for i in range(20000)]
+        eq_(list(topological.sort(tuples, range(20001))), range(20001))
+
+    def test_sort_as_subsets(self):
+        tuples = [
+            ('a', 'b'), ('a', 'c'), ('b', 'd'), ('c', 'd'),
+            ('d', 'e'), ('x', 'e'), ('q', 'a')
+        ]
+        eq_(
+            list(topological.sort_as_subsets(tuples,
+                        ['a', 'b', 'c', 'd', 'e', 'x', 'y'])),
+            [set(['a', 'x', 'y']), set(['b', 'c']), set(['d']), set(['e'])]
+        )
+
+    def test_raise_on_cycle_after_subsets(self):
+        tuples = [
+            ('a', 'b'), ('b', 'c'), ('c', 'd'), ('d', 'c'), ('d', 'e'),
+        ]
+        gen = topological.sort_as_subsets(tuples,
+                        ['a', 'b', 'c', 'd', 'e'])
+        eq_(gen.next(), set(['a']))
+        eq_(gen.next(), set(['b']))
+        try:
+            gen.next()
+            assert False
+        except exc.CircularDependencyError, err:
+            eq_(err.cycles, set(['c', 'd']))
+            eq_(err.edges, set(tuples))
+
     def test_ticket_1380(self):
 
         # ticket:1380 regression: would raise a KeyError
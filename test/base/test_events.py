@@ -154,6 +154,35 @@ class EventsTest(fixtures.TestBase):
                 _empty_listeners[self.Target]
         )
 
+    def test_clslevel_after_instance_dispatch(self):
+        canary = []
+
+        def listen_one(x, y):
+            canary.append('one')
+
+        def listen_two(x, y):
+            canary.append('two')
+
+        t1 = self.Target()
+        t2 = self.Target()
+        event.listen(t2, "event_one", listen_two)
+        t1.dispatch.event_one(5, 6)
+        t2.dispatch.event_one(5, 6)
+        eq_(canary, ['two'])
+
+        # class level listeners are picked up by the already
+        # compiled instance level collections
+        event.listen(self.Target, "event_one", listen_one)
+        assert t1.dispatch.event_one
+        eq_(len(t2.dispatch.event_one), 2)
+        t1.dispatch.event_one(5, 6)
+        t2.dispatch.event_one(5, 6)
+        eq_(canary, ['two', 'one', 'one', 'two'])
+
+        self.Target.dispatch.event_one.remove(listen_one, self.Target)
+        assert not t1.dispatch.event_one
+        eq_(list(t2.dispatch.event_one), [listen_two])
+
     def test_immutable_methods(self):
         t1 = self.Target()
         for meth in [
@@ -509,6 +538,28 @@ class JoinTest(fixtures.TestBase):
         element.run_event(2)
         element.run_event(3)
 
+    def test_child_class_apply_after(self):
+        l1, c1 = self._listener()
+        l2, c2 = self._listener()
+
+        element = self.TargetFactory().create()
+        element.run_event(1)
+
+        event.listen(self.TargetElement, "event_one", l2)
+        element.run_event(2)
+
+        event.listen(self.TargetElement, "event_one", l1)
+        element.run_event(3)
+
+        eq_(
+            c1,
+            [(element, 3)]
+        )
+        eq_(
+            c2,
+            [(element, 2), (element, 3)]
+        )
+
     def test_parent_class_only(self):
         _listener, canary = self._listener()
 
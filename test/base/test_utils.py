@@ -192,6 +192,13 @@ class OrderedSetTest(fixtures.TestBase):
         eq_(o.intersection(iter([3, 4, 6])), util.OrderedSet([3, 4]))
         eq_(o.union(iter([3, 4, 6])), util.OrderedSet([2, 3, 4, 5, 6]))
 
+    def test_union_copies(self):
+        o = util.OrderedSet([3, 2, 4])
+        u = o.union([5, 2, 1])
+        eq_(list(u), [3, 2, 4, 5, 1])
+        eq_(list(o), [3, 2, 4])
+        assert u._list is not o._list
+
 
 class FrozenDictTest(fixtures.TestBase):
 
@@ -238,6 +245,26 @@ class MemoizedAttrTest(fixtures.TestBase):
         eq_(f1.bar(), 20)
         eq_(val[0], 21)
 
+    def test_group_expirable_memoized_property(self):
+        val = [20]
+        group = util.group_expirable_memoized_property(['bat'])
+
+        class Foo(object):
+            @group
+            def bar(self):
+                v = val[0]
+                val[0] += 1
+                return v
+
+        f1 = Foo()
+        eq_(f1.bar, 20)
+        f1.bat = 5
+        group.expire_instance(f1)
+        assert 'bar' not in f1.__dict__
+        assert 'bat' not in f1.__dict__
+        group.expire_instance(f1)
+        eq_(f1.bar, 21)
+
 
 class ColumnCollectionTest(fixtures.TestBase):
 
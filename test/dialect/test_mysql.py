@@ -1364,6 +1364,73 @@ class SQLTest(fixtures.TestBase, AssertsCompiledSQL):
             ')ENGINE=InnoDB')
 
 
+class MySQLDBExecutionTest(fixtures.TestBase):
+
+    def _cursor(self, rowcount):
+        class Cursor(object):
+            def __init__(self):
+                self.executed = []
+                self.rowcount = rowcount
+
+            def execute(self, stmt, params):
+                self.executed.append(('execute', stmt, params))
+                self.rowcount = len(params) // 2
+
+            def executemany(self, stmt, params):
+                self.executed.append(('executemany', stmt, params))
+                return len(params)
+        return Cursor()
+
+    def _context(self, dialect, page_size):
+        from sqlalchemy.dialects.mysql import mysqldb
+        t = Table('t', MetaData(), Column('id', Integer),
+                                Column('data', String(30)))
+        context = mysqldb.MySQLExecutionContext_mysqldb.__new__(
+                                mysqldb.MySQLExecutionContext_mysqldb)
+        context.compiled = t.insert().compile(dialect=dialect)
+        context.isinsert = True
+        context.execution_options = {'multivalues_page_size': page_size}
+        context.dialect = dialect
+        context.unicode_statement = unicode(context.compiled)
+        context.statement = dialect._encoder(context.unicode_statement)[0]
+        return context
+
+    def test_rowcount_from_cursor(self):
+        from sqlalchemy.dialects.mysql import mysqldb
+        context = self._context(mysqldb.dialect(), None)
+        context.cursor = self._cursor(3)
+        eq_(context.rowcount, 3)
+
+    def test_executemany_rowcount(self):
+        from sqlalchemy.dialects.mysql import mysqldb
+        dialect = mysqldb.dialect()
+        context = self._context(dialect, None)
+        context.cursor = cursor = self._cursor(-1)
+        dialect.do_executemany(cursor, context.statement,
+                        [(1, 'a'), (2, 'b')], context)
+        eq_([meth for meth, stmt, params in cursor.executed],
+                        ['executemany'])
+        eq_(context.rowcount, 2)
+
+    def test_executemany_multivalues(self):
+        from sqlalchemy.dialects.mysql import mysqldb
+        dialect = mysqldb.dialect()
+        context = self._context(dialect, 2)
+        context.cursor = cursor = self._cursor(-1)
+        dialect.do_executemany(cursor, context.statement,
+                        [(1, 'a'), (2, 'b'), (3, 'c')], context)
+        eq_(
+            cursor.executed,
+            [
+                ('execute', 'INSERT INTO t (id, data) VALUES '
+                        '(%s, %s), (%s, %s)', (1, 'a', 2, 'b')),
+                ('execute', 'INSERT INTO t (id, data) VALUES '
+                        '(%s, %s)', (3, 'c'))
+            ]
+        )
+        eq_(context.rowcount, 3)
+
+
 class SQLModeDetectionTest(fixtures.TestBase):
     __only_on__ = 'mysql'
 
@@ -597,6 +597,175 @@ class CompiledCacheTest(fixtures.TestBase):
         assert len(cache) == 1
         eq_(conn.execute("select count(*) from users").scalar(), 3)
 
+class ResultCacheTest(fixtures.TestBase):
+    __requires__ = ('sqlite', )
+
+    def setup(self):
+        self.engine = engine = testing_engine('sqlite://')
+        m = MetaData()
+        self.table = t = Table('test', m,
+            Column('x', Integer, primary_key=True),
+            Column('y', String(50, convert_unicode='force'))
+        )
+        m.create_all(engine)
+        engine.execute(t.insert(), [
+            {'x': i, 'y': "t_%d" % i} for i in xrange(1, 6)
+        ])
+        self.statements = statements = []
+
+        @event.listens_for(engine, "before_cursor_execute")
+        def go(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+    def test_hit(self):
+        t = self.table
+        cache = _result.LRUResultCache()
+        stmt = select([t]).where(t.c.x > bindparam('x')).\
+                    execution_options(result_cache=cache)
+
+        r1 = self.engine.execute(stmt, x=2).fetchall()
+        r2 = self.engine.execute(stmt, x=2)
+        assert isinstance(r2, _result.CachedResultProxy)
+        r2 = r2.fetchall()
+        eq_(r1, [(3, "t_3"), (4, "t_4"), (5, "t_5")])
+        eq_(r2, r1)
+        eq_(len(self.statements), 1)
+
+        # processed values are stored, and are not processed again
+        eq_(r2[0][t.c.y], u"t_3")
+        assert isinstance(r2[0]['y'], unicode)
+
+    def test_miss_on_parameters(self):
+        t = self.table
+        cache = _result.LRUResultCache()
+        stmt = select([t.c.x]).where(t.c.x > bindparam('x')).\
+                    execution_options(result_cache=cache)
+
+        eq_(self.engine.execute(stmt, x=3).fetchall(), [(4, ), (5, )])
+        eq_(self.engine.execute(stmt, x=4).fetchall(), [(5, )])
+        eq_(self.engine.execute(stmt, x=3).fetchall(), [(4, ), (5, )])
+        eq_(len(self.statements), 2)
+
+    def test_cache_key(self):
+        t = self.table
+        cache = _result.LRUResultCache()
+        conn = self.engine.connect().execution_options(result_cache=cache)
+
+        eq_(conn.execute(select([t.c.x]).where(t.c.x == 1).
+                    execution_options(cache_key='somekey')).scalar(), 1)
+        eq_(conn.execute(select([t.c.x]).where(t.c.x == 2).
+                    execution_options(cache_key='somekey')).scalar(), 1)
+        eq_(len(self.statements), 1)
+        eq_(cache.get('somekey'), ([('x', None)], [(1, )]))
+
+    def test_cache_key_statement_only(self):
+        assert_raises_message(
+            tsa.exc.ArgumentError,
+            "'cache_key' execution option may only be specified "
+            "on a statement.",
+            self.engine.connect().execution_options, cache_key='somekey'
+        )
+        assert_raises_message(
+            tsa.exc.ArgumentError,
+            "'cache_key' execution option may only be specified "
+            "on a statement.",
+            self.engine.execution_options, cache_key='somekey'
+        )
+
+    def test_hit_creates_no_cursor(self):
+        t = self.table
+        cache = _result.LRUResultCache()
+        stmt = select([t.c.x]).where(t.c.x == 1).\
+                    execution_options(result_cache=cache)
+        eq_(self.engine.execute(stmt).scalar(), 1)
+
+        canary = []
+        ctx_cls = self.engine.dialect.execution_ctx_cls
+
+        class ExecutionContext(ctx_cls):
+            def create_cursor(self):
+                canary.append(True)
+                return ctx_cls.create_cursor(self)
+        self.engine.dialect.execution_ctx_cls = ExecutionContext
+
+        r = self.engine.execute(stmt)
+        assert r.cursor is None
+        eq_(r.scalar(), 1)
+        eq_(canary, [])
+
+        eq_(self.engine.execute(stmt.where(t.c.x > 0)).scalar(), 1)
+        eq_(canary, [True])
+
+    def test_connectionless_close(self):
+        t = self.table
+        cache = _result.LRUResultCache()
+        stmt = select([t]).execution_options(result_cache=cache)
+
+        for i in range(2):
+            r = self.engine.execute(stmt)
+            assert not r.closed
+            eq_(len(r.fetchall()), 5)
+            assert r.closed
+            assert r.connection.closed
+
+    def test_no_rows_not_cached(self):
+        t = self.table
+        cache = _result.LRUResultCache()
+        conn = self.engine.connect().execution_options(result_cache=cache)
+
+        conn.execute(t.update().values(y='q'))
+        conn.execute(t.update().values(y='q'))
+        eq_(len(self.statements), 2)
+
+    def test_dml_not_cached(self):
+        t = self.table
+        cache = _result.LRUResultCache()
+        conn = self.engine.connect().execution_options(result_cache=cache)
+
+        # a row-returning result present under the key, as for
+        # an earlier "INSERT..RETURNING", is never delivered for
+        # statements which modify data
+        cache.set('somekey', ([('x', None)], [(1, )]))
+        conn.execute(t.update().values(y='q').
+                        execution_options(cache_key='somekey'))
+        conn.execute(t.insert().execution_options(cache_key='somekey'),
+                        x=10, y='q')
+        conn.execute(t.delete().where(t.c.x == 10).
+                        execution_options(cache_key='somekey'))
+        conn.execute("insert into test (x, y) values (?, 'q')", 20)
+        eq_(len(self.statements), 4)
+        eq_(self.engine.scalar(select([func.count(t.c.x)])), 6)
+
+    def test_unhashable_parameters_not_cached(self):
+        t = self.table
+        cache = _result.LRUResultCache()
+        stmt = select([t.c.x]).where(t.c.x > bindparam('x')).\
+                    execution_options(result_cache=cache)
+
+        class Unhashable(object):
+            __hash__ = None
+
+            def __conform__(self, protocol):
+                return 3
+
+        eq_(self.engine.execute(stmt, x=Unhashable()).fetchall(),
+                                [(4, ), (5, )])
+        eq_(self.engine.execute(stmt, x=Unhashable()).fetchall(),
+                                [(4, ), (5, )])
+        eq_(len(self.statements), 2)
+
+    def test_key_includes_url(self):
+        t = self.table
+        cache = _result.LRUResultCache()
+        stmt = select([t.c.x]).where(t.c.x == 1).\
+                    execution_options(result_cache=cache)
+
+        eq_(self.engine.execute(stmt).scalar(), 1)
+        other = testing_engine('sqlite:///:memory:')
+        t.metadata.create_all(other)
+        eq_(other.execute(stmt).scalar(), None)
+        eq_(len(self.statements), 1)
+
 class LogParamsTest(fixtures.TestBase):
     __only_on__ = 'sqlite'
     __requires__ = 'ad_hoc_engines',
@@ -860,6 +1029,66 @@ class MockStrategyTest(fixtures.TestBase):
             ["SEQUENCE", "TABLE"]
         )
 
+class BindProcessingTest(fixtures.TestBase):
+    __only_on__ = 'sqlite'
+
+    def _test_executemany(self, paramstyle):
+        class Upper(TypeDecorator):
+            impl = String
+
+            def process_bind_param(self, value, dialect):
+                return value.upper()
+
+        eng = create_engine(testing.db.url, paramstyle=paramstyle)
+        m = MetaData()
+        t = Table('bind_test', m,
+                Column('id', Integer, primary_key=True),
+                Column('a', Upper(20)),
+                Column('b', String(20)),
+                Column('c', Upper(20)))
+        conn = eng.connect()
+        m.create_all(conn)
+        try:
+            conn.execute(t.insert(), [
+                        {'id': i, 'a': 'a%d' % i, 'b': 'b%d' % i,
+                            'c': 'c%d' % i}
+                        for i in range(1, 4)])
+            conn.execute(t.update().where(t.c.id == bindparam('pk')),
+                        [{'pk': 2, 'c': 'x2'}, {'pk': 3, 'c': 'x3'}])
+            eq_(
+                conn.execute(t.select().order_by(t.c.id)).fetchall(),
+                [(1, 'A1', 'b1', 'C1'), (2, 'A2', 'b2', 'X2'),
+                    (3, 'A3', 'b3', 'X3')]
+            )
+        finally:
+            m.drop_all(conn)
+            conn.close()
+
+    def test_executemany_positional(self):
+        self._test_executemany('qmark')
+
+    def test_executemany_named(self):
+        self._test_executemany('named')
+
+    def test_positional_bind_processors(self):
+        class Upper(TypeDecorator):
+            impl = String
+
+            def process_bind_param(self, value, dialect):
+                return value.upper()
+
+        stmt = select([column('q')]).where(
+                    column('x', Upper) == bindparam('p1')).where(
+                    column('y', String) == bindparam('p2')).where(
+                    column('z', Upper) == bindparam('p3'))
+        compiled = stmt.compile(dialect=default.DefaultDialect(
+                                            paramstyle='qmark'))
+        eq_(
+            [index for index, proc in
+                compiled._positional_bind_processors],
+            [0, 2]
+        )
+
 class ResultProxyTest(fixtures.TestBase):
 
     def test_nontuple_row(self):
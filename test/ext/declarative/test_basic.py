@@ -2,7 +2,7 @@
 from sqlalchemy.testing import eq_, assert_raises, \
     assert_raises_message, is_
 from sqlalchemy.ext import declarative as decl
-from sqlalchemy import exc
+from sqlalchemy import exc, event
 import sqlalchemy as sa
 from sqlalchemy import testing
 from sqlalchemy import MetaData, Integer, String, ForeignKey, \
@@ -1411,6 +1411,89 @@ class DeclarativeTest(DeclarativeTestBase):
             ))
         )
 
+    def test_constructor_populates_state(self):
+        class User(Base, fixtures.ComparableEntity):
+            __tablename__ = 'users'
+
+            id = Column(Integer, primary_key=True)
+            name = Column(String(50))
+            addresses = relationship("Address", backref="user")
+
+        class Address(Base, fixtures.ComparableEntity):
+            __tablename__ = 'addresses'
+
+            id = Column(Integer, primary_key=True)
+            email = Column(String(50))
+            user_id = Column(Integer, ForeignKey('users.id'))
+
+            @sa.orm.validates('email')
+            def validate_email(self, key, value):
+                return value.upper()
+
+        Base.metadata.create_all()
+
+        a1 = Address(id=1, email='a1')
+        u1 = User(id=7, name='u1', addresses=[a1])
+        u2 = User()
+        u2.id = 7
+        u2.name = 'u1'
+        u2.addresses = [Address(id=1, email='a1')]
+
+        for o1, o2 in [(u1, u2), (a1, u2.addresses[0])]:
+            s1, s2 = sa.inspect(o1), sa.inspect(o2)
+            eq_(
+                dict((k, v) for k, v in s1.dict.items()
+                        if k != '_sa_instance_state'),
+                dict((k, v) for k, v in s2.dict.items()
+                        if k != '_sa_instance_state')
+            )
+            eq_(s1.committed_state, s2.committed_state)
+            eq_(s1.modified, s2.modified)
+        eq_(a1.email, 'A1')
+        is_(a1.user, u1)
+
+        sess = Session()
+        sess.add(u1)
+        sess.commit()
+        sess.close()
+        eq_(Session().query(User).one(),
+            User(id=7, name='u1', addresses=[Address(id=1, email='A1')]))
+
+    def test_constructor_set_listener(self):
+        class User(Base):
+            __tablename__ = 'users'
+
+            id = Column(Integer, primary_key=True)
+            name = Column(String(50))
+
+        canary = []
+
+        @event.listens_for(User.name, "set", retval=True)
+        def set_(target, value, oldvalue, initiator):
+            canary.append(value)
+            return value + ' set'
+
+        u1 = User(id=7, name='u1')
+        eq_(canary, ['u1'])
+        eq_(u1.name, 'u1 set')
+
+    def test_constructor_custom_setattr(self):
+        class User(Base):
+            __tablename__ = 'users'
+
+            id = Column(Integer, primary_key=True)
+            name = Column(String(50))
+
+            def __setattr__(self, key, value):
+                if key == 'name':
+                    value = value.upper()
+                super(User, self).__setattr__(key, value)
+
+        u1 = User(id=7, name='u1')
+        eq_(u1.name, 'U1')
+        u1.name = 'u2'
+        eq_(u1.name, 'U2')
+
 
 
 def _produce_test(inline, stringbased):
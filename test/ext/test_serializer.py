@@ -74,6 +74,11 @@ class SerializeTest(fixtures.MappedTest):
         assert serializer.loads(serializer.dumps(user_mapper, -1),
                                 None, None) is user_mapper
 
+    def test_mapper_property(self):
+        prop = class_mapper(User).get_property('addresses')
+        assert serializer.loads(serializer.dumps(prop, -1),
+                                None, None) is prop
+
     def test_attribute(self):
         assert serializer.loads(serializer.dumps(User.name, -1), None,
                                 None) is User.name
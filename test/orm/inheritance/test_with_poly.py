@@ -98,6 +98,18 @@ class _WithPolymorphicBase(_PolymorphicFixtureBase):
             ]
         )
 
+    def test_joinedload_of_type_repeated(self):
+        pa = with_polymorphic(Person, '*', aliased=True)
+
+        # the adapter for "pa" is shared among both queries
+        for i in range(2):
+            sess = create_session()
+            eq_(sess.query(Company).
+                    options(joinedload(Company.employees.of_type(pa))).
+                    order_by(Company.company_id).all(),
+                self._company_with_emps_fixture())
+
+
 class PolymorphicTest(_WithPolymorphicBase, _Polymorphic):
     pass
 
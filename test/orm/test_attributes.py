@@ -1420,9 +1420,15 @@ class HistoryTest(fixtures.TestBase):
         return Foo, Bar
 
     def _someattr_history(self, f, **kw):
-        return attributes.get_state_history(
-                    attributes.instance_state(f),
-                    'someattr', **kw)
+        state = attributes.instance_state(f)
+        history = attributes.get_state_history(state, 'someattr', **kw)
+
+        # has_changes() is a shortcut which must agree with the History
+        eq_(
+            f.__class__.someattr.impl.has_changes(state, state.dict, **kw),
+            history.has_changes()
+        )
+        return history
 
     def _commit_someattr(self, f):
         attributes.instance_state(f)._commit(attributes.instance_dict(f),
@@ -5,7 +5,7 @@ from sqlalchemy import Integer, String, ForeignKey, Sequence, \
 from sqlalchemy.testing.schema import Table, Column
 from sqlalchemy.orm import mapper, relationship, create_session, \
     sessionmaker, class_mapper, backref, Session, util as orm_util,\
-    configure_mappers
+    configure_mappers, Mapper
 from sqlalchemy.orm.attributes import instance_state
 from sqlalchemy.orm import attributes, exc as orm_exc, object_mapper
 from sqlalchemy import testing
@@ -2982,3 +2982,61 @@ class PartialFlushTest(fixtures.MappedTest):
         assert c1 not in sess.new
         assert c2 in sess.new
 
+
+
+class OrphanDetectionTest(_fixtures.FixtureTest):
+    """test that orphan detection during flush is limited to those
+    mappers which have delete-orphan relationships."""
+
+    run_inserts = None
+
+    def _fixture(self, cascade):
+        users, Address, addresses, User = (self.tables.users,
+                                self.classes.Address,
+                                self.tables.addresses,
+                                self.classes.User)
+
+        mapper(User, users, properties={
+            'addresses': relationship(Address, cascade=cascade)
+        })
+        mapper(Address, addresses)
+
+        checked = []
+        for cls in (User, Address):
+            m = class_mapper(cls)
+            def _is_orphan(state, m=m):
+                checked.append(m)
+                return Mapper._is_orphan(m, state)
+            m._is_orphan = _is_orphan
+        return checked
+
+    def test_no_orphan_check(self):
+        User, Address = self.classes.User, self.classes.Address
+
+        checked = self._fixture("save-update")
+        assert not class_mapper(User)._orphan_possible
+        assert not class_mapper(Address)._orphan_possible
+
+        sess = Session()
+        sess.add(User(name='u1', addresses=[Address(email_address='a1')]))
+        sess.flush()
+        eq_(checked, [])
+
+    def test_orphan_check_delete_orphan_only(self):
+        User, Address = self.classes.User, self.classes.Address
+
+        checked = self._fixture("all, delete-orphan")
+        assert not class_mapper(User)._orphan_possible
+        assert class_mapper(Address)._orphan_possible
+
+        sess = Session()
+        u1 = User(name='u1', addresses=[Address(email_address='a1')])
+        sess.add(u1)
+        sess.flush()
+        eq_(checked, [class_mapper(Address)])
+
+        a1 = u1.addresses[0]
+        u1.addresses.remove(a1)
+        sess.flush()
+        assert a1 not in sess
+        eq_(sess.query(Address).count(), 0)
@@ -284,6 +284,88 @@ class DynamicTest(_DynamicFixture, _fixtures.FixtureTest, AssertsCompiledSQL):
         u1.addresses.append(Address())
         eq_(u1.addresses[0], Address())
 
+    def test_windows(self):
+        User, Address = self._user_address_fixture()
+        sess = create_session()
+        u = sess.query(User).get(8)
+
+        eq_(
+            [[a.id for a in window] for window in u.addresses.windows(2)],
+            [[2, 3], [4]]
+        )
+        eq_(
+            [[a.id for a in window] for window in u.addresses.windows(3)],
+            [[2, 3, 4]]
+        )
+        eq_(list(sess.query(User).get(10).addresses.windows(2)), [])
+
+    def test_windows_configured_order_by(self):
+        addresses = self.tables.addresses
+        User, Address = self._user_address_fixture(
+                                    addresses_args={
+                                        "order_by":
+                                            addresses.c.email_address.desc()})
+        sess = create_session()
+        u = sess.query(User).get(8)
+
+        eq_(
+            [[a.email_address for a in window]
+                    for window in u.addresses.windows(1)],
+            [[u'ed@wood.com'], [u'ed@lala.com'], [u'ed@bettyboop.com']]
+        )
+
+    def test_windows_keyset_sql(self):
+        addresses = self.tables.addresses
+        User, Address = self._user_address_fixture(
+                                    addresses_args={
+                                        "order_by": addresses.c.email_address})
+        sess = create_session()
+        u = sess.query(User).get(8)
+
+        windows = u.addresses.windows(2)
+        self.assert_sql_count(testing.db, lambda: windows.next(), 1)
+
+        def go():
+            eq_(
+                [a.email_address for a in windows.next()],
+                [u'ed@wood.com']
+            )
+        self.assert_sql_execution(testing.db, go,
+            CompiledSQL(
+                "SELECT addresses.id AS addresses_id, addresses.user_id "
+                "AS addresses_user_id, addresses.email_address AS "
+                "addresses_email_address FROM addresses "
+                "WHERE :param_1 = addresses.user_id AND "
+                "(addresses.email_address > :email_address_1 OR "
+                "addresses.email_address = :email_address_2 AND "
+                "addresses.id > :id_1) ORDER BY addresses.email_address, "
+                "addresses.id LIMIT :param_2",
+                lambda ctx: [{'param_1': 8,
+                    'email_address_1': u'ed@lala.com',
+                    'email_address_2': u'ed@lala.com',
+                    'id_1': 4, 'param_2': 2}]
+            )
+        )
+
+    def test_windows_expunge(self):
+        User, Address = self._user_address_fixture()
+        sess = create_session()
+        u = sess.query(User).get(8)
+
+        windows = u.addresses.windows(2, expunge=True)
+        first = windows.next()
+        assert all(a in sess for a in first)
+        second = windows.next()
+        assert not any(a in sess for a in first)
+        eq_([a.id for a in second], [4])
+
+    def test_windows_transient(self):
+        User, Address = self._user_address_fixture()
+        u1 = User()
+        a1, a2, a3 = Address(), Address(), Address()
+        u1.addresses.extend([a1, a2, a3])
+        eq_(list(u1.addresses.windows(2)), [[a1, a2], [a3]])
+
     def test_custom_query(self):
         class MyQuery(Query):
             pass
@@ -17,6 +17,7 @@ from sqlalchemy.testing.assertsql import CompiledSQL
 from sqlalchemy.testing import fixtures
 from test.orm import _fixtures
 from sqlalchemy.util import OrderedDict as odict
+from sqlalchemy.orm.collections import ReadOnlyList
 import datetime
 
 
@@ -2664,3 +2665,231 @@ class CyclicalInheritingEagerTestTwo(fixtures.DeclarativeMappedTest,
         assert len(list(session)) == 3
 
 
+class ReadonlyCollectionTest(_fixtures.FixtureTest):
+    run_inserts = 'each'
+
+    def _mapping(self, **kw):
+        users, Address, addresses, User = (self.tables.users,
+                                self.classes.Address,
+                                self.tables.addresses,
+                                self.classes.User)
+
+        mapper(User, users, properties={
+            'addresses': relationship(mapper(Address, addresses),
+                                    backref='user', order_by=addresses.c.id,
+                                    **kw)
+        })
+        return User, Address
+
+    def _assert_readonly(self, user, expected):
+        eq_([a.id for a in user.addresses], expected)
+        assert isinstance(user.__dict__['addresses'], ReadOnlyList)
+        assert not sa.orm.attributes.instance_state(user).modified
+        eq_(
+            sa.orm.attributes.get_history(user, 'addresses'),
+            ((), list(user.addresses), ())
+        )
+
+    def test_query_joinedload(self):
+        User, Address = self._mapping()
+        sess = create_session()
+        users = sess.query(User).options(joinedload('addresses')).\
+                        readonly_collections().order_by(User.id).all()
+        self._assert_readonly(users[0], [1])
+        self._assert_readonly(users[1], [2, 3, 4])
+        self._assert_readonly(users[3], [])
+
+    def test_query_subqueryload(self):
+        User, Address = self._mapping()
+        sess = create_session()
+        users = sess.query(User).options(
+                        sa.orm.subqueryload('addresses')).\
+                        readonly_collections().order_by(User.id).all()
+        self._assert_readonly(users[1], [2, 3, 4])
+
+    def test_query_default_unaffected(self):
+        User, Address = self._mapping()
+        sess = create_session()
+        u = sess.query(User).options(joinedload('addresses')).\
+                        filter_by(id=8).one()
+        assert hasattr(u.__dict__['addresses'], '_sa_adapter')
+
+    def test_relationship_lazyload(self):
+        User, Address = self._mapping(readonly_collection=True)
+        sess = create_session()
+        u = sess.query(User).get(8)
+        self._assert_readonly(u, [2, 3, 4])
+
+    def test_relationship_joinedload(self):
+        User, Address = self._mapping(readonly_collection=True,
+                                            lazy='joined')
+        sess = create_session()
+        u = sess.query(User).filter_by(id=8).one()
+        self._assert_readonly(u, [2, 3, 4])
+
+    def test_new_object_instrumented(self):
+        User, Address = self._mapping(readonly_collection=True)
+        u = User(name='u1')
+        u.addresses.append(Address(email_address='a1'))
+        assert hasattr(u.__dict__['addresses'], '_sa_adapter')
+
+    def test_backref_upgrades(self):
+        User, Address = self._mapping(readonly_collection=True)
+        sess = create_session()
+        u = sess.query(User).get(8)
+        eq_(len(u.addresses), 3)
+
+        a = Address(email_address='new', user=u)
+        assert hasattr(u.__dict__['addresses'], '_sa_adapter')
+        eq_([x.id for x in u.addresses], [2, 3, 4, None])
+        eq_(
+            sa.orm.attributes.get_history(u, 'addresses')[0],
+            [a]
+        )
+        sess.flush()
+        sess.expunge_all()
+        eq_(len(sess.query(User).get(8).addresses), 4)
+
+    def test_assignment_upgrades(self):
+        User, Address = self._mapping(readonly_collection=True)
+        sess = create_session()
+        u = sess.query(User).get(8)
+        a2, a3, a4 = u.addresses
+
+        u.addresses = [a2, a4]
+        assert hasattr(u.__dict__['addresses'], '_sa_adapter')
+        eq_(
+            sa.orm.attributes.get_history(u, 'addresses'),
+            ([], [a2, a4], [a3])
+        )
+        assert a3.user is None
+        sess.flush()
+        sess.expunge_all()
+        eq_(
+            [a.id for a in sess.query(User).get(8).addresses],
+            [2, 4]
+        )
+
+    def test_delete_cascade(self):
+        User, Address = self._mapping(readonly_collection=True,
+                                        cascade="all, delete-orphan")
+        sess = create_session()
+        u = sess.query(User).get(8)
+        eq_(len(u.addresses), 3)
+        sess.delete(u)
+        sess.flush()
+        eq_(sess.query(Address).filter_by(user_id=8).count(), 0)
+
+    def test_append_upgrades(self):
+        User, Address = self._mapping(readonly_collection=True)
+        sess = create_session()
+        u = sess.query(User).get(8)
+        addresses = u.addresses
+        assert isinstance(addresses, ReadOnlyList)
+
+        a = Address(email_address='new')
+        addresses.append(a)
+        assert hasattr(u.__dict__['addresses'], '_sa_adapter')
+        eq_([x.id for x in u.addresses], [2, 3, 4, None])
+        assert a.user is u
+        eq_(
+            sa.orm.attributes.get_history(u, 'addresses')[0],
+            [a]
+        )
+        sess.flush()
+        sess.expunge_all()
+        eq_(len(sess.query(User).get(8).addresses), 4)
+
+    def test_list_mutators_upgrade(self):
+        User, Address = self._mapping(readonly_collection=True)
+        sess = create_session()
+        u = sess.query(User).get(8)
+        a2, a3, a4 = u.addresses
+
+        u.addresses += [Address(email_address='new')]
+        eq_(len(u.addresses), 4)
+        assert hasattr(u.__dict__['addresses'], '_sa_adapter')
+
+        u = sess.query(User).get(9)
+        sess.expire(u)
+        del u.addresses[0]
+        eq_(u.addresses, [])
+        eq_(
+            sa.orm.attributes.get_history(u, 'addresses')[2],
+            [Address(id=5)]
+        )
+
+    def test_sort_key_upgrades(self):
+        User, Address = self._mapping(readonly_collection=True)
+        sess = create_session()
+        u = sess.query(User).get(8)
+        a2, a3, a4 = u.addresses
+
+        u.addresses.sort(key=lambda a: a.id, reverse=True)
+        assert hasattr(u.__dict__['addresses'], '_sa_adapter')
+        eq_(u.addresses, [a4, a3, a2])
+
+    def test_compares_to_list(self):
+        User, Address = self._mapping(readonly_collection=True)
+        sess = create_session()
+        u = sess.query(User).get(8)
+        addresses = u.addresses
+        assert isinstance(addresses, ReadOnlyList)
+
+        eq_(addresses, list(addresses))
+        eq_(addresses, tuple(addresses))
+        eq_(list(addresses), addresses)
+        assert not addresses != list(addresses)
+        assert addresses != list(addresses)[1:]
+        eq_(sess.query(User).get(10).addresses, [])
+
+    def test_joinedload_present_during_load_event(self):
+        User, Address = self._mapping(readonly_collection=True,
+                                            lazy='joined')
+        canary = []
+
+        @sa.event.listens_for(User, "load")
+        def load(target, context):
+            canary.append('addresses' in target.__dict__)
+
+        sess = create_session()
+        u = sess.query(User).filter_by(id=8).one()
+        eq_(canary, [True])
+        self._assert_readonly(u, [2, 3, 4])
+
+    def test_stale_collection_raises(self):
+        User, Address = self._mapping(readonly_collection=True)
+        sess = create_session()
+        u = sess.query(User).get(8)
+        addresses = u.addresses
+        u.addresses = []
+        assert_raises_message(
+            sa.exc.InvalidRequestError,
+            "This read-only collection, loaded using the "
+            "readonly_collection relationship\(\) option",
+            addresses.append, Address()
+        )
+
+    def test_expire_reloads(self):
+        User, Address = self._mapping(readonly_collection=True)
+        sess = create_session()
+        u = sess.query(User).get(8)
+        eq_(len(u.addresses), 3)
+        sess.expire(u)
+        self._assert_readonly(u, [2, 3, 4])
+
+    def test_dynamic_not_allowed(self):
+        self._mapping(readonly_collection=True, lazy='dynamic')
+        assert_raises_message(
+            sa.exc.ArgumentError,
+            "requires a list-based collection",
+            sa.orm.configure_mappers
+        )
+
+    def test_set_collection_not_allowed(self):
+        self._mapping(readonly_collection=True, collection_class=set)
+        assert_raises_message(
+            sa.exc.ArgumentError,
+            "requires a list-based collection",
+            sa.orm.configure_mappers
+        )
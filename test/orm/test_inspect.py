@@ -379,6 +379,26 @@ class TestORMInspection(_fixtures.FixtureTest):
             hist.unchanged, []
         )
 
+    def test_instance_state_attr_has_changes(self):
+        User, Address = self.classes.User, self.classes.Address
+        u1 = User(name='ed')
+        insp = inspect(u1)
+        is_(insp.attrs.name.has_changes(), True)
+        is_(insp.attrs.addresses.has_changes(), False)
+
+        s = Session(testing.db)
+        s.add(u1)
+        s.flush()
+        is_(insp.attrs.name.has_changes(), False)
+
+        u1.name = 'ed'
+        is_(insp.attrs.name.has_changes(), False)
+        u1.name = 'jack'
+        is_(insp.attrs.name.has_changes(), True)
+
+        u1.addresses.append(Address())
+        is_(insp.attrs.addresses.has_changes(), True)
+
     def test_instance_state_ident_transient(self):
         User = self.classes.User
         u1 = User(name='ed')
@@ -1,5 +1,8 @@
+import marshal
 from . import _fixtures
-from sqlalchemy.orm import loading, Session, aliased
+from sqlalchemy import testing, event
+from sqlalchemy.orm import loading, Session, aliased, joinedload, \
+    sessionmaker, class_mapper, IdentityCache
 from sqlalchemy.testing.assertions import eq_
 from sqlalchemy.util import KeyedTuple
 
@@ -114,3 +117,221 @@ class MergeResultTest(_fixtures.FixtureTest):
         )
 
 
+class _ConnectionFixture(object):
+    def setup(self):
+        super(_ConnectionFixture, self).setup()
+        self.conn = testing.db.connect()
+
+    def teardown(self):
+        self.conn.close()
+        super(_ConnectionFixture, self).teardown()
+
+    def _record_cursor_statements(self):
+        statements = []
+
+        @event.listens_for(self.conn, "before_cursor_execute")
+        def go(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+        return statements
+
+
+class FrozenRowsTest(_ConnectionFixture, _fixtures.FixtureTest):
+    run_setup_mappers = 'once'
+    run_inserts = 'once'
+    run_deletes = None
+
+    @classmethod
+    def setup_mappers(cls):
+        cls._setup_stock_mapping()
+
+    def test_single_entity(self):
+        User = self.classes.User
+
+        s = Session(self.conn)
+        q = s.query(User).filter(User.id.in_([7, 8])).order_by(User.id)
+        frozen = marshal.loads(marshal.dumps(q.frozen_rows()))
+        s.close()
+
+        statements = self._record_cursor_statements()
+        eq_(
+            [(u.id, u.name) for u in q.thaw_rows(frozen)],
+            [(7, 'jack'), (8, 'ed')]
+        )
+        eq_(statements, [])
+        u = s.query(User).get(7)
+        assert u in s
+        eq_(u.name, 'jack')
+
+    def test_entity_col_mix(self):
+        User = self.classes.User
+
+        s = Session(self.conn)
+        q = s.query(User, User.name).filter(User.id == 7)
+        frozen = q.frozen_rows()
+        s.close()
+
+        it = list(q.thaw_rows(frozen))
+        eq_([(x.id, y) for x, y in it], [(7, 'jack')])
+        eq_(it[0].keys(), ['User', 'name'])
+
+    def test_eager_load(self):
+        User = self.classes.User
+
+        s = Session(self.conn)
+        q = s.query(User).options(joinedload(User.addresses)).\
+                    filter(User.id == 8)
+        frozen = q.frozen_rows()
+        s.close()
+
+        statements = self._record_cursor_statements()
+        u = q.thaw_rows(frozen).next()
+        eq_(len(u.addresses), 3)
+        eq_(statements, [])
+
+    def test_no_connection(self):
+        User = self.classes.User
+
+        s = Session(self.conn)
+        q = s.query(User).filter(User.id == 7)
+        frozen = q.frozen_rows()
+        s.close()
+
+        s = Session(testing.db)
+        q = s.query(User).filter(User.id == 7)
+        eq_([u.name for u in q.thaw_rows(frozen)], ['jack'])
+        assert not s.transaction._connections
+
+
+class IdentityCacheTest(_ConnectionFixture, _fixtures.FixtureTest):
+    run_setup_mappers = 'once'
+
+    @classmethod
+    def setup_mappers(cls):
+        cls._setup_stock_mapping()
+
+    def _fixture(self):
+        User, Address = self.classes.User, self.classes.Address
+
+        cache = IdentityCache()
+        cache.add(User, ttl=60)
+        return cache, sessionmaker(bind=self.conn, identity_cache=cache)
+
+    def test_get(self):
+        User = self.classes.User
+        cache, Sess = self._fixture()
+
+        eq_(Sess().query(User).get(7).name, 'jack')
+
+        statements = self._record_cursor_statements()
+        s = Sess()
+        u = s.query(User).get(7)
+        assert u in s
+        eq_(u.name, 'jack')
+        assert s.query(User).get(11) is None
+        eq_(len(statements), 1)
+
+    def test_lazyload_many_to_one(self):
+        User, Address = self.classes.User, self.classes.Address
+        cache, Sess = self._fixture()
+
+        eq_(Sess().query(Address).get(1).user.name, 'jack')
+
+        s = Sess()
+        a1 = s.query(Address).get(1)
+        statements = self._record_cursor_statements()
+        eq_(a1.user.name, 'jack')
+        eq_(statements, [])
+
+    def test_uncached_mapper(self):
+        Address = self.classes.Address
+        cache, Sess = self._fixture()
+
+        Sess().query(Address).get(1)
+        statements = self._record_cursor_statements()
+        Sess().query(Address).get(1)
+        eq_(len(statements), 1)
+
+    def test_options_not_cached(self):
+        User = self.classes.User
+        cache, Sess = self._fixture()
+
+        Sess().query(User).get(7)
+        statements = self._record_cursor_statements()
+        u = Sess().query(User).options(joinedload(User.addresses)).get(7)
+        eq_(len(statements), 1)
+        eq_(len(u.addresses), 1)
+
+    def test_ttl(self):
+        User = self.classes.User
+        cache, Sess = self._fixture()
+
+        Sess().query(User).get(7)
+        key = (User, (7, ))
+        timestamp, frozen = cache.backend.get(key)
+        cache.backend.set(key, (timestamp - 61, frozen))
+
+        statements = self._record_cursor_statements()
+        Sess().query(User).get(7)
+        eq_(len(statements), 1)
+
+    def test_ttl_expired_removed(self):
+        User = self.classes.User
+        cache, Sess = self._fixture()
+
+        Sess().query(User).get(7)
+        key = (User, (7, ))
+        timestamp, frozen = cache.backend.get(key)
+        cache.backend.set(key, (timestamp - 61, frozen))
+
+        assert cache.get(class_mapper(User), (7, )) is None
+        assert cache.backend.get(key) is None
+
+    def test_miss_executes_once(self):
+        User = self.classes.User
+        cache, Sess = self._fixture()
+
+        statements = self._record_cursor_statements()
+        s = Sess()
+        u = s.query(User).get(7)
+        assert u in s
+        eq_(u.name, 'jack')
+        eq_(len(statements), 1)
+        assert cache.get(class_mapper(User), (7, )) is not None
+
+    def test_invalidate_on_commit(self):
+        User = self.classes.User
+        cache, Sess = self._fixture()
+
+        frozen = Sess().query(User).filter(User.id == 7).frozen_rows()
+
+        s = Sess()
+        s.query(User).get(7).name = 'jackjack'
+        s.flush()
+
+        # as stored by another Session between the flush
+        # and the commit
+        cache.set(class_mapper(User), (7, ), frozen)
+        cache.set(class_mapper(User), (8, ), frozen)
+        s.commit()
+        assert cache.get(class_mapper(User), (7, )) is None
+        assert cache.get(class_mapper(User), (8, )) is not None
+
+    def test_invalidate_on_flush(self):
+        User = self.classes.User
+        cache, Sess = self._fixture()
+
+        s = Sess()
+        s.query(User).get(8)
+        s.query(User).get(7).name = 'jackjack'
+        s.flush()
+        assert cache.get(class_mapper(User), (7, )) is None
+        assert cache.get(class_mapper(User), (8, )) is not None
+
+        # not stored while the transaction has flushed changes
+        s.expunge_all()
+        eq_(s.query(User).get(7).name, 'jackjack')
+        assert cache.get(class_mapper(User), (7, )) is None
+
+        s.delete(s.query(User).get(8))
+        s.flush()
+        assert cache.get(class_mapper(User), (8, )) is None
@@ -2323,6 +2323,18 @@ class ExecutionOptionsTest(QueryTest):
         q1 = sess.query(User).execution_options(**execution_options)
         q1.all()
 
+    def test_cache_key_on_statement(self):
+        User = self.classes.User
+        from sqlalchemy.engine import LRUResultCache
+
+        cache = LRUResultCache()
+        sess = create_session(bind=testing.db, autocommit=False)
+        q1 = sess.query(User.id).filter(User.id == 7).\
+                    execution_options(result_cache=cache,
+                                        cache_key='users')
+        eq_(q1.all(), [(7, )])
+        eq_(cache.get('users')[1], [(7, )])
+
 
 class OptionsTest(QueryTest):
     """Test the _process_paths() method of PropertyOption."""
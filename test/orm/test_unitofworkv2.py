@@ -4,7 +4,7 @@ from sqlalchemy.testing import engines
 from sqlalchemy.testing.schema import Table, Column
 from test.orm import _fixtures
 from sqlalchemy.testing import fixtures
-from sqlalchemy import Integer, String, ForeignKey, func
+from sqlalchemy import Integer, String, ForeignKey, func, event
 from sqlalchemy.orm import mapper, relationship, backref, \
                             create_session, unitofwork, attributes,\
                             Session, class_mapper, sync, exc as orm_exc
@@ -1323,6 +1323,80 @@ class BatchInsertsTest(fixtures.MappedTest, testing.AssertsExecutionResults):
             ),
         )
 
+
+class ModifiedColumnsTest(fixtures.MappedTest):
+    """test that UPDATE only examines columns of modified attributes."""
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table('t', metadata,
+            Column('id', Integer, primary_key=True),
+            Column('version', Integer, nullable=False),
+            *[Column('c%d' % i, String(50)) for i in range(20)]
+        )
+
+    def _fixture(self, versioned=False):
+        t = self.tables.t
+
+        class T(fixtures.ComparableEntity):
+            pass
+        if versioned:
+            mapper(T, t, version_id_col=t.c.version)
+        else:
+            mapper(T, t)
+
+        sess = Session()
+        t1 = T(id=1, version=1,
+                    **dict(('c%d' % i, 'd%d' % i) for i in range(20)))
+        sess.add(t1)
+        sess.flush()
+        return sess, t1
+
+    def test_modified_cols(self):
+        from sqlalchemy.orm import persistence
+        t = self.tables.t
+        sess, t1 = self._fixture()
+
+        t1.c5 = 'new data'
+        t1.c7
+        eq_(
+            set(persistence._modified_cols(
+                    class_mapper(t1.__class__), t,
+                    attributes.instance_state(t1))),
+            set([t.c.id, t.c.c5])
+        )
+
+        self.assert_sql_execution(
+            testing.db,
+            sess.flush,
+            CompiledSQL(
+                "UPDATE t SET c5=:c5 WHERE t.id = :t_id",
+                {'c5': 'new data', 't_id': 1}
+            ),
+        )
+
+    def test_unchanged_value(self):
+        sess, t1 = self._fixture()
+
+        t1.c5 = 'd5'
+        self.assert_sql_count(testing.db, sess.flush, 0)
+
+    def test_versioned(self):
+        sess, t1 = self._fixture(versioned=True)
+
+        t1.c5 = 'new data'
+        self.assert_sql_execution(
+            testing.db,
+            sess.flush,
+            CompiledSQL(
+                "UPDATE t SET version=:version, c5=:c5 "
+                "WHERE t.id = :t_id AND t.version = :t_version",
+                {'c5': 'new data', 't_id': 1, 'version': 2,
+                    't_version': 1}
+            ),
+        )
+
+
 class LoadersUsingCommittedTest(UOWTest):
         """Test that events which occur within a flush()
         get the same attribute loading behavior as on the outside
@@ -1446,3 +1520,85 @@ class LoadersUsingCommittedTest(UOWTest):
                 sess.flush()
             except AvoidReferencialError:
                 pass
+
+
+class FlushProfileTest(UOWTest):
+    def _profile_fixture(self, sess):
+        profiles = []
+
+        def before_flush(session, flush_context, instances):
+            flush_context.enable_profile()
+
+        def after_flush_postexec(session, flush_context):
+            profiles.append(flush_context.profile)
+
+        event.listen(sess, 'before_flush', before_flush)
+        event.listen(sess, 'after_flush_postexec', after_flush_postexec)
+        return profiles
+
+    def test_not_enabled(self):
+        users, User = self.tables.users, self.classes.User
+
+        mapper(User, users)
+        sess = create_session()
+        profiles = []
+
+        def after_flush(session, flush_context):
+            profiles.append(flush_context.profile)
+
+        event.listen(sess, 'after_flush', after_flush)
+        sess.add(User(name='u1'))
+        sess.flush()
+        eq_(profiles, [None])
+
+    def test_profile(self):
+        users, Address, addresses, User = (self.tables.users,
+                                self.classes.Address,
+                                self.tables.addresses,
+                                self.classes.User)
+
+        mapper(User, users, properties={
+            'addresses':relationship(Address),
+        })
+        mapper(Address, addresses)
+        sess = create_session()
+        profiles = self._profile_fixture(sess)
+
+        u1 = User(name='u1', addresses=[
+                        Address(id=1, email_address='a1'),
+                        Address(id=2, email_address='a2')])
+        u2 = User(name='u2')
+        sess.add_all([u1, u2])
+        sess.flush()
+
+        sess.delete(u2)
+        sess.flush()
+
+        p1, p2 = profiles
+        eq_(
+            set(p1.timings),
+            set(['register', 'generate_actions', 'sort',
+                'execute', 'postfetch', 'finalize'])
+        )
+        eq_(p1.states, {class_mapper(User): 2, class_mapper(Address): 2})
+        eq_(p1.statements, {('users', False): 2, ('addresses', True): 1})
+
+        eq_(p2.states, {class_mapper(User): 1})
+        eq_(p2.statements, {('users', False): 1})
+
+    def test_profile_cycles(self):
+        Node, nodes = self.classes.Node, self.tables.nodes
+
+        mapper(Node, nodes, properties={
+            'children':relationship(Node)
+        })
+        sess = create_session()
+        profiles = self._profile_fixture(sess)
+
+        n1 = Node(data='n1', children=[Node(data='n2'), Node(data='n3')])
+        sess.add(n1)
+        sess.flush()
+
+        eq_(profiles[0].states, {class_mapper(Node): 3})
+        eq_(profiles[0].statements, {('nodes', False): 3})
+        assert 'sort' in profiles[0].timings
@@ -185,6 +185,34 @@ class AliasedClassTest(fixtures.TestBase):
         assert_table(Point.left_of(p2), table)
         assert_table(alias.left_of(p2), alias_table)
 
+    def test_column_adapter_shared(self):
+        class Point(object):
+            pass
+        table = self.point_map(Point)
+        alias = aliased(Point)
+        sess = create_session()
+
+        q1 = sess.query(alias)
+        q2 = sess.query(alias).filter(alias.x == 5)
+        adapter = inspect(alias)._column_adapter
+        is_(q1._mapper_adapter_map[alias][1], adapter)
+        is_(q2._mapper_adapter_map[alias][1], adapter)
+
+        is_(adapter.columns[table.c.x],
+                inspect(alias).selectable.c.x)
+        assert inspect(aliased(Point))._column_adapter is not adapter
+
+    def test_eager_adapter_per_mapper(self):
+        class Point(object):
+            pass
+        self.point_map(Point)
+        insp = inspect(aliased(Point))
+        m = insp.mapper
+        adapter = insp._eager_adapter(m)
+        is_(insp._eager_adapter(m), adapter)
+        is_(adapter.aliased_class, insp.entity)
+        eq_(adapter.adapt_required, True)
+
 class IdentityKeyTest(_fixtures.FixtureTest):
     run_inserts = None
 
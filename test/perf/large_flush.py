@@ -4,6 +4,7 @@ from sqlalchemy import Column, ForeignKey
 from sqlalchemy import Integer, String
 from sqlalchemy.orm import mapper
 from sqlalchemy.testing import profiling
+import time
 
 class Object(object):
     pass
@@ -81,4 +82,50 @@ def generate_error():
     SA_Session.add(q)
     SA_Session.commit() #here the error pops out
 
-generate_error()
\ No newline at end of file
+generate_error()
+
+
+# flush of a self-referential tree, which is sorted per-row; the time
+# taken per node should stay roughly flat as the number of nodes grows,
+# for a chain (fanout of one) as well as for a broader tree.
+
+class Node(object):
+    pass
+
+tree_engine = create_engine('sqlite:///:memory:')
+
+tree_metadata = MetaData()
+
+node_table = sa.Table('Node',
+                      tree_metadata,
+                      Column('NodeID', Integer, primary_key=True),
+                      Column('ParentID', Integer, ForeignKey('Node.NodeID')))
+
+mapper(Node, node_table, properties={
+    'children': orm.relation(Node,
+                        backref=orm.backref('parent',
+                                    remote_side=node_table.c.NodeID))
+})
+
+tree_metadata.create_all(tree_engine)
+
+def flush_tree(size, fanout):
+    sess = orm.Session(bind=tree_engine)
+    root = Node()
+    nodes = [root]
+    for i in xrange(size - 1):
+        node = Node()
+        node.parent = nodes[i // fanout]
+        nodes.append(node)
+    sess.add(root)
+
+    now = time.time()
+    sess.flush()
+    total = time.time() - now
+    print "fanout %d, %6d nodes: %.2f sec, %.1f usec per node" % (
+                fanout, size, total, total / size * 1000000)
+    sess.rollback()
+
+for fanout in (1, 4):
+    for size in (1000, 5000, 20000, 50000):
+        flush_tree(size, fanout)
@@ -1175,6 +1175,53 @@ class SelectTest(fixtures.TestBase, AssertsCompiledSQL):
             "SELECT col1, col2 FROM tablename"
         )
 
+    def test_text_compiled_form_shared(self):
+        dialect = default.DefaultDialect()
+        stmt = "select * from foo where lala=:bar and hoho=:whee"
+        t1, t2 = text(stmt), text(stmt)
+        c1 = t1.compile(dialect=dialect)
+        c2 = t2.compile(dialect=dialect)
+        is_(c2.string, c1.string)
+        is_(c2.binds, c1.binds)
+        is_(c1.statement, t1)
+        is_(c2.statement, t2)
+        eq_(
+            c2.construct_params({'bar': 4, 'whee': 7}),
+            {'bar': 4, 'whee': 7}
+        )
+        assert text(stmt).compile(dialect=default.DefaultDialect()).\
+                    string is not c1.string
+
+    def test_text_compiled_form_not_shared(self):
+        dialect = default.DefaultDialect()
+        stmt = "select * from foo where lala=:bar"
+        c1 = text(stmt).compile(dialect=dialect)
+
+        for t in (
+            text(stmt, bindparams=[bindparam('bar', 4)]),
+            text(stmt, typemap={'lala': Integer}),
+            text(stmt).execution_options(autocommit=True),
+            text(stmt).params(bar=5),
+        ):
+            c2 = t.compile(dialect=dialect)
+            assert c2.string is not c1.string
+            assert t.compile(dialect=dialect).string is not c2.string
+
+        eq_(
+            text(stmt).params(bar=5).compile(dialect=dialect).params,
+            {'bar': 5}
+        )
+
+    def test_text_compiled_form_compile_kwargs(self):
+        dialect = default.DefaultDialect()
+        stmt = "select * from foo where lala=:bar"
+        text(stmt).compile(dialect=dialect)
+
+        c1 = text(stmt).compile(dialect=dialect,
+                                compile_kwargs={"literal_binds": True})
+        c2 = text(stmt).compile(dialect=dialect)
+        assert c1.string is not c2.string
+
     def test_binds_in_text(self):
         self.assert_compile(
             text("select * from foo where lala=:bar and hoho=:whee",
@@ -1928,6 +1975,38 @@ class SelectTest(fixtures.TestBase, AssertsCompiledSQL):
             {'x': 12}
         )
 
+    def test_bind_expanding(self):
+        stmt = select([table1.c.myid]).where(
+                    table1.c.myid.in_(bindparam('q', expanding=True)))
+        self.assert_compile(
+            stmt,
+            "SELECT mytable.myid FROM mytable "
+            "WHERE mytable.myid IN ([EXPANDING_q])"
+        )
+        c = stmt.compile(dialect=default.DefaultDialect(paramstyle='qmark'))
+        eq_(c.positiontup, ['q'])
+        eq_(c._expanding_binds, ('q', ))
+
+    def test_bind_expanding_literal(self):
+        expr = table1.c.name.in_(bindparam('q', ['a', 'b'], expanding=True))
+        dialect = default.DefaultDialect()
+        compiler = dialect.statement_compiler(dialect, None)
+        eq_(
+            compiler.process(expr, literal_binds=True),
+            "mytable.name IN ('a', 'b')"
+        )
+
+    def test_bind_expanding_numeric(self):
+        stmt = select([table1.c.myid]).where(
+                    table1.c.myid.in_(bindparam('q', expanding=True)))
+        assert_raises_message(
+            exc.CompileError,
+            "Expanding bind parameters are not supported with "
+            "the 'numeric' paramstyle.",
+            stmt.compile,
+            dialect=default.DefaultDialect(paramstyle='numeric')
+        )
+
     def test_bind_params_missing(self):
         assert_raises_message(exc.InvalidRequestError,
             r"A value is required for bind parameter 'x'",
@@ -2408,6 +2487,63 @@ class SelectTest(fixtures.TestBase, AssertsCompiledSQL):
             and_, ("a",), ("b",)
         )
 
+    def test_nested_same_operator_chains(self):
+        a, b, c, d = column('a'), column('b'), column('c'), column('d')
+        self.assert_compile(
+            or_(or_(a == 1, or_(b == 2, c == 3)), d == 4),
+            "a = :a_1 OR b = :b_1 OR c = :c_1 OR d = :d_1"
+        )
+        self.assert_compile(
+            and_(or_(a == 1, b == 2), and_(c == 3, d == 4)),
+            "(a = :a_1 OR b = :b_1) AND c = :c_1 AND d = :d_1"
+        )
+        self.assert_compile(
+            a + (b + c) + d * (a * b) - (c - d),
+            "(a + b + c + d * a * b) - (c - d)"
+        )
+
+    def test_deeply_nested_chains(self):
+        a = column('a')
+        crit = a == 0
+        expr = a
+        for i in xrange(1, 2000):
+            crit = or_(crit, a == i)
+            expr = expr + a
+        self.assert_compile(
+            select([a]).where(crit),
+            "SELECT a WHERE a = ? OR " + " OR ".join(["a = ?"] * 1998) +
+            " OR a = ?",
+            dialect=sqlite.dialect()
+        )
+        self.assert_compile(expr, " + ".join(["a"] * 2000))
+
+    def test_deeply_nested_mixed_chains(self):
+        a, b = column('a'), column('b')
+        crit = a == 0
+        for i in xrange(1, 1500):
+            if i % 2:
+                crit = or_(crit, a == i)
+            else:
+                crit = and_(crit, not_(b == i))
+        expected = "a = ?"
+        for i in xrange(1, 1500):
+            if i % 2:
+                expected = "%s OR a = ?" % expected
+            else:
+                expected = "(%s) AND b != ?" % expected
+        self.assert_compile(
+            select([a]).where(crit),
+            "SELECT a WHERE " + expected,
+            checkpositional=tuple(range(1500)),
+            dialect=sqlite.dialect()
+        )
+
+        expr, expected = a, "a"
+        for i in xrange(1, 1500):
+            expr = b - expr * a
+            expected = "b - (%s) * a" % expected
+        self.assert_compile(expr, expected.replace("(a)", "a"))
+
 
 class KwargPropagationTest(fixtures.TestBase):
 
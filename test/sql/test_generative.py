@@ -5,7 +5,7 @@ from sqlalchemy.testing import fixtures, AssertsExecutionResults, \
     AssertsCompiledSQL
 from sqlalchemy import testing
 from sqlalchemy.sql.visitors import ClauseVisitor, CloningVisitor, \
-    cloned_traverse, ReplacingCloningVisitor
+    cloned_traverse, ReplacingCloningVisitor, replacement_traverse
 from sqlalchemy import exc
 from sqlalchemy.sql import util as sql_util
 from sqlalchemy.testing import eq_, is_, assert_raises, assert_raises_message
@@ -265,6 +265,105 @@ class BinaryEndpointTraversalTest(fixtures.TestBase):
             ]
         )
 
+class NestedChainTraversalTest(fixtures.TestBase, AssertsCompiledSQL):
+    """test traversal of nested chains of lists and binaries deeper
+    than the recursion limit."""
+
+    __dialect__ = 'default'
+
+    depth = 2000
+
+    def _or_chain(self, a):
+        expr = a == 0
+        for i in xrange(1, self.depth):
+            expr = or_(expr, a == i)
+        return expr
+
+    def test_cloned_traverse(self):
+        a = column('a')
+        expr = self._or_chain(a)
+        binds = []
+        cloned = cloned_traverse(expr, {},
+                            {'bindparam': lambda b: binds.append(b.value)})
+        assert cloned is not expr
+        eq_(binds, range(self.depth))
+        eq_(str(cloned), str(expr))
+
+    def test_cloned_traverse_order(self):
+        a, b = column('a'), column('b')
+        expr = or_(or_(a == 1, and_(a == 2, b == 3)), b == 4) + \
+                    (b + a)
+        visited = []
+        cloned_traverse(expr, {},
+                    {'bindparam': lambda b: visited.append(b.value),
+                    'column': lambda c: visited.append(c.name)})
+        eq_(visited, ['a', 1, 2, 'b', 3, 4])
+
+    def test_replacement_traverse(self):
+        t = table('t', column('a'))
+        expr = self._or_chain(t.c.a)
+        adapted = sql_util.ClauseAdapter(t.alias('ta')).traverse(expr)
+        eq_(str(adapted), str(expr).replace('t.a', 'ta.a'))
+
+    def test_replacement_traverse_order(self):
+        a, b = column('a'), column('b')
+        expr = or_(b, or_(a == 1, and_(a == 2, b == 3)), b == 4, a) + \
+                    (b + a)
+        replaced = []
+
+        def replace(elem):
+            if elem.__visit_name__ == 'column':
+                replaced.append(elem.name)
+            elif elem.__visit_name__ == 'bindparam':
+                replaced.append(elem.value)
+        replacement_traverse(expr, {}, replace)
+        eq_(replaced, ['b', 'a', 1, 'a', 2, 'b', 3, 'b', 4, 'a', 'b', 'a'])
+
+    def test_mixed_chains(self):
+        t1, t2 = table('t1', column('a')), table('t2', column('b'))
+        expr = t1.c.a == 0
+        for i in xrange(1, self.depth):
+            if i % 2:
+                expr = or_(expr, t1.c.a == i)
+            else:
+                expr = and_(expr, not_(t1.c.a == i))
+        expr = and_(expr, t2.c.b == 5)
+        eq_(set(_from_objects(expr)), set([t1, t2]))
+
+        adapted = sql_util.ClauseAdapter(t1.alias('ta')).traverse(expr)
+        eq_(str(adapted), str(expr).replace('t1.a', 'ta.a'))
+
+    def test_from_objects(self):
+        t1, t2 = table('t1', column('a')), table('t2', column('b'))
+        expr = or_(self._or_chain(t1.c.a), t2.c.b == 5)
+        eq_(expr._from_objects[0], t1)
+        eq_(expr._from_objects[-1], t2)
+        eq_(set(_from_objects(expr)), set([t1, t2]))
+
+    def test_from_objects_append(self):
+        t1, t2 = table('t1', column('a')), table('t2', column('b'))
+        expr = or_(t1.c.a == 1, t1.c.a == 2)
+        eq_(expr._from_objects, [t1, t1])
+        assert not expr._chained
+
+        expr.append(or_(t1.c.a == 3, t2.c.b == 4))
+        assert expr._chained
+        eq_(expr._from_objects, [t1, t1, t1, t2])
+
+    def test_annotate(self):
+        t = table('t', column('a'))
+        expr = self._or_chain(t.c.a)
+        annotated = sql_util._deep_annotate(expr, {'foo': 'bar'})
+        eq_(annotated._annotations, {'foo': 'bar'})
+        eq_(annotated.clauses[-1].left._annotations, {'foo': 'bar'})
+        eq_(str(annotated), str(expr))
+
+        deannotated = sql_util._deep_deannotate(annotated)
+        eq_(deannotated._annotations, {})
+        eq_(deannotated.clauses[-1].left._annotations, {})
+        eq_(str(deannotated), str(expr))
+
+
 class ClauseTest(fixtures.TestBase, AssertsCompiledSQL):
     """test copy-in-place behavior of various ClauseElements."""
 
@@ -5,7 +5,7 @@ from sqlalchemy import Column, Integer, MetaData, String, Table,\
 from sqlalchemy.dialects import mysql, postgresql
 from sqlalchemy.engine import default
 from sqlalchemy.testing import AssertsCompiledSQL,\
-    assert_raises_message, fixtures
+    assert_raises_message, fixtures, eq_
 
 
 class _InsertTestBase(object):
@@ -310,3 +310,52 @@ class MultirowTest(_InsertTestBase, fixtures.TablesTest, AssertsCompiledSQL):
             '(%(id_1)s, %(data_1)s, %(foo_0)s), '
             '(%(id_2)s, %(data_2)s, %(foo_2)s)',
             checkparams=checkparams, dialect=postgresql.dialect())
+
+
+class InsertValuesClauseTest(_InsertTestBase, fixtures.TablesTest):
+
+    def _dialect(self, paramstyle='named'):
+        dialect = default.DefaultDialect(paramstyle=paramstyle)
+        dialect.supports_multivalues_insert = True
+        return dialect
+
+    def test_named(self):
+        table1 = self.tables.mytable
+        c = table1.insert().compile(dialect=self._dialect())
+        eq_(c._insert_values_clause, "(:myid, :name, :description)")
+        eq_(c._insert_values_names, ('myid', 'name', 'description'))
+
+    def test_established_on_use(self):
+        table1 = self.tables.mytable
+        c = table1.insert().compile(dialect=self._dialect())
+        assert '_insert_values' not in c.__dict__
+        eq_(c._insert_values_names, ('myid', 'name', 'description'))
+        assert '_insert_values' in c.__dict__
+
+    def test_positional(self):
+        table1 = self.tables.mytable
+        c = table1.insert().compile(dialect=self._dialect('format'))
+        eq_(c._insert_values_clause, "(%s, %s, %s)")
+        eq_(c._insert_values_names, ('myid', 'name', 'description'))
+
+    def test_not_supported(self):
+        table1 = self.tables.mytable
+        c = table1.insert().compile(dialect=default.DefaultDialect())
+        eq_(c._insert_values_clause, None)
+
+    def test_numeric(self):
+        table1 = self.tables.mytable
+        c = table1.insert().compile(dialect=self._dialect('numeric'))
+        eq_(c._insert_values_clause, None)
+
+    def test_sql_expression(self):
+        table1 = self.tables.mytable
+        c = table1.insert().values(name=func.lower(bindparam('n'))).\
+                        compile(dialect=self._dialect())
+        eq_(c._insert_values_clause, None)
+
+    def test_returning(self):
+        table1 = self.tables.mytable
+        c = table1.insert().returning(table1.c.myid).\
+                        compile(dialect=postgresql.dialect())
+        eq_(c._insert_values_clause, None)
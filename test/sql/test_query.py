@@ -490,6 +490,20 @@ class QueryTest(fixtures.TestBase):
             eq_(select([users.c.user_id]).where(users.c.user_name.like('TWO')).execute().fetchall(), [])
 
 
+    def test_text_repeated_execute(self):
+        users.insert().execute(
+            {'user_id': 7, 'user_name': 'jack'},
+            {'user_id': 8, 'user_name': 'ed'},
+        )
+        conn = testing.db.connect()
+        for user_id, name in ((7, 'jack'), (8, 'ed'), (9, None)):
+            eq_(
+                conn.scalar(text("select user_name from query_users "
+                                "where user_id=:id"), id=user_id),
+                name
+            )
+        conn.close()
+
     def test_compiled_execute(self):
         users.insert().execute(user_id = 7, user_name = 'jack')
         s = select([users], users.c.user_id==bindparam('id')).compile()
@@ -801,6 +815,55 @@ class QueryTest(fixtures.TestBase):
         eq_(r['query_users.user_name'], "john")
         eq_(r.keys(), ["user_id", "user_name"])
 
+    def test_result_metadata_cached_on_compiled(self):
+        users.insert().execute(user_id=1, user_name='john')
+        compiled = users.select().compile(bind=testing.db)
+        r1 = testing.db.execute(compiled)
+        eq_(r1.fetchall(), [(1, 'john')])
+
+        key, metadata = compiled._cached_metadata
+        assert metadata is r1._metadata
+
+        r2 = testing.db.execute(compiled)
+        assert r2._metadata is metadata
+        row = r2.first()
+        eq_(row[users.c.user_name], 'john')
+        eq_(row['user_id'], 1)
+
+    def test_result_metadata_cache_keyed_on_description(self):
+        users.insert().execute(user_id=1, user_name='john')
+        compiled = text("select user_id, user_name from query_users",
+                    typemap={'user_name': String}).compile(bind=testing.db)
+        r1 = testing.db.execute(compiled)
+        r1.fetchall()
+        key, metadata = compiled._cached_metadata
+        compiled._cached_metadata = (key[:-1] + ("nonmatching", ), metadata)
+
+        # cached entry doesn't match, metadata is constructed again
+        r2 = testing.db.execute(compiled)
+        eq_(r2.fetchall(), [(1, 'john')])
+        assert r2._metadata is not metadata
+        eq_(compiled._cached_metadata, (key, r2._metadata))
+
+    def test_buffered_column_result_copies_cached_metadata(self):
+        users.insert().execute(user_id=1, user_name='john')
+        compiled = users.select().compile(bind=testing.db)
+        metadata = testing.db.execute(compiled)._metadata
+        processors, keymap = metadata._processors, metadata._keymap
+
+        conn = testing.db.connect()
+        ctx = conn.dialect.execution_ctx_cls._init_compiled(
+                    conn.dialect, conn, conn.connection, compiled, [])
+        ctx.pre_exec()
+        ctx.cursor.execute(ctx.statement, ctx.parameters[0])
+        r = _result.BufferedColumnResultProxy(ctx)
+        eq_(r.fetchall(), [(1, 'john')])
+        conn.close()
+
+        assert r._metadata is not metadata
+        assert metadata._processors is processors
+        assert metadata._keymap is keymap
+
     def test_column_accessor_labels_w_dots(self):
         users.insert().execute(
             dict(user_id=1, user_name='john'),
@@ -1295,6 +1358,107 @@ class RequiredBindTest(fixtures.TablesTest):
         is_(bindparam('foo', callable_=c).required, False)
         is_(bindparam('foo', callable_=c, required=False).required, False)
 
+class ExpandingBoundInTest(fixtures.TablesTest):
+    run_inserts = 'once'
+    run_deletes = None
+
+    @classmethod
+    def define_tables(cls, metadata):
+        class Prefixed(TypeDecorator):
+            impl = String
+
+            def process_bind_param(self, value, dialect):
+                return "p_" + value
+
+        Table('expanding_data', metadata,
+                Column('id', Integer, primary_key=True),
+                Column('data', String(50)),
+                Column('prefixed', Prefixed(50))
+            )
+
+    @classmethod
+    def insert_data(cls):
+        cls.tables.expanding_data.insert().execute(
+            {'id': 1, 'data': 'a', 'prefixed': 'a'},
+            {'id': 2, 'data': 'b', 'prefixed': 'b'},
+            {'id': 3, 'data': 'c', 'prefixed': 'c'},
+            {'id': 4, 'data': None, 'prefixed': 'd'},
+        )
+
+    def _ids(self, stmt, **params):
+        return [row[0] for row in testing.db.execute(stmt, **params)]
+
+    def test_expanding(self):
+        t = self.tables.expanding_data
+        stmt = select([t.c.id]).where(
+                    t.c.id.in_(bindparam('q', expanding=True))).\
+                    order_by(t.c.id)
+
+        eq_(self._ids(stmt, q=[1, 3]), [1, 3])
+        eq_(self._ids(stmt, q=[2]), [2])
+        eq_(self._ids(stmt, q=[4, 3, 2, 1]), [1, 2, 3, 4])
+
+    def test_expanding_with_other_binds(self):
+        t = self.tables.expanding_data
+        stmt = select([t.c.id]).where(
+                    t.c.id.in_(bindparam('q', expanding=True))).\
+                    where(t.c.id != bindparam('x')).\
+                    where(t.c.data.in_(bindparam('d', expanding=True))).\
+                    order_by(t.c.id)
+
+        eq_(self._ids(stmt, q=[1, 2, 3], x=2, d=['a', 'b', 'c']), [1, 3])
+        eq_(self._ids(stmt, q=[1, 2], x=3, d=['b']), [2])
+
+    def test_expanding_with_anon_binds(self):
+        t = self.tables.expanding_data
+        stmt = select([t.c.id]).where(
+                    t.c.id.in_(bindparam('id', expanding=True))).\
+                    where(t.c.id != 5).\
+                    where(t.c.id != bindparam('id__2')).\
+                    order_by(t.c.id)
+
+        eq_(self._ids(stmt, id=[1, 2, 3], id__2=3), [1, 2])
+        eq_(self._ids(stmt, id=[1, 2, 3, 4], id__2=4), [1, 2, 3])
+
+    def test_expanding_not_in(self):
+        t = self.tables.expanding_data
+        stmt = select([t.c.id]).where(
+                    ~t.c.data.in_(bindparam('q', expanding=True))).\
+                    order_by(t.c.id)
+
+        eq_(self._ids(stmt, q=['a', 'c']), [2])
+
+    def test_expanding_empty(self):
+        t = self.tables.expanding_data
+        stmt = select([t.c.id]).where(
+                    t.c.id.in_(bindparam('q', expanding=True)))
+
+        eq_(self._ids(stmt, q=[]), [])
+
+    def test_expanding_bind_processor(self):
+        t = self.tables.expanding_data
+        stmt = select([t.c.id]).where(
+                    t.c.prefixed.in_(bindparam('q', expanding=True))).\
+                    order_by(t.c.id)
+
+        eq_(self._ids(stmt, q=['b', 'd']), [2, 4])
+
+    def test_expanding_takes_column_type(self):
+        t = self.tables.expanding_data
+        expr = t.c.prefixed.in_(bindparam('q', expanding=True))
+        assert isinstance(expr.right.type, t.c.prefixed.type.__class__)
+
+    def test_expanding_executemany(self):
+        t = self.tables.expanding_data
+        stmt = select([t.c.id]).where(
+                    t.c.id.in_(bindparam('q', expanding=True)))
+
+        assert_raises_message(
+            exc.StatementError,
+            "'expanding' parameters can't be used with executemany",
+            testing.db.execute, stmt, [{'q': [1, 2]}, {'q': [3]}]
+        )
+
 class TableInsertTest(fixtures.TablesTest):
     """test for consistent insert behavior across dialects
     regarding the inline=True flag, lower-case 't' tables.
@@ -1466,6 +1630,124 @@ class TableInsertTest(fixtures.TablesTest):
             inserted_primary_key=[]
         )
 
+class MultivaluesExecutemanyTest(fixtures.TestBase):
+    __requires__ = 'multivalues_inserts',
+
+    def _fixture(self, **kw):
+        executed = []
+
+        class RecordingCursor(engines.DBAPIProxyCursor):
+            def execute(self, stmt, parameters=None, **kw):
+                executed.append(('execute', stmt))
+                return super(RecordingCursor, self).execute(
+                                        stmt, parameters, **kw)
+
+            def executemany(self, stmt, params, **kw):
+                executed.append(('executemany', stmt))
+                return super(RecordingCursor, self).executemany(
+                                        stmt, params, **kw)
+
+        eng = engines.proxying_engine(cursor_cls=RecordingCursor)
+        m = MetaData()
+        t = Table('mv_data', m,
+                Column('id', Integer, primary_key=True),
+                Column('data', String(30)),
+                Column('x', Integer, default=5),
+                **kw)
+        m.create_all(eng)
+        del executed[:]
+        return eng, t, executed
+
+    def _rows(self, num):
+        return [{'id': i, 'data': 'd%d' % i} for i in range(1, num + 1)]
+
+    def test_paged(self):
+        eng, t, executed = self._fixture()
+        conn = eng.connect().execution_options(multivalues_page_size=3)
+        r = conn.execute(t.insert(), self._rows(8))
+        eq_(r.rowcount, 8)
+        eq_([meth for meth, stmt in executed], ['execute'] * 3)
+        eq_(
+            conn.execute(t.select().order_by(t.c.id)).fetchall(),
+            [(i, 'd%d' % i, 5) for i in range(1, 9)]
+        )
+        conn.close()
+        eng.dispose()
+
+    def test_dialect_level_page_size(self):
+        eng, t, executed = self._fixture()
+        eng.dialect.multivalues_page_size = 5
+        conn = eng.connect()
+        conn.execute(t.insert(), self._rows(8))
+        eq_(len(executed), 2)
+
+        # execution option disables it again
+        del executed[:]
+        conn.execution_options(multivalues_page_size=None).execute(
+                        t.insert(), [{'id': 9, 'data': 'd9'},
+                                    {'id': 10, 'data': 'd10'}])
+        eq_([meth for meth, stmt in executed], ['executemany'])
+        eq_(conn.scalar(select([func.count(t.c.id)])), 10)
+        conn.close()
+        eng.dispose()
+
+    def test_not_used_for_single_row(self):
+        eng, t, executed = self._fixture()
+        conn = eng.connect().execution_options(multivalues_page_size=3)
+        conn.execute(t.insert(), {'id': 1, 'data': 'd1'})
+        eq_(executed, [('execute', unicode(t.insert().compile(eng)))])
+        conn.close()
+        eng.dispose()
+
+    def test_not_used_for_sql_expression(self):
+        eng, t, executed = self._fixture()
+        conn = eng.connect().execution_options(multivalues_page_size=3)
+        conn.execute(t.insert().values(x=literal_column('7') + 1),
+                        self._rows(4))
+        eq_([meth for meth, stmt in executed], ['executemany'])
+        eq_(conn.scalar(select([func.sum(t.c.x)])), 32)
+        conn.close()
+        eng.dispose()
+
+    def test_named_paramstyle(self):
+        eng, t, executed = self._fixture()
+        eng.dialect.paramstyle = 'named'
+        eng.dialect.positional = False
+        conn = eng.connect().execution_options(multivalues_page_size=4)
+        conn.execute(t.insert(), self._rows(6))
+        eq_(len(executed), 2)
+        assert ":data_m3" in executed[0][1]
+        eq_(
+            conn.execute(t.select().order_by(t.c.id)).fetchall(),
+            [(i, 'd%d' % i, 5) for i in range(1, 7)]
+        )
+        conn.close()
+        eng.dispose()
+
+    def test_invalid_page_size(self):
+        eng, t, executed = self._fixture()
+        conn = eng.connect()
+        for fn in (
+            conn.execution_options,
+            eng.execution_options,
+            t.insert().execution_options
+        ):
+            assert_raises_message(
+                exc.ArgumentError,
+                "'multivalues_page_size' execution option must be "
+                "a positive integer or None.",
+                fn, multivalues_page_size=0
+            )
+        assert_raises_message(
+            exc.ArgumentError,
+            "multivalues_page_size must be a positive integer or None.",
+            default.DefaultDialect, multivalues_page_size=0
+        )
+        eq_(executed, [])
+        conn.close()
+        eng.dispose()
+
+
 class PercentSchemaNamesTest(fixtures.TestBase):
     """tests using percent signs, spaces in table and column names.
 
@@ -596,3 +596,55 @@ class PreparerTest(fixtures.TestBase):
         a_eq(unformat('foo.`bar`'), ['foo', 'bar'])
         a_eq(unformat('`foo`.bar'), ['foo', 'bar'])
         a_eq(unformat('`foo`.`b``a``r`.`baz`'), ['foo', 'b`a`r', 'baz'])
+
+    def test_quote_memoized(self):
+        prep = compiler.IdentifierPreparer(None)
+        calls = []
+        quote_identifier = prep.quote_identifier
+
+        def counting_quote_identifier(value):
+            calls.append(value)
+            return quote_identifier(value)
+        prep.quote_identifier = counting_quote_identifier
+
+        for i in range(3):
+            self.assert_(prep.quote('Foo', None) == '"Foo"')
+            self.assert_(prep.quote('foo', True) == '"foo"')
+            self.assert_(prep.quote('foo', False) == 'foo')
+            self.assert_(prep.quote('foo', None) == 'foo')
+        self.assert_(calls == ['Foo', 'foo'])
+
+    def test_table_name_memoized(self):
+        from sqlalchemy.engine import default
+        dialect = default.DefaultDialect()
+        prep = dialect.identifier_preparer
+        t1 = Table('t1', MetaData(), Column('Col1', Integer), schema='Foo')
+        t2 = Table('t1', MetaData(), Column('Col1', Integer), schema='Foo',
+                    quote=True, quote_schema=False)
+
+        for i in range(2):
+            self.assert_(prep.format_table(t1) == '"Foo".t1')
+            self.assert_(prep.format_table(t2) == 'Foo."t1"')
+            self.assert_(
+                str(select([t1.c.Col1, t2.c.Col1]).
+                        compile(dialect=dialect)) ==
+                'SELECT "Foo".t1."Col1", Foo."t1"."Col1" \n'
+                'FROM "Foo".t1, Foo."t1"'
+            )
+        self.assert_(len(prep._table_names) == 2)
+        self.assert_(len(prep._qualified_names) == 2)
+
+    def test_memos_bounded(self):
+        class Preparer(compiler.IdentifierPreparer):
+            identifier_cache_size = 10
+        prep = Preparer(None)
+
+        for i in range(100):
+            self.assert_(prep.quote('foo%d' % i, True) == '"foo%d"' % i)
+            self.assert_(
+                prep._format_table_name('s%d' % i, True, 't', None) ==
+                '"s%d".t' % i)
+        self.assert_(len(prep._forced_strings) <= 15)
+        self.assert_(len(prep._table_names) <= 15)
+        self.assert_(prep.quote('foo99', True) == '"foo99"')
+        self.assert_(prep.quote('foo0', True) == '"foo0"')